@@ -0,0 +1,221 @@
+"""
+Presupuesto de arranque: cuánto tarda en importarse cada punto de entrada.
+
+Uso:
+    python -m benchmarks.arranque                     # mide y compara con los presupuestos
+    python -m benchmarks.arranque --escala 2          # presupuestos x2 (máquinas lentas)
+    python -m benchmarks.arranque --salida a.json
+
+Cada escenario corre en un intérprete nuevo con `python -X importtime`,
+`--repeticiones` veces, y se toma la mediana del tiempo del código del
+escenario (sin contar el arranque del propio intérprete).
+
+Además se verifica que los módulos pesados (numpy, matplotlib,
+customtkinter) no se hayan ejecutado: importar el calculador, el analizador
+o la CLI solo los registra como importaciones diferidas. Lo mismo con los
+módulos propios que solo usan algunos comandos (Monte Carlo, multi-GPU,
+barridos), que el analizador y la CLI importan recién al usarlos. Los presupuestos
+tienen margen para máquinas lentas; este control es el que detecta que un
+import pesado volvió a cargarse al inicio. Termina con código 1 si algún
+escenario excede su presupuesto o carga un módulo prohibido.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PESADOS = ("numpy", "matplotlib", "customtkinter")
+# Módulos del paquete que solo cargan los comandos que los usan
+OPCIONALES = (
+    "src.domain.entidades_barrido",
+    "src.domain.entidades_incertidumbre",
+    "src.domain.entidades_multi_gpu",
+    "src.infrastructure.barrido_paralelo",
+    "src.infrastructure.modelo_multi_gpu",
+    "src.infrastructure.simulador_monte_carlo",
+)
+
+
+class Escenario:
+    # Código que se ejecuta en un intérprete limpio, con su presupuesto en ms
+    
+    def __init__(
+        self,
+        nombre: str,
+        codigo: str,
+        presupuesto_ms: float,
+        prohibidos: tuple = PESADOS,
+        requiere: tuple = ()
+    ):
+        self.nombre = nombre
+        self.codigo = codigo
+        self.presupuesto_ms = presupuesto_ms
+        self.prohibidos = prohibidos
+        self.requiere = requiere
+
+
+ESCENARIOS = [
+    Escenario(
+        "calculador",
+        "from src.domain.entities import ComponenteGPU\n"
+        "from src.infrastructure.calculador_amdahl import CalculadorAmdahl\n"
+        "CalculadorAmdahl().calcular_aceleracion(ComponenteGPU('CUDA', 0.35, 5))",
+        presupuesto_ms=75
+    ),
+    Escenario(
+        "analizador",
+        "from src.infrastructure.calculador_amdahl import CalculadorAmdahl\n"
+        "from src.infrastructure.analizador_componentes import AnalizadorComponentes\n"
+        "AnalizadorComponentes(CalculadorAmdahl())",
+        presupuesto_ms=90,
+        prohibidos=PESADOS + OPCIONALES
+    ),
+    Escenario(
+        "cli",
+        "from src.presentation.cli import CLIAmdahl, crear_parser\n"
+        "crear_parser()\n"
+        "CLIAmdahl()",
+        presupuesto_ms=150,
+        prohibidos=PESADOS + OPCIONALES
+    ),
+    Escenario(
+        "visualizador",
+        "from src.infrastructure.visualizador_matplotlib import VisualizadorMatplotlib\n"
+        "VisualizadorMatplotlib()",
+        presupuesto_ms=90
+    ),
+    Escenario(
+        "gui",
+        "import src.presentation.gui",
+        presupuesto_ms=150,
+        requiere=("customtkinter", "tkinter")
+    ),
+]
+
+
+def _envolver(codigo: str) -> str:
+    # El tiempo se toma dentro del proceso: no incluye el arranque de Python
+    return (
+        "import time as _t\n"
+        "_inicio = _t.perf_counter()\n"
+        f"{codigo}\n"
+        "print((_t.perf_counter() - _inicio) * 1000)\n"
+    )
+
+
+def _modulos_importados(salida_importtime: str) -> List[Dict[str, Any]]:
+    # Líneas "import time: <propio> | <acumulado> | <módulo>" en microsegundos
+    modulos = []
+    for linea in salida_importtime.splitlines():
+        if not linea.startswith("import time:"):
+            continue
+        propio, acumulado, modulo = linea[len("import time:"):].split("|")
+        if not propio.strip().isdigit():
+            continue  # encabezado
+        modulos.append({
+            "modulo": modulo.strip(),
+            "propio_ms": int(propio) / 1000,
+            "acumulado_ms": int(acumulado) / 1000,
+        })
+    return modulos
+
+
+def medir(escenario: Escenario, repeticiones: int) -> Dict[str, Any]:
+    tiempos = []
+    modulos: List[Dict[str, Any]] = []
+    for _ in range(repeticiones):
+        proceso = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _envolver(escenario.codigo)],
+            cwd=RAIZ, capture_output=True, text=True,
+            env={**os.environ, "MPLBACKEND": "Agg"}
+        )
+        if proceso.returncode != 0:
+            raise RuntimeError(
+                f"El escenario '{escenario.nombre}' falló:\n{proceso.stderr[-2000:]}"
+            )
+        tiempos.append(float(proceso.stdout.strip().splitlines()[-1]))
+        modulos = _modulos_importados(proceso.stderr)
+    
+    # Un prohibido es un paquete de primer nivel (numpy) o un módulo completo
+    cargados = sorted({
+        prohibido for m in modulos for prohibido in escenario.prohibidos
+        if m["modulo"] == prohibido or m["modulo"].split(".")[0] == prohibido
+    })
+    mas_lentos = sorted(modulos, key=lambda m: m["propio_ms"], reverse=True)[:5]
+    mediana = statistics.median(tiempos)
+    return {
+        "nombre": escenario.nombre,
+        "mediana_ms": round(mediana, 2),
+        "minimo_ms": round(min(tiempos), 2),
+        "presupuesto_ms": escenario.presupuesto_ms,
+        "modulos_importados": len(modulos),
+        "pesados_cargados": cargados,
+        "mas_lentos": mas_lentos,
+    }
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Presupuesto de tiempo de arranque")
+    parser.add_argument("--filtro", help="Corre solo los escenarios cuyo nombre contenga este texto")
+    parser.add_argument("--repeticiones", type=int, default=7)
+    parser.add_argument(
+        "--escala", type=float, default=1.0,
+        help="Multiplica todos los presupuestos (default: 1)"
+    )
+    parser.add_argument("--salida", help="Archivo JSON de resultados (default: stdout)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = crear_parser().parse_args(argv)
+    
+    resultados = []
+    fallas = []
+    for escenario in ESCENARIOS:
+        if args.filtro and args.filtro not in escenario.nombre:
+            continue
+        faltantes = [m for m in escenario.requiere if importlib.util.find_spec(m) is None]
+        if faltantes:
+            print(f"{escenario.nombre:<14} omitido (falta {', '.join(faltantes)})", file=sys.stderr)
+            continue
+        
+        resultado = medir(escenario, args.repeticiones)
+        resultado["presupuesto_ms"] = round(escenario.presupuesto_ms * args.escala, 2)
+        resultados.append(resultado)
+        
+        excedido = resultado["mediana_ms"] > resultado["presupuesto_ms"]
+        if excedido:
+            fallas.append(f"{escenario.nombre}: {resultado['mediana_ms']:.1f} ms "
+                          f"> {resultado['presupuesto_ms']:.1f} ms")
+        if resultado["pesados_cargados"]:
+            fallas.append(f"{escenario.nombre}: cargó {', '.join(resultado['pesados_cargados'])}")
+        print(
+            f"{escenario.nombre:<14} {resultado['mediana_ms']:>8.1f} ms "
+            f"(presupuesto {resultado['presupuesto_ms']:.0f} ms)  "
+            f"{resultado['modulos_importados']:>4} módulos  "
+            f"{'❌' if excedido or resultado['pesados_cargados'] else '✅'}",
+            file=sys.stderr
+        )
+    
+    informe = {"python": sys.version.split()[0], "escenarios": resultados}
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2, ensure_ascii=False)
+            archivo.write("\n")
+    else:
+        json.dump(informe, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    
+    for falla in fallas:
+        print(f"❌ {falla}", file=sys.stderr)
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
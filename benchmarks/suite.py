@@ -0,0 +1,356 @@
+"""
+Benchmarks reproducibles de los caminos críticos (calculador, analizador,
+caso de uso completo y visualizador).
+
+Uso:
+    python -m benchmarks                                  # corre todo y compara con la línea base
+    python -m benchmarks --filtro analizador --salida r.json
+    python -m benchmarks --guardar-linea-base             # guarda benchmarks/linea_base.json
+
+Cada caso reporta ops/s (sobre la mediana), percentiles p50/p90/p99 por
+llamada y el pico de memoria (tracemalloc) de una llamada adicional. Con una
+línea base, los casos cuyas ops/s caen más de `--tolerancia` se marcan como
+regresión y el proceso termina con código 1.
+
+La línea base son tiempos absolutos de una máquina, por lo que no se
+versiona: se genera en cada máquina con --guardar-linea-base antes de
+comparar (y se avisa si el entorno de la línea base no coincide).
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import numpy as np
+
+
+RUTA_LINEA_BASE = os.path.join(os.path.dirname(__file__), "linea_base.json")
+SEMILLA = 20250701
+
+
+class Caso:
+    # Un benchmark: `preparar` arma los datos (fuera de la medición) y devuelve la función a medir
+    
+    def __init__(
+        self,
+        nombre: str,
+        preparar: Callable[[], Callable[[], Any]],
+        operaciones: int = 1,
+        tiempo_minimo: float = 0.5,
+        repeticiones_minimas: int = 5,
+        repeticiones_maximas: int = 200
+    ):
+        self.nombre = nombre
+        self.preparar = preparar
+        self.operaciones = operaciones
+        self.tiempo_minimo = tiempo_minimo
+        self.repeticiones_minimas = repeticiones_minimas
+        self.repeticiones_maximas = repeticiones_maximas
+
+
+def medir(caso: Caso) -> Dict[str, Any]:
+    funcion = caso.preparar()
+    funcion()  # Calentamiento
+    
+    tiempos: List[float] = []
+    inicio = time.perf_counter()
+    while len(tiempos) < caso.repeticiones_maximas and (
+        len(tiempos) < caso.repeticiones_minimas
+        or time.perf_counter() - inicio < caso.tiempo_minimo
+    ):
+        t0 = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - t0)
+    
+    tracemalloc.start()
+    try:
+        funcion()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    milisegundos = np.asarray(tiempos) * 1000
+    p50, p90, p99 = np.percentile(milisegundos, [50, 90, 99]).tolist()
+    return {
+        "nombre": caso.nombre,
+        "repeticiones": len(tiempos),
+        "operaciones_por_llamada": caso.operaciones,
+        "ops_por_segundo": caso.operaciones / statistics.median(tiempos),
+        "p50_ms": p50,
+        "p90_ms": p90,
+        "p99_ms": p99,
+        "min_ms": float(milisegundos.min()),
+        "memoria_pico_mb": pico / 1024**2,
+    }
+
+
+def comparar(
+    resultados: List[Dict[str, Any]],
+    linea_base: Dict[str, Any],
+    tolerancia: float
+) -> List[Dict[str, Any]]:
+    """Agrega a cada resultado su relación con la línea base; devuelve las regresiones"""
+    base = {caso["nombre"]: caso for caso in linea_base.get("casos", [])}
+    regresiones = []
+    for resultado in resultados:
+        anterior = base.get(resultado["nombre"])
+        if anterior is None:
+            continue
+        relacion = resultado["ops_por_segundo"] / anterior["ops_por_segundo"]
+        resultado["relacion_linea_base"] = relacion
+        resultado["regresion"] = relacion < 1 - tolerancia
+        if resultado["regresion"]:
+            regresiones.append(resultado)
+    return regresiones
+
+
+# ---------------------------------------------------------------------------
+# Casos
+# ---------------------------------------------------------------------------
+
+def _datos_aleatorios(n: int) -> tuple:
+    rng = np.random.default_rng(SEMILLA)
+    return rng.uniform(0.0, 0.6, n), rng.uniform(1.01, 50.0, n)
+
+
+def _componentes(n: int) -> list:
+    from src.domain.entities import ComponenteGPU
+    f, k = _datos_aleatorios(n)
+    return [ComponenteGPU(f"c{i}", a, b) for i, (a, b) in enumerate(zip(f.tolist(), k.tolist()))]
+
+
+def _tabla(n: int):
+    from src.domain.tablas import TablaComponentes
+    f, k = _datos_aleatorios(n)
+    return TablaComponentes.desde_arreglos([f"c{i % 10_000}" for i in range(n)], f, k)
+
+
+def _casos_calculador(rapido: bool) -> Iterator[Caso]:
+    from src.infrastructure.calculador_amdahl import CalculadorAmdahl
+    calculador = CalculadorAmdahl()
+    
+    n = 1_000 if rapido else 10_000
+    
+    def escalar():
+        componentes = _componentes(n)
+        return lambda: [calculador.calcular_aceleracion(c) for c in componentes]
+    yield Caso(f"calculador.escalar[n={n}]", escalar, operaciones=n)
+    
+    for tamano in ([n] if rapido else [n, 1_000_000]):
+        def lote(tamano=tamano):
+            f, k = _datos_aleatorios(tamano)
+            return lambda: calculador.calcular_lote(f, k)
+        yield Caso(f"calculador.lote[n={tamano}]", lote, operaciones=tamano)
+
+
+def _casos_analizador(rapido: bool, completo: bool) -> Iterator[Caso]:
+    from src.infrastructure.calculador_amdahl import CalculadorAmdahl
+    from src.infrastructure.analizador_componentes import AnalizadorComponentes
+    analizador = AnalizadorComponentes(CalculadorAmdahl())
+    
+    tamanos = [10**3, 10**4] if rapido else [10**3, 10**4, 10**5, 10**6]
+    if completo:
+        tamanos.append(10**7)
+    
+    for n in tamanos:
+        def tabla(n=n):
+            datos = _tabla(n)
+            return lambda: analizador.determinar_mejor_componente(datos)
+        yield Caso(
+            f"analizador.determinar_mejor_componente.tabla[n={n}]", tabla,
+            operaciones=n, repeticiones_minimas=3
+        )
+    
+    # Las listas de dataclasses se miden hasta 10^5: más allá domina construirlas
+    for n in [n for n in tamanos if n <= 10**5]:
+        def lista(n=n):
+            datos = _componentes(n)
+            return lambda: analizador.determinar_mejor_componente(datos)
+        yield Caso(
+            f"analizador.determinar_mejor_componente.lista[n={n}]", lista,
+            operaciones=n, repeticiones_minimas=3
+        )
+    
+    n = 10**4 if rapido else 10**6
+    def ranking_completo():
+        analisis = analizador.determinar_mejor_componente(_tabla(n))
+        return analisis.obtener_ranking
+    yield Caso(
+        f"analisis.obtener_ranking[n={n}]", ranking_completo,
+        operaciones=n, repeticiones_minimas=3
+    )
+    
+    def ranking_top():
+        analisis = analizador.determinar_mejor_componente(_tabla(n))
+        return lambda: analisis.top_k(10)
+    yield Caso(f"analisis.top_k[n={n},k=10]", ranking_top, operaciones=n)
+
+
+def _casos_caso_de_uso() -> Iterator[Caso]:
+    from src.domain.entities import IVisualizador
+    from src.application.use_cases import ResolverProblemaGPUUseCase
+    from src.infrastructure.calculador_amdahl import CalculadorAmdahl
+    from src.infrastructure.analizador_componentes import AnalizadorComponentes
+    
+    class VisualizadorNulo(IVisualizador):
+        # Los gráficos se miden aparte; aquí solo interesa el cálculo
+        
+        def graficar_aceleracion_vs_factor(self, porcentajes_mejora, factores_mejora):
+            pass
+        
+        def graficar_aceleracion_vs_porcentaje(self, factores_mejora, porcentajes_mejora):
+            pass
+    
+    def resolver():
+        calculador = CalculadorAmdahl()
+        caso = ResolverProblemaGPUUseCase(
+            calculador, AnalizadorComponentes(calculador), VisualizadorNulo()
+        )
+        
+        def ejecutar():
+            resultados = caso.resolver_problema_completo()
+            return resultados["analisis_comparativo"].justificacion
+        return ejecutar
+    yield Caso("resolver_problema_completo[sin_graficos]", resolver)
+
+
+def _casos_visualizador() -> Iterator[Caso]:
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from src.infrastructure.visualizador_matplotlib import VisualizadorMatplotlib
+    
+    porcentajes = [i / 100 for i in range(5, 96, 5)]
+    renders = {
+        "aceleracion_vs_factor": lambda v: v.graficar_aceleracion_vs_factor(
+            [0.25, 0.35], list(range(1, 21))
+        ),
+        "aceleracion_vs_porcentaje": lambda v: v.graficar_aceleracion_vs_porcentaje(
+            [4, 8], porcentajes
+        ),
+        "comparacion_componentes": lambda v: v.graficar_comparacion_componentes([
+            {"nombre": f"C{i}", "aceleracion": 1 + i / 10} for i in range(4)
+        ]),
+        "limite_teorico": lambda v: v.graficar_limite_teorico(porcentajes),
+    }
+    
+    for nombre, render in renders.items():
+        def preparar(render=render):
+            visualizador = VisualizadorMatplotlib()
+            directorio = tempfile.mkdtemp(prefix="bench_graficos_")
+            
+            def ejecutar():
+                # El visualizador guarda PNG en el directorio actual y lo informa por stdout
+                anterior = os.getcwd()
+                os.chdir(directorio)
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        render(visualizador)
+                finally:
+                    os.chdir(anterior)
+                    plt.close("all")
+            return ejecutar
+        yield Caso(
+            f"visualizador.{nombre}", preparar,
+            tiempo_minimo=0, repeticiones_minimas=3
+        )
+
+
+def casos(rapido: bool = False, completo: bool = False) -> Iterator[Caso]:
+    yield from _casos_calculador(rapido)
+    yield from _casos_analizador(rapido, completo)
+    yield from _casos_caso_de_uso()
+    yield from _casos_visualizador()
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _entorno() -> Dict[str, str]:
+    import matplotlib
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "plataforma": platform.platform(),
+        "procesador": platform.processor() or platform.machine(),
+    }
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmarks de la calculadora de Amdahl")
+    parser.add_argument("--filtro", help="Corre solo los casos cuyo nombre contenga este texto")
+    parser.add_argument("--salida", help="Archivo JSON de resultados (default: stdout)")
+    parser.add_argument("--linea-base", default=RUTA_LINEA_BASE, help="JSON con la línea base")
+    parser.add_argument(
+        "--tolerancia", type=float, default=0.2,
+        help="Caída máxima de ops/s antes de marcar regresión (default: 0.2 = 20%%)"
+    )
+    parser.add_argument(
+        "--guardar-linea-base", action="store_true",
+        help="Escribe los resultados como nueva línea base"
+    )
+    parser.add_argument("--rapido", action="store_true", help="Tamaños reducidos (prueba rápida)")
+    parser.add_argument("--completo", action="store_true", help="Incluye 10^7 componentes")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = crear_parser().parse_args(argv)
+    
+    resultados = []
+    for caso in casos(args.rapido, args.completo):
+        if args.filtro and args.filtro not in caso.nombre:
+            continue
+        resultado = medir(caso)
+        resultados.append(resultado)
+        print(
+            f"{caso.nombre:<60} {resultado['ops_por_segundo']:>14,.0f} ops/s  "
+            f"p50 {resultado['p50_ms']:>9.3f} ms  p99 {resultado['p99_ms']:>9.3f} ms  "
+            f"{resultado['memoria_pico_mb']:>8.1f} MB",
+            file=sys.stderr
+        )
+    
+    entorno = _entorno()
+    regresiones = []
+    if not args.guardar_linea_base and os.path.exists(args.linea_base):
+        with open(args.linea_base, encoding="utf-8") as archivo:
+            linea_base = json.load(archivo)
+        if linea_base.get("entorno") != entorno:
+            print(
+                "⚠️  La línea base se midió en otro entorno: las comparaciones "
+                "no son confiables (regenerarla con --guardar-linea-base)",
+                file=sys.stderr
+            )
+        regresiones = comparar(resultados, linea_base, args.tolerancia)
+    elif not args.guardar_linea_base:
+        print(
+            f"ℹ️  Sin línea base en {args.linea_base}: se genera con --guardar-linea-base",
+            file=sys.stderr
+        )
+    
+    informe = {"entorno": entorno, "casos": resultados}
+    destino = args.linea_base if args.guardar_linea_base else args.salida
+    if destino:
+        with open(destino, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2, ensure_ascii=False)
+            archivo.write("\n")
+    else:
+        json.dump(informe, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    
+    for resultado in regresiones:
+        print(
+            f"❌ Regresión en {resultado['nombre']}: "
+            f"{resultado['relacion_linea_base']:.2f}x de la línea base",
+            file=sys.stderr
+        )
+    return 1 if regresiones else 0
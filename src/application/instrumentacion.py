@@ -0,0 +1,171 @@
+"""
+Instrumentación: tramos medidos con un context manager y sumideros intercambiables
+"""
+import functools
+import threading
+import time
+from abc import ABCMeta
+from typing import Any, Dict, Iterable, List, Optional, TypeVar
+from ..domain.entities import ISumideroTramos, RegistroTramo
+
+
+T = TypeVar("T")
+
+
+class _TramoNulo:
+    # Con la instrumentación desactivada todos los tramos son este mismo objeto
+    __slots__ = ()
+    
+    def __enter__(self) -> "_TramoNulo":
+        return self
+    
+    def __exit__(self, *excepcion: Any) -> bool:
+        return False
+
+
+TRAMO_NULO = _TramoNulo()
+
+
+class _Tramo:
+    __slots__ = ("instrumentador", "nombre", "atributos", "inicio", "pila", "padre", "profundidad")
+    
+    def __init__(self, instrumentador: "Instrumentador", nombre: str, atributos: dict):
+        self.instrumentador = instrumentador
+        self.nombre = nombre
+        self.atributos = atributos
+    
+    def __enter__(self) -> "_Tramo":
+        pila = self.pila = self.instrumentador._pila()
+        self.padre = pila[-1] if pila else None
+        self.profundidad = len(pila)
+        pila.append(self.nombre)
+        self.inicio = time.perf_counter()
+        return self
+    
+    def __exit__(self, tipo: Any, valor: Any, traza: Any) -> bool:
+        duracion = time.perf_counter() - self.inicio
+        self.pila.pop()
+        self.instrumentador._emitir(RegistroTramo(
+            nombre=self.nombre,
+            inicio=self.inicio,
+            duracion=duracion,
+            profundidad=self.profundidad,
+            padre=self.padre,
+            atributos=self.atributos,
+            error=tipo.__name__ if tipo is not None else None
+        ))
+        return False
+
+
+class Instrumentador:
+    """
+    Crea tramos (`with instrumentador.tramo("nombre"): ...`) y entrega cada
+    medición a sus sumideros.
+    
+    Sin sumideros está desactivado: `tramo` devuelve siempre el mismo objeto
+    vacío e `instrumentar` devuelve el objeto sin envolver, de modo que los
+    métodos instrumentados no pagan ningún costo extra.
+    """
+    
+    def __init__(self, sumideros: Iterable[ISumideroTramos] = ()):
+        self.sumideros: List[ISumideroTramos] = list(sumideros)
+        self._local = threading.local()
+    
+    @property
+    def activo(self) -> bool:
+        return bool(self.sumideros)
+    
+    def agregar_sumidero(self, sumidero: ISumideroTramos) -> None:
+        self.sumideros.append(sumidero)
+    
+    def tramo(self, nombre: str, **atributos: Any) -> Any:
+        if not self.sumideros:
+            return TRAMO_NULO
+        return _Tramo(self, nombre, atributos)
+    
+    def _pila(self) -> List[str]:
+        # Tramos abiertos en este hilo (para profundidad y padre)
+        pila = getattr(self._local, "pila", None)
+        if pila is None:
+            pila = self._local.pila = []
+        return pila
+    
+    def _emitir(self, registro: RegistroTramo) -> None:
+        for sumidero in self.sumideros:
+            sumidero.registrar(registro)
+
+
+class ObjetoInstrumentado:
+    """
+    Envuelve cada método público de `objeto` en un tramo '<prefijo>.<método>'.
+    Los atributos que no son métodos se devuelven sin cambios.
+    
+    `instrumentar` crea una subclase por tipo envuelto, registrada como
+    subclase virtual de sus interfaces (ABCs), para que isinstance(envuelto,
+    ICalculadorAmdahl) siga siendo verdadero. Al serializarse (pickle, p. ej.
+    para enviarse a procesos trabajadores) se guarda solo el objeto envuelto:
+    el instrumentador tiene locks y sumideros propios de este proceso.
+    """
+    
+    def __init__(self, objeto: Any, instrumentador: Instrumentador, prefijo: str):
+        self._objeto = objeto
+        self._instrumentador = instrumentador
+        self._prefijo = prefijo
+    
+    def __getattr__(self, nombre: str) -> Any:
+        if nombre.startswith("_"):
+            raise AttributeError(nombre)
+        atributo = getattr(self._objeto, nombre)
+        if not callable(atributo):
+            return atributo
+        
+        tramo = self._instrumentador.tramo
+        nombre_tramo = f"{self._prefijo}.{nombre}"
+        
+        @functools.wraps(atributo)
+        def medido(*args: Any, **kwargs: Any) -> Any:
+            with tramo(nombre_tramo):
+                return atributo(*args, **kwargs)
+        
+        # Las siguientes llamadas encuentran el método envuelto sin pasar por __getattr__
+        self.__dict__[nombre] = medido
+        return medido
+    
+    def __reduce__(self) -> tuple:
+        return _sin_instrumentar, (self._objeto,)
+    
+    def __repr__(self) -> str:
+        return f"ObjetoInstrumentado({self._objeto!r})"
+
+
+_clases_instrumentadas: Dict[type, type] = {}
+_lock_clases = threading.Lock()
+
+
+def _clase_instrumentada(tipo: type) -> type:
+    # Subclase de ObjetoInstrumentado que pasa por cada interface (ABC) de `tipo`
+    with _lock_clases:
+        clase = _clases_instrumentadas.get(tipo)
+        if clase is None:
+            clase = type(f"{tipo.__name__}Instrumentado", (ObjetoInstrumentado,), {})
+            for base in tipo.__mro__:
+                if isinstance(base, ABCMeta):
+                    base.register(clase)
+            _clases_instrumentadas[tipo] = clase
+        return clase
+
+
+def _sin_instrumentar(objeto: T) -> T:
+    return objeto
+
+
+def instrumentar(
+    objeto: T,
+    instrumentador: Instrumentador,
+    prefijo: Optional[str] = None
+) -> T:
+    """Devuelve `objeto` instrumentado, o el mismo objeto si la instrumentación está desactivada"""
+    if not instrumentador.activo:
+        return objeto
+    clase = _clase_instrumentada(type(objeto))
+    return clase(objeto, instrumentador, prefijo or type(objeto).__name__)
@@ -1,20 +1,33 @@
 """
 Casos de uso para la aplicación de Ley de Amdahl
 """
-from typing import List
+from __future__ import annotations
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence
 from ..domain.entities import (
     ComponenteGPU, 
     ResultadoAmdahl, 
     AnalisisComparativo,
+    BloqueComponentes,
+    ResultadoLoteAmdahl,
+    ResumenProcesamientoLote,
     ICalculadorAmdahl,
     IVisualizador,
-    IAnalizador
+    IAnalizador,
+    IRepositorioComponentes
 )
 from ..domain.value_objects import (
     ConfiguracionGPUPar,
+    ConfiguracionInterconexion,
     ComponentesGPUPredefinidos,
-    ConstantesMatematicas
+    ConstantesMatematicas,
+    ModelosEscalamiento
 )
+from .instrumentacion import Instrumentador, instrumentar
+
+if TYPE_CHECKING:
+    from ..domain.entidades_barrido import DefinicionBarrido, IEjecutorBarrido, ResultadoBarrido
+    from ..domain.entidades_multi_gpu import DispositivosOptimos, IModeloMultiGPU
 
 
 class CalcularAceleracionUseCase:
@@ -33,6 +46,22 @@ class CalcularAceleracionUseCase:
             aceleracion=aceleracion,
             limite_teorico=limite_teorico
         )
+    
+    def execute_lote(self, componentes: Sequence[ComponenteGPU]) -> List[ResultadoAmdahl]:
+        """Igual que `execute` para cada componente, en una sola pasada vectorizada"""
+        lote = self.calculador.calcular_lote(
+            [c.porcentaje_mejora for c in componentes],
+            [c.factor_mejora for c in componentes]
+        )
+        return [
+            ResultadoAmdahl(
+                componente=componente,
+                aceleracion=aceleracion,
+                limite_teorico=limite_teorico
+            )
+            for componente, aceleracion, limite_teorico
+            in zip(componentes, lote.aceleracion.tolist(), lote.limite_teorico.tolist())
+        ]
 
 
 class CalcularTiempoOptimizadoUseCase:
@@ -60,6 +89,72 @@ class CalcularTiempoOptimizadoUseCase:
             tiempo_original=tiempo_original,
             tiempo_optimizado=tiempo_optimizado
         )
+    
+    def execute_lote(
+        self, 
+        componentes: Sequence[ComponenteGPU], 
+        tiempos_originales: Sequence[float]
+    ) -> List[ResultadoAmdahl]:
+        """Igual que `execute` para cada par (componente, tiempo), vectorizando la aceleración"""
+        lote = self.calculador.calcular_lote(
+            [c.porcentaje_mejora for c in componentes],
+            [c.factor_mejora for c in componentes]
+        )
+        
+        resultados = []
+        for componente, tiempo_original, aceleracion, limite_teorico in zip(
+            componentes, tiempos_originales,
+            lote.aceleracion.tolist(), lote.limite_teorico.tolist()
+        ):
+            # Como en `execute`, el tiempo se calcula con la aceleración ya redondeada
+            resultados.append(ResultadoAmdahl(
+                componente=componente,
+                aceleracion=aceleracion,
+                limite_teorico=limite_teorico,
+                tiempo_original=tiempo_original,
+                tiempo_optimizado=self.calculador.calcular_tiempo_optimizado(
+                    tiempo_original, aceleracion
+                )
+            ))
+        return resultados
+
+
+class EvaluarLoteComponentesUseCase:
+    """Caso de uso para evaluar inventarios de componentes bloque a bloque"""
+    
+    def __init__(self, calculador: ICalculadorAmdahl):
+        self.calculador = calculador
+    
+    def execute(
+        self, 
+        bloques: Iterable[BloqueComponentes], 
+        escribir: Callable[[BloqueComponentes, ResultadoLoteAmdahl], None],
+        tiempo_original: Optional[float] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResumenProcesamientoLote:
+        """Evalúa cada bloque y lo entrega a `escribir` sin acumular resultados"""
+        filas = filas_validas = cantidad_bloques = 0
+        inicio = time.perf_counter()
+        
+        for bloque in bloques:
+            resultado = self.calculador.calcular_lote(
+                bloque.porcentajes_mejora,
+                bloque.factores_mejora,
+                tiempo_original,
+                decimales
+            )
+            escribir(bloque, resultado)
+            
+            filas += len(bloque)
+            filas_validas += int(resultado.validos.sum())
+            cantidad_bloques += 1
+        
+        return ResumenProcesamientoLote(
+            filas=filas,
+            filas_validas=filas_validas,
+            bloques=cantidad_bloques,
+            segundos=time.perf_counter() - inicio
+        )
 
 
 class GenerarGraficosUseCase:
@@ -68,21 +163,87 @@ class GenerarGraficosUseCase:
     def __init__(self, visualizador: IVisualizador):
         self.visualizador = visualizador
     
-    def graficar_a_vs_k(self, porcentajes_mejora: List[float]) -> None:
-        """Genera gráfico A vs k para diferentes f"""
+    def graficar_a_vs_k(self, porcentajes_mejora: List[float]) -> Any:
+        """Genera gráfico A vs k para diferentes f (devuelve el archivo si el visualizador lo escribe)"""
         factores_mejora = list(range(1, 21))  # k de 1 a 20
-        self.visualizador.graficar_aceleracion_vs_factor(
+        return self.visualizador.graficar_aceleracion_vs_factor(
             porcentajes_mejora, factores_mejora
         )
     
-    def graficar_a_vs_f(self, factores_mejora: List[float]) -> None:
-        """Genera gráfico A vs f para diferentes k"""
+    def graficar_a_vs_f(self, factores_mejora: List[float]) -> Any:
+        """Genera gráfico A vs f para diferentes k (devuelve el archivo si el visualizador lo escribe)"""
         porcentajes_mejora = [i/100 for i in range(5, 96, 5)]  # f de 0.05 a 0.95
-        self.visualizador.graficar_aceleracion_vs_porcentaje(
+        return self.visualizador.graficar_aceleracion_vs_porcentaje(
             factores_mejora, porcentajes_mejora
         )
 
 
+class BarrerParametrosUseCase:
+    """Caso de uso para estudios de sensibilidad sobre grillas f × k"""
+    
+    def __init__(self, ejecutor: IEjecutorBarrido):
+        self.ejecutor = ejecutor
+    
+    def execute(self, definicion: DefinicionBarrido) -> ResultadoBarrido:
+        """Evalúa la grilla reduciendo a máximo, argmax y conteos por umbral"""
+        return self.ejecutor.ejecutar(definicion)
+    
+    def barrer_sensibilidad(
+        self, 
+        puntos_f: int, 
+        puntos_k: int, 
+        k_maximo: float = 1e4,
+        umbrales: Optional[List[float]] = None,
+        componentes_base: Optional[List[ComponenteGPU]] = None,
+        archivo_salida: Optional[str] = None
+    ) -> ResultadoBarrido:
+        """
+        Barrido estándar: f en [0, 1) y k en (1, k_maximo] con resolución uniforme.
+        Con archivo_salida la grilla completa se escribe en ese .npy (memmap).
+        """
+        from ..domain.entidades_barrido import DefinicionBarrido
+        
+        definicion = DefinicionBarrido(
+            porcentajes_mejora=[i / puntos_f for i in range(puntos_f)],
+            factores_mejora=[
+                1 + (k_maximo - 1) * (j + 1) / puntos_k for j in range(puntos_k)
+            ],
+            componentes_base=componentes_base or [],
+            umbrales=umbrales or [],
+            archivo_salida=archivo_salida
+        )
+        return self.ejecutor.ejecutar(definicion)
+
+
+class DimensionarMultiGPUUseCase:
+    """Caso de uso para decidir cuántas GPUs conviene usar con cada interconexión"""
+    
+    def __init__(self, modelos: Dict[str, IModeloMultiGPU]):
+        # Un modelo por interconexión, con su nombre (p. ej. tipo NVLink y tipo PCIe)
+        self.modelos = modelos
+    
+    def execute(
+        self, 
+        porcentajes_paralelos: Any, 
+        tamanos_mensaje: Any,
+        tiempo_base: Any,
+        max_dispositivos: int = ConfiguracionInterconexion.MAX_DISPOSITIVOS,
+        ganancia_minima: float = ConfiguracionInterconexion.GANANCIA_MINIMA
+    ) -> Dict[str, DispositivosOptimos]:
+        """
+        N a partir del cual otra GPU mejora A menos que `ganancia_minima`,
+        para cada perfil e interconexión (0 = N de máxima aceleración); los
+        perfiles (f, bytes por paso, T1 en ms) hacen broadcasting entre sí
+        """
+        return {
+            nombre: modelo.calcular_dispositivos_optimos(
+                porcentajes_paralelos, tamanos_mensaje, tiempo_base,
+                max_dispositivos, ganancia_minima
+            )
+            for nombre, modelo in self.modelos.items()
+        }
+
+
 class AnalizarComponentesUseCase:
     """Caso de uso para analizar y comparar componentes"""
     
@@ -91,14 +252,15 @@ class AnalizarComponentesUseCase:
     
     def determinar_mejor_optimizacion(
         self, 
-        componentes: List[ComponenteGPU]
+        componentes: Sequence[ComponenteGPU],
+        escalamiento: float = ModelosEscalamiento.AMDAHL
     ) -> AnalisisComparativo:
-        """Determina la mejor optimización entre todos los componentes"""
-        return self.analizador.determinar_mejor_componente(componentes)
+        """Determina la mejor optimización (acepta lista o TablaComponentes)"""
+        return self.analizador.determinar_mejor_componente(componentes, escalamiento)
     
     def analizar_ultimos_tres_componentes(
         self, 
-        componentes: List[ComponenteGPU]
+        componentes: Sequence[ComponenteGPU]
     ) -> AnalisisComparativo:
         """Analiza los últimos 3 componentes ingresados"""
         return self.analizador.analizar_ultimos_tres(componentes)
@@ -107,8 +269,15 @@ class AnalizarComponentesUseCase:
 class CargarComponentesPredefinidosUseCase:
     """Caso de uso para cargar componentes GPU predefinidos"""
     
+    def __init__(self, repositorio: Optional[IRepositorioComponentes] = None):
+        # Sin repositorio (p. ej. sin config.json) se usan los valores de ConfiguracionGPUPar
+        self.repositorio = repositorio
+    
     def execute(self) -> List[ComponenteGPU]:
         """Carga los componentes predefinidos para grupos pares (GPU)"""
+        if self.repositorio is not None:
+            return list(self.repositorio.cargar())
+        
         config = ConfiguracionGPUPar()
         
         return [
@@ -135,6 +304,17 @@ class CargarComponentesPredefinidosUseCase:
         ]
 
 
+class CargarCatalogoComponentesUseCase:
+    """Caso de uso para cargar catálogos grandes sin crear un objeto por componente"""
+    
+    def __init__(self, repositorio: IRepositorioComponentes):
+        self.repositorio = repositorio
+    
+    def execute(self) -> Sequence[ComponenteGPU]:
+        """Devuelve el catálogo tal como lo entrega el repositorio (p. ej. una TablaComponentes)"""
+        return self.repositorio.cargar()
+
+
 class ResolverProblemaGPUUseCase:
     """Caso de uso para resolver el problema específico de GPU (grupos pares)"""
     
@@ -142,55 +322,81 @@ class ResolverProblemaGPUUseCase:
         self, 
         calculador: ICalculadorAmdahl,
         analizador: IAnalizador,
-        visualizador: IVisualizador
+        visualizador: IVisualizador,
+        instrumentador: Optional[Instrumentador] = None,
+        repositorio: Optional[IRepositorioComponentes] = None
     ):
         self.calculador = calculador
         self.analizador = analizador  
         self.visualizador = visualizador
-        self.cargar_componentes = CargarComponentesPredefinidosUseCase()
-        self.calcular_aceleracion = CalcularAceleracionUseCase(calculador)
-        self.calcular_tiempo = CalcularTiempoOptimizadoUseCase(calculador)
-        self.generar_graficos = GenerarGraficosUseCase(visualizador)
-        self.analizar_componentes = AnalizarComponentesUseCase(analizador)
+        # Sin instrumentador (o sin sumideros) los tramos no tienen costo
+        self.instrumentador = instrumentador or Instrumentador()
+        self.cargar_componentes = instrumentar(
+            CargarComponentesPredefinidosUseCase(repositorio), self.instrumentador
+        )
+        self.calcular_aceleracion = instrumentar(
+            CalcularAceleracionUseCase(calculador), self.instrumentador
+        )
+        self.calcular_tiempo = instrumentar(
+            CalcularTiempoOptimizadoUseCase(calculador), self.instrumentador
+        )
+        self.generar_graficos = instrumentar(
+            GenerarGraficosUseCase(visualizador), self.instrumentador
+        )
+        self.analizar_componentes = instrumentar(
+            AnalizarComponentesUseCase(analizador), self.instrumentador
+        )
     
     def resolver_problema_completo(self) -> dict:
         """Resuelve todo el problema planteado para grupos pares"""
-        componentes = self.cargar_componentes.execute()
-        
-        # 1. Calcular aceleración para cada componente
-        resultados = []
-        for componente in componentes:
-            resultado = self.calcular_aceleracion.execute(componente)
-            resultados.append(resultado)
-        
-        # 2. Calcular límites teóricos (ya incluidos en resultados)
-        
-        # 3. Calcular tiempo para núcleos CUDA (50ms original)
-        nucleos_cuda = next(c for c in componentes 
-                           if c.nombre == ComponentesGPUPredefinidos.NUCLEOS_CUDA)
-        resultado_tiempo = self.calcular_tiempo.execute(
-            nucleos_cuda, 
-            ConfiguracionGPUPar.TIEMPO_RENDERIZADO_ORIGINAL
-        )
-        
-        # 4. Determinar componente para 30% de aceleración
-        componente_30_porciento = self._encontrar_componente_para_aceleracion(
-            componentes, 1.3  # 30% de aceleración = factor 1.3
-        )
-        
-        # 5. Generar gráficos A vs k para f=0.25 y f=0.35
-        self.generar_graficos.graficar_a_vs_k([0.25, 0.35])
-        
-        # 6. Análisis comparativo
-        analisis = self.analizar_componentes.determinar_mejor_optimizacion(componentes)
+        tramo = self.instrumentador.tramo
+        with tramo("resolver_problema_completo"):
+            with tramo("resolver.carga"):
+                componentes = self.cargar_componentes.execute()
+            
+            # 1. Calcular aceleración para cada componente
+            with tramo("resolver.aceleraciones", componentes=len(componentes)):
+                resultados = []
+                for componente in componentes:
+                    resultado = self.calcular_aceleracion.execute(componente)
+                    resultados.append(resultado)
+            
+            # 2. Calcular límites teóricos (ya incluidos en resultados)
+            
+            # 3. Calcular tiempo para núcleos CUDA (50ms original)
+            with tramo("resolver.tiempo"):
+                nucleos_cuda = next(c for c in componentes 
+                                   if c.nombre == ComponentesGPUPredefinidos.NUCLEOS_CUDA)
+                resultado_tiempo = self.calcular_tiempo.execute(
+                    nucleos_cuda, 
+                    ConfiguracionGPUPar.TIEMPO_RENDERIZADO_ORIGINAL
+                )
+            
+            # 4. Determinar componente para 30% de aceleración
+            with tramo("resolver.objetivo"):
+                componente_30_porciento = self._encontrar_componente_para_aceleracion(
+                    componentes, 1.3  # 30% de aceleración = factor 1.3
+                )
+            
+            # 5. Generar gráficos A vs k para f=0.25 y f=0.35
+            with tramo("resolver.graficos"):
+                self.generar_graficos.graficar_a_vs_k([0.25, 0.35])
+            
+            # 6. Análisis comparativo
+            with tramo("resolver.analisis"):
+                analisis = self.analizar_componentes.determinar_mejor_optimizacion(componentes)
+            
+            with tramo("resolver.explicaciones"):
+                explicacion_nvlink = self._explicar_limitacion_nvlink(componentes)
+                comparacion = self._comparar_texturizado_vs_vram(componentes)
         
         return {
             "resultados_aceleracion": resultados,
             "tiempo_nucleos_cuda": resultado_tiempo,
             "componente_30_porciento": componente_30_porciento,
             "analisis_comparativo": analisis,
-            "explicacion_nvlink": self._explicar_limitacion_nvlink(componentes),
-            "comparacion_texturizado_vs_vram": self._comparar_texturizado_vs_vram(componentes)
+            "explicacion_nvlink": explicacion_nvlink,
+            "comparacion_texturizado_vs_vram": comparacion
         }
     
     def _encontrar_componente_para_aceleracion(
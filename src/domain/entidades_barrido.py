@@ -0,0 +1,50 @@
+"""
+Entidades de los barridos de grillas f × k
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from .entities import ComponenteGPU
+
+
+@dataclass
+class DefinicionBarrido:
+    # Grilla f × k a evaluar; con componentes_base, (f, k) se suma a ese paquete
+    porcentajes_mejora: Any                  # Eje f (arreglo 1D)
+    factores_mejora: Any                     # Eje k (arreglo 1D)
+    componentes_base: List[ComponenteGPU] = field(default_factory=list)
+    umbrales: List[float] = field(default_factory=list)
+    materializar: bool = False               # Devolver la grilla completa de aceleraciones
+    archivo_salida: Optional[str] = None     # Escribir la grilla en este .npy (memmap) en vez de RAM
+    
+    @property
+    def puntos(self) -> int:
+        return len(self.porcentajes_mejora) * len(self.factores_mejora)
+
+
+@dataclass
+class ResultadoBarrido:
+    puntos: int
+    puntos_validos: int
+    aceleracion_maxima: float
+    indice_maximo: Optional[Tuple[int, int]]   # (índice f, índice k); None si no hay válidos
+    conteos_umbral: Dict[float, int]           # Puntos con A >= umbral
+    segundos: float
+    aceleraciones: Optional[Any] = None        # Grilla (f, k) si se pidió materializar o archivo
+
+
+@dataclass
+class GrillaBarrido:
+    # Grilla de aceleraciones ya calculada (p. ej. un memmap abierto desde disco)
+    porcentajes_mejora: Any                    # Eje f (arreglo 1D)
+    factores_mejora: Any                       # Eje k (arreglo 1D)
+    aceleraciones: Any                         # (f, k); NaN en puntos inválidos
+    componentes_base: List[ComponenteGPU] = field(default_factory=list)
+
+
+class IEjecutorBarrido(ABC):
+    """Interface para evaluar grandes grillas de parámetros"""
+    
+    @abstractmethod
+    def ejecutar(self, definicion: DefinicionBarrido) -> ResultadoBarrido:
+        pass
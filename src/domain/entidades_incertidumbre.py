@@ -0,0 +1,151 @@
+"""
+Entidades de la propagación de incertidumbre (Monte Carlo): distribuciones
+de f y k, componentes inciertos y sus resultados
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+from .entities import ComponenteGPU
+from .value_objects import TiposDistribucion
+
+
+@dataclass
+class DistribucionParametro:
+    # Incertidumbre de f o k; ver TiposDistribucion para el significado de `parametros`
+    tipo: str
+    parametros: Tuple[float, ...]
+    
+    def __post_init__(self):
+        if self.tipo not in TiposDistribucion.obtener_todos():
+            raise ValueError(
+                f"Tipo de distribución no soportado: '{self.tipo}'. "
+                f"Use uno de: {', '.join(TiposDistribucion.obtener_todos())}"
+            )
+        self.parametros = tuple(float(p) for p in self.parametros)
+        if self.tipo == TiposDistribucion.FIJA and len(self.parametros) != 1:
+            raise ValueError("Una distribución fija requiere exactamente un valor")
+        if self.tipo == TiposDistribucion.NORMAL and (
+            len(self.parametros) != 2 or self.parametros[1] < 0
+        ):
+            raise ValueError("Una distribución normal requiere (media, desviación >= 0)")
+        if self.tipo == TiposDistribucion.UNIFORME and (
+            len(self.parametros) != 2 or self.parametros[0] > self.parametros[1]
+        ):
+            raise ValueError("Una distribución uniforme requiere (mínimo, máximo) con mínimo <= máximo")
+        if self.tipo == TiposDistribucion.EMPIRICA and not self.parametros:
+            raise ValueError("Una distribución empírica requiere al menos una muestra")
+    
+    @classmethod
+    def fija(cls, valor: float) -> "DistribucionParametro":
+        return cls(TiposDistribucion.FIJA, (valor,))
+    
+    @classmethod
+    def normal(cls, media: float, desviacion: float) -> "DistribucionParametro":
+        return cls(TiposDistribucion.NORMAL, (media, desviacion))
+    
+    @classmethod
+    def uniforme(cls, minimo: float, maximo: float) -> "DistribucionParametro":
+        return cls(TiposDistribucion.UNIFORME, (minimo, maximo))
+    
+    @classmethod
+    def empirica(cls, muestras: Sequence[float]) -> "DistribucionParametro":
+        return cls(TiposDistribucion.EMPIRICA, tuple(muestras))
+    
+    @property
+    def soporte(self) -> Tuple[float, float]:
+        # Valores extremos que puede tomar (la normal se describe por su media)
+        if self.tipo == TiposDistribucion.NORMAL:
+            return self.parametros[0], self.parametros[0]
+        return min(self.parametros), max(self.parametros)
+
+
+@dataclass
+class ComponenteIncierto:
+    # Componente cuyos f y k son distribuciones en vez de estimaciones puntuales
+    nombre: str
+    porcentaje_mejora: DistribucionParametro
+    factor_mejora: DistribucionParametro
+    
+    def __post_init__(self):
+        minimo_f, maximo_f = self.porcentaje_mejora.soporte
+        if not 0 <= minimo_f <= maximo_f <= 1:
+            raise ValueError(
+                f"'{self.nombre}': el porcentaje de mejora debe estar entre 0 y 1"
+            )
+        if self.factor_mejora.soporte[0] <= 1:
+            raise ValueError(f"'{self.nombre}': el factor de mejora debe ser mayor a 1")
+    
+    @classmethod
+    def desde_componente(
+        cls, 
+        componente: ComponenteGPU, 
+        error_porcentaje: float = 0.0, 
+        error_factor: float = 0.0
+    ) -> "ComponenteIncierto":
+        """Normales centradas en los valores puntuales, con esos desvíos (0 = fijo)"""
+        def distribucion(valor: float, error: float) -> DistribucionParametro:
+            if error:
+                return DistribucionParametro.normal(valor, error)
+            return DistribucionParametro.fija(valor)
+        
+        return cls(
+            nombre=componente.nombre,
+            porcentaje_mejora=distribucion(componente.porcentaje_mejora, error_porcentaje),
+            factor_mejora=distribucion(componente.factor_mejora, error_factor)
+        )
+
+
+@dataclass
+class ResumenDistribucion:
+    media: float
+    desviacion: float
+    percentiles: Dict[float, float]   # percentil (0-100) → valor
+
+
+@dataclass
+class ResultadoMonteCarlo:
+    nombre: str
+    muestras: int
+    muestras_validas: int                              # Sin las que quedaron fuera del dominio
+    aceleracion: ResumenDistribucion
+    tiempo_optimizado: Optional[ResumenDistribucion] = None
+    probabilidad_objetivo: Optional[float] = None      # P(A >= aceleración objetivo)
+    probabilidad_mejor: Optional[float] = None         # P(mayor A en la misma muestra)
+
+
+@dataclass
+class AnalisisProbabilistico:
+    resultados: List[ResultadoMonteCarlo]
+    mejor_componente: Optional[ComponenteIncierto]
+    criterio: str                    # 'probabilidad_mejor', 'media' o 'probabilidad_objetivo'
+    
+    def obtener_ranking(self) -> List[tuple]:
+        # (nombre, valor del criterio) de mayor a menor
+        ranking = [(r.nombre, self.valor_criterio(r)) for r in self.resultados]
+        return sorted(ranking, key=lambda par: _clave_ordenable(par[1]), reverse=True)
+    
+    def valor_criterio(self, resultado: ResultadoMonteCarlo) -> Optional[float]:
+        if self.criterio == "media":
+            return resultado.aceleracion.media
+        return getattr(resultado, self.criterio)
+
+
+def _clave_ordenable(valor: Optional[float]) -> float:
+    # None y NaN (sin muestras válidas) quedan al final del ranking
+    return valor if valor is not None and valor == valor else float('-inf')
+
+
+class ISimuladorIncertidumbre(ABC):
+    """Interface para propagar la incertidumbre de f y k a la aceleración"""
+    
+    @abstractmethod
+    def simular(
+        self, 
+        componentes: Sequence[ComponenteIncierto], 
+        muestras: int = 100_000,
+        semilla: Optional[int] = None,
+        tiempo_original: Optional[float] = None,
+        aceleracion_objetivo: Optional[float] = None,
+        percentiles: Sequence[float] = (5, 50, 95)
+    ) -> List[ResultadoMonteCarlo]:
+        pass
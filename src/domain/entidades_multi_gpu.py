@@ -0,0 +1,85 @@
+"""
+Entidades del modelo de escalamiento a varias GPUs con costo de comunicación
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+from .value_objects import ConfiguracionInterconexion
+
+
+@dataclass
+class Interconexion:
+    # Enlace entre GPUs del modelo multi-GPU (modelo α-β: latencia + bytes/ancho de banda)
+    nombre: str
+    ancho_banda_gbs: float   # GB/s por GPU, en un sentido
+    latencia_us: float       # Latencia por mensaje en microsegundos
+    
+    def __post_init__(self):
+        if self.ancho_banda_gbs <= 0:
+            raise ValueError("El ancho de banda debe ser mayor a 0")
+        if self.latencia_us < 0:
+            raise ValueError("La latencia no puede ser negativa")
+    
+    @classmethod
+    def tipo_nvlink(cls) -> "Interconexion":
+        return cls(
+            "Tipo NVLink",
+            ConfiguracionInterconexion.NVLINK_ANCHO_BANDA_GBS,
+            ConfiguracionInterconexion.NVLINK_LATENCIA_US
+        )
+    
+    @classmethod
+    def tipo_pcie(cls) -> "Interconexion":
+        return cls(
+            "Tipo PCIe",
+            ConfiguracionInterconexion.PCIE_ANCHO_BANDA_GBS,
+            ConfiguracionInterconexion.PCIE_LATENCIA_US
+        )
+
+
+@dataclass
+class ResultadoEscalamientoMultiGPU:
+    # Arreglos con la forma del broadcasting de (dispositivos, f, mensaje, tiempo base)
+    aceleracion: Any
+    eficiencia: Any               # Aceleración / dispositivos
+    tiempo: Any                   # Tiempo por paso en ms
+    tiempo_comunicacion: Any      # Parte del tiempo por paso dedicada a comunicar, en ms
+    validos: Any
+
+
+@dataclass
+class DispositivosOptimos:
+    # Por perfil: número de GPUs a partir del cual agregar otra deja de convenir
+    dispositivos: Any             # Arreglo de enteros
+    aceleracion: Any
+    eficiencia: Any
+    tiempo: Any
+    validos: Any
+    
+    def __len__(self) -> int:
+        return len(self.dispositivos)
+
+
+class IModeloMultiGPU(ABC):
+    """Interface para modelar el escalamiento a N GPUs con costo de comunicación"""
+    
+    @abstractmethod
+    def calcular_lote(
+        self, 
+        dispositivos: Any, 
+        porcentajes_paralelos: Any,
+        tamanos_mensaje: Any,
+        tiempo_base: Any
+    ) -> ResultadoEscalamientoMultiGPU:
+        pass
+    
+    @abstractmethod
+    def calcular_dispositivos_optimos(
+        self, 
+        porcentajes_paralelos: Any,
+        tamanos_mensaje: Any,
+        tiempo_base: Any,
+        max_dispositivos: int = ConfiguracionInterconexion.MAX_DISPOSITIVOS,
+        ganancia_minima: float = ConfiguracionInterconexion.GANANCIA_MINIMA
+    ) -> DispositivosOptimos:
+        pass
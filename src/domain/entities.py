@@ -1,6 +1,10 @@
-from dataclasses import dataclass
-from typing import Dict, List
+import heapq
+import importlib
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 from abc import ABC, abstractmethod
+from .value_objects import ConstantesMatematicas, ModelosEscalamiento
 
 
 @dataclass
@@ -16,6 +20,42 @@ class ComponenteGPU:
             raise ValueError("El factor de mejora debe ser mayor a 1")
 
 
+@dataclass
+class PaqueteMejoras:
+    # Conjunto de componentes optimizados simultáneamente (fracciones disjuntas)
+    nombre: str
+    componentes: List[ComponenteGPU]
+    
+    def __post_init__(self):
+        if not self.componentes:
+            raise ValueError("El paquete debe incluir al menos un componente")
+        nombres = [c.nombre for c in self.componentes]
+        if len(set(nombres)) != len(nombres):
+            raise ValueError("Un componente no puede repetirse dentro del paquete")
+        if self.fraccion_total > 1 + ConstantesMatematicas.TOLERANCIA_FRACCION:
+            raise ValueError(
+                "La suma de las fracciones mejorables del paquete no puede superar 1"
+            )
+    
+    @property
+    def fraccion_total(self) -> float:
+        return sum(c.porcentaje_mejora for c in self.componentes)
+
+
+@dataclass
+class OpcionMejora:
+    # Un nivel de mejora comprable: el componente (con su k), su costo y su riesgo
+    componente: ComponenteGPU
+    costo: float
+    riesgo: float = 0.0   # Puntaje de riesgo/esfuerzo (aditivo en los paquetes)
+    
+    def __post_init__(self):
+        if self.costo < 0:
+            raise ValueError("El costo de la mejora no puede ser negativo")
+        if self.riesgo < 0:
+            raise ValueError("El riesgo de la mejora no puede ser negativo")
+
+
 @dataclass
 class ResultadoAmdahl:
     componente: ComponenteGPU
@@ -32,22 +72,184 @@ class ResultadoAmdahl:
             )
 
 
+@dataclass
+class ResultadoPaquete:
+    paquete: PaqueteMejoras
+    aceleracion: float
+    limite_teorico: float
+
+
+@dataclass
+class PlanMejoras:
+    opciones: List[OpcionMejora]       # Como máximo un nivel por componente
+    paquete: Optional[PaqueteMejoras]  # None si ninguna mejora cabe en el presupuesto
+    aceleracion: float
+    costo_total: float
+    presupuesto: float
+
+
+@dataclass
+class ResultadoLoteAmdahl:
+    # Arreglos numpy alineados elemento a elemento con las entradas (f, k)
+    aceleracion: Any
+    limite_teorico: Any
+    validos: Any              # Máscara booleana: True si (f, k) es válido
+    tiempo_optimizado: Optional[Any] = None
+    
+    def __len__(self) -> int:
+        return len(self.aceleracion)
+
+
+@dataclass
+class FronteraPareto:
+    # Todos los candidatos evaluados (arreglos alineados) y los no dominados
+    aceleracion: Any
+    costo: Any
+    riesgo: Optional[Any]     # None si la frontera es solo aceleración vs costo
+    indices: Any              # Candidatos no dominados, de menor a mayor costo
+    nombres: List[str]        # Nombres de los candidatos de `indices`, en ese orden
+    
+    def __len__(self) -> int:
+        return len(self.indices)
+    
+    def puntos(self) -> List[tuple]:
+        # (nombre, aceleración, costo[, riesgo]) de cada punto de la frontera
+        columnas = [
+            self.nombres,
+            self.aceleracion[self.indices].tolist(),
+            self.costo[self.indices].tolist()
+        ]
+        if self.riesgo is not None:
+            columnas.append(self.riesgo[self.indices].tolist())
+        return list(zip(*columnas))
+
+
+@dataclass
+class ResultadoSensibilidades:
+    # Derivadas parciales y elasticidades de A, alineadas con las entradas (f, k)
+    aceleracion: Any
+    derivada_f: Any           # ∂A/∂f
+    derivada_k: Any           # ∂A/∂k
+    elasticidad_f: Any        # (∂A/∂f)·f/A: % de cambio en A por 1% de cambio en f
+    elasticidad_k: Any        # (∂A/∂k)·k/A
+    validos: Any
+    
+    def __len__(self) -> int:
+        return len(self.aceleracion)
+
+
+@dataclass
+class BloqueComponentes:
+    # Bloque de filas (nombre, f, k) leído de un inventario en streaming
+    nombres: List[str]
+    porcentajes_mejora: Any   # Arreglo numpy de f (NaN si el valor no es numérico)
+    factores_mejora: Any      # Arreglo numpy de k
+    
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+
+@dataclass
+class ResumenProcesamientoLote:
+    filas: int
+    filas_validas: int
+    bloques: int
+    segundos: float
+    
+    @property
+    def filas_por_segundo(self) -> float:
+        return self.filas / self.segundos if self.segundos > 0 else float('inf')
+
+
 @dataclass
 class AnalisisComparativo:
-    resultados: List[ResultadoAmdahl]
-    mejor_componente: ComponenteGPU
-    justificacion: str
+    resultados: Sequence[ResultadoAmdahl]   # Lista o TablaResultados (columnar)
+    mejor_componente: Optional[ComponenteGPU]
+    # Texto ya redactado (tercer argumento, como antes), o None para redactarlo
+    # con `redactor` al primer acceso a `justificacion`; no cuenta para ==
+    _justificacion: Optional[str] = field(default=None, repr=False, compare=False)
+    # Genera el reporte línea a línea; recibe el máximo de comparaciones (None = todas)
+    redactor: Optional[Callable[[Optional[int]], Iterator[str]]] = field(
+        default=None, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        if self._justificacion is None and self.redactor is None:
+            raise ValueError("Se requiere la justificación o un redactor que la genere")
+    
+    @property
+    def justificacion(self) -> str:
+        # Se redacta al primer acceso; quien no la lee no paga su costo
+        if self._justificacion is None:
+            self._justificacion = "".join(self.redactor(None))
+        return self._justificacion
+    
+    def lineas_justificacion(self, max_comparaciones: Optional[int] = None) -> Iterator[str]:
+        if self.redactor is None:
+            return iter((self.justificacion,))
+        return self.redactor(max_comparaciones)
+    
+    def resumir_justificacion(self, max_comparaciones: int) -> str:
+        # Sin redactor solo se tiene el texto completo
+        return "".join(self.lineas_justificacion(max_comparaciones))
     
     def obtener_ranking(self) -> List[tuple]:
-        return sorted(
-            [(r.componente.nombre, r.aceleracion) for r in self.resultados],
-            key=lambda x: x[1],
-            reverse=True
-        )
+        return self.filtrar_y_rankear()
+    
+    def top_k(self, n: int) -> List[tuple]:
+        return self.filtrar_y_rankear(n=n)
+    
+    def filtrar_y_rankear(
+        self, 
+        aceleracion_minima: Optional[float] = None, 
+        n: Optional[int] = None
+    ) -> List[tuple]:
+        """
+        (nombre, aceleración) de los `n` mejores con A >= aceleracion_minima,
+        de mayor a menor. Las aceleraciones ya calculadas son la clave: con
+        una TablaResultados se usa selección parcial sobre sus columnas; con
+        una lista, un heap de tamaño n.
+        """
+        from .tablas import TablaResultados, indices_ranking
+        
+        if isinstance(self.resultados, TablaResultados):
+            tabla = self.resultados
+            indices = indices_ranking(
+                tabla.aceleracion, tabla.validos, n=n, minimo=aceleracion_minima
+            ).tolist()
+            aceleraciones = tabla.aceleracion[indices].tolist()
+            nombres = tabla.componentes.catalogo.nombres
+            ids = tabla.componentes.ids_nombre[indices].tolist()
+            return [(nombres[i], a) for i, a in zip(ids, aceleraciones)]
+        
+        ranking = [(r.componente.nombre, r.aceleracion) for r in self.resultados]
+        if aceleracion_minima is not None:
+            ranking = [par for par in ranking if par[1] >= aceleracion_minima]
+        if n is None or n >= len(ranking):
+            return sorted(ranking, key=itemgetter(1), reverse=True)
+        return heapq.nlargest(max(n, 0), ranking, key=itemgetter(1))
+
+
+@dataclass
+class RegistroTramo:
+    # Un tramo medido: nombre, inicio (perf_counter) y duración en segundos
+    nombre: str
+    inicio: float
+    duracion: float
+    profundidad: int = 0
+    padre: Optional[str] = None
+    atributos: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
 
 
 class ICalculadorAmdahl(ABC):
-    """Interface para el calculador de Ley de Amdahl"""
+    """
+    Interface para el calculador de Ley de Amdahl.
+    
+    Solo los métodos escalares son abstractos: los de lote tienen una
+    implementación por defecto, para que los calculadores existentes sigan
+    siendo instanciables.
+    """
     
     @abstractmethod
     def calcular_aceleracion(self, componente: ComponenteGPU) -> float:
@@ -64,6 +266,236 @@ class ICalculadorAmdahl(ABC):
         aceleracion: float
     ) -> float:
         pass
+    
+    def calcular_lote(
+        self, 
+        porcentajes_mejora: Any, 
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        """
+        Implementación por defecto, elemento a elemento sobre la API escalar,
+        para calculadores que no definen una versión vectorizada (como la de
+        CalculadorAmdahl). Mismo contrato: broadcasting entre las entradas,
+        NaN y validos=False en los pares inválidos. Los valores conservan el
+        redondeo de calcular_aceleracion aunque decimales sea None.
+        """
+        import numpy as np
+        
+        f, k = np.broadcast_arrays(
+            np.asarray(porcentajes_mejora, dtype=np.float64),
+            np.asarray(factores_mejora, dtype=np.float64)
+        )
+        validos = (f >= 0) & (f <= 1) & (k > 1)
+        aceleracion = np.full(f.shape, np.nan)
+        limite_teorico = np.full(f.shape, np.nan)
+        
+        for i in np.flatnonzero(validos):
+            componente = ComponenteGPU("", float(f.flat[i]), float(k.flat[i]))
+            aceleracion.flat[i] = self.calcular_aceleracion(componente)
+            limite_teorico.flat[i] = (
+                self.calcular_limite_teorico(componente) if f.flat[i] < 1 else np.inf
+            )
+        
+        return _resultado_lote(aceleracion, limite_teorico, validos, tiempo_original, decimales)
+    
+    def calcular_factor_necesario_lote(
+        self, 
+        porcentajes_mejora: Any, 
+        aceleraciones_objetivo: Any,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> Any:
+        """
+        k necesario para alcanzar cada aceleración objetivo dada f (con broadcasting).
+        
+        k = f / (1/A - (1 - f)). Devuelve inf si el objetivo no es alcanzable
+        (A >= 1/(1-f)) y NaN si la entrada es inválida (f fuera de [0, 1] o A <= 1).
+        Es la inversa en forma cerrada de la Ley de Amdahl: la API escalar no
+        alcanza para invertir el modelo de otro calculador.
+        """
+        import numpy as np
+        
+        f, objetivo = np.broadcast_arrays(
+            np.asarray(porcentajes_mejora, dtype=np.float64),
+            np.asarray(aceleraciones_objetivo, dtype=np.float64)
+        )
+        validos = (f >= 0) & (f <= 1) & (objetivo > 1)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            denominador = 1.0 / objetivo - (1.0 - f)
+            k_necesario = np.where(denominador > 0, f / denominador, np.inf)
+        k_necesario = np.where(validos, k_necesario, np.nan)
+        
+        return k_necesario if decimales is None else np.round(k_necesario, decimales)
+    
+    def calcular_porcentaje_necesario_lote(
+        self, 
+        factores_mejora: Any, 
+        aceleraciones_objetivo: Any,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> Any:
+        """
+        f necesaria para alcanzar cada aceleración objetivo dado k (con broadcasting).
+        
+        f = (1 - 1/A) / (1 - 1/k). Devuelve inf si haría falta f > 1 y NaN si
+        la entrada es inválida (k <= 1 o A < 1). Forma cerrada, como
+        calcular_factor_necesario_lote.
+        """
+        import numpy as np
+        
+        k, objetivo = np.broadcast_arrays(
+            np.asarray(factores_mejora, dtype=np.float64),
+            np.asarray(aceleraciones_objetivo, dtype=np.float64)
+        )
+        validos = (k > 1) & (objetivo >= 1)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f_necesario = (1.0 - 1.0 / objetivo) / (1.0 - 1.0 / k)
+        f_necesario = np.where(f_necesario <= 1, f_necesario, np.inf)
+        f_necesario = np.where(validos, f_necesario, np.nan)
+        
+        return f_necesario if decimales is None else np.round(f_necesario, decimales)
+    
+    def calcular_aceleracion_combinada(self, paquete: PaqueteMejoras) -> float:
+        """
+        Por defecto, a partir de la aceleración escalar de cada componente:
+        con fracciones disjuntas, cada uno deja 1/A_i del tiempo de su parte,
+        así que A = 1 / (1 - Σ(1 - 1/A_i)). Hereda el redondeo de A_i.
+        """
+        ahorro = sum(1 - 1 / self.calcular_aceleracion(c) for c in paquete.componentes)
+        return round(1 / max(1 - ahorro, 0), ConstantesMatematicas.PRECISION_DECIMAL)
+    
+    def calcular_lote_combinado(
+        self, 
+        porcentajes_mejora: Any, 
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        """
+        Implementación por defecto, paquete a paquete sobre
+        calcular_aceleracion_combinada. Mismo contrato que la vectorizada de
+        CalculadorAmdahl: el último eje son los componentes (f=0 es relleno)
+        y un paquete es inválido si algún componente lo es o si Σf > 1.
+        """
+        import numpy as np
+        
+        f, k = np.broadcast_arrays(
+            np.asarray(porcentajes_mejora, dtype=np.float64),
+            np.asarray(factores_mejora, dtype=np.float64)
+        )
+        relleno = f == 0
+        fraccion_total = f.sum(axis=-1)
+        validos = np.all(((f >= 0) & (f <= 1) & (k > 1)) | relleno, axis=-1)
+        validos &= fraccion_total <= 1 + ConstantesMatematicas.TOLERANCIA_FRACCION
+        aceleracion = np.full(validos.shape, np.nan)
+        limite_teorico = np.full(validos.shape, np.nan)
+        
+        for i in zip(*np.nonzero(validos)):
+            componentes = [
+                ComponenteGPU(str(j), float(fj), float(kj))
+                for j, (fj, kj) in enumerate(zip(f[i], k[i])) if fj != 0
+            ]
+            aceleracion[i] = (
+                self.calcular_aceleracion_combinada(PaqueteMejoras("", componentes))
+                if componentes else 1.0
+            )
+            limite_teorico[i] = _limite_amdahl(min(float(fraccion_total[i]), 1.0))
+        
+        return _resultado_lote(aceleracion, limite_teorico, validos, tiempo_original, decimales)
+
+
+def _limite_amdahl(fraccion: float) -> float:
+    return 1 / (1 - fraccion) if fraccion < 1 else float('inf')
+
+
+def _resultado_lote(
+    aceleracion: Any,
+    limite_teorico: Any,
+    validos: Any,
+    tiempo_original: Optional[Any],
+    decimales: Optional[int]
+) -> ResultadoLoteAmdahl:
+    # Tiempo optimizado y redondeo de las implementaciones por defecto de lote
+    import numpy as np
+    
+    tiempo_optimizado = None
+    if tiempo_original is not None:
+        tiempo_optimizado = np.asarray(tiempo_original, dtype=np.float64) / aceleracion
+    if decimales is not None:
+        aceleracion = np.round(aceleracion, decimales)
+        limite_teorico = np.round(limite_teorico, decimales)
+        if tiempo_optimizado is not None:
+            tiempo_optimizado = np.round(tiempo_optimizado, decimales)
+    
+    return ResultadoLoteAmdahl(
+        aceleracion=aceleracion,
+        limite_teorico=limite_teorico,
+        validos=validos,
+        tiempo_optimizado=tiempo_optimizado
+    )
+
+
+class ICalculadorGustafson(ABC):
+    """
+    Interface para la aceleración escalada (Ley de Gustafson) y el modo
+    mixto entre escalamiento fuerte (Amdahl) y débil (Gustafson)
+    """
+    
+    @abstractmethod
+    def calcular_aceleracion_escalada(self, componente: ComponenteGPU) -> float:
+        pass
+    
+    @abstractmethod
+    def calcular_lote_escalado(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        pass
+    
+    @abstractmethod
+    def calcular_lote_mixto(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        escalamiento: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        pass
+    
+    @abstractmethod
+    def calcular_factor_necesario_escalado_lote(
+        self,
+        porcentajes_mejora: Any,
+        aceleraciones_objetivo: Any,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> Any:
+        pass
+    
+    @abstractmethod
+    def calcular_lote_combinado_escalado(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        pass
+
+
+def como_calculador_gustafson(calculador: ICalculadorAmdahl) -> ICalculadorGustafson:
+    # Los modelos distintos de Amdahl requieren esta interface: error claro si falta
+    if not isinstance(calculador, ICalculadorGustafson):
+        raise TypeError(
+            f"{type(calculador).__name__} no implementa ICalculadorGustafson: "
+            f"solo admite el modelo de Amdahl"
+        )
+    return calculador
 
 
 class IVisualizador(ABC):
@@ -91,13 +523,88 @@ class IAnalizador(ABC):
     @abstractmethod
     def determinar_mejor_componente(
         self, 
-        componentes: List[ComponenteGPU]
+        componentes: Sequence[ComponenteGPU],
+        escalamiento: float = ModelosEscalamiento.AMDAHL
     ) -> AnalisisComparativo:
         pass
     
     @abstractmethod
     def analizar_ultimos_tres(
         self, 
-        componentes: List[ComponenteGPU]
+        componentes: Sequence[ComponenteGPU]
     ) -> AnalisisComparativo:
         pass
+
+
+class IOptimizadorMejoras(ABC):
+    """
+    Interface para elegir combinaciones de mejoras: ranking de paquetes y
+    planes dentro de un presupuesto (aparte de IAnalizador, cuyos
+    implementadores no tienen por qué ofrecerlas)
+    """
+    
+    @abstractmethod
+    def rankear_paquetes(
+        self, 
+        paquetes: List[PaqueteMejoras]
+    ) -> List[ResultadoPaquete]:
+        pass
+    
+    @abstractmethod
+    def optimizar_presupuesto(
+        self, 
+        opciones: List[OpcionMejora], 
+        presupuesto: float,
+        unidad_costo: float = 1.0
+    ) -> PlanMejoras:
+        pass
+
+
+class IRepositorioComponentes(ABC):
+    """Interface para obtener catálogos de componentes (archivo de configuración, inventarios)"""
+    
+    @abstractmethod
+    def cargar(self) -> Sequence[ComponenteGPU]:
+        pass
+
+
+class ISumideroTramos(ABC):
+    """Interface para recibir los tramos medidos por la instrumentación"""
+    
+    @abstractmethod
+    def registrar(self, tramo: RegistroTramo) -> None:
+        pass
+
+
+# Entidades de funcionalidades opcionales: viven en módulos propios y se cargan
+# al primer acceso (PEP 562), así importar el dominio no crea sus dataclasses.
+# `from src.domain.entities import ComponenteIncierto` sigue funcionando.
+_ENTIDADES_DIFERIDAS = {
+    "DistribucionParametro": "entidades_incertidumbre",
+    "ComponenteIncierto": "entidades_incertidumbre",
+    "ResumenDistribucion": "entidades_incertidumbre",
+    "ResultadoMonteCarlo": "entidades_incertidumbre",
+    "AnalisisProbabilistico": "entidades_incertidumbre",
+    "ISimuladorIncertidumbre": "entidades_incertidumbre",
+    "DefinicionBarrido": "entidades_barrido",
+    "ResultadoBarrido": "entidades_barrido",
+    "GrillaBarrido": "entidades_barrido",
+    "IEjecutorBarrido": "entidades_barrido",
+    "Interconexion": "entidades_multi_gpu",
+    "ResultadoEscalamientoMultiGPU": "entidades_multi_gpu",
+    "DispositivosOptimos": "entidades_multi_gpu",
+    "IModeloMultiGPU": "entidades_multi_gpu",
+}
+
+
+def __getattr__(nombre: str) -> Any:
+    modulo = _ENTIDADES_DIFERIDAS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{modulo}", __package__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_ENTIDADES_DIFERIDAS))
@@ -0,0 +1,338 @@
+"""
+Almacenamiento columnar (estructura de arreglos) para millones de componentes
+"""
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from dataclasses import InitVar, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from .entities import ComponenteGPU, ResultadoAmdahl, ResultadoLoteAmdahl
+from ..importacion_diferida import importar_diferido
+
+
+np = importar_diferido("numpy")
+
+
+@dataclass
+class CatalogoNombres:
+    # Cada nombre distinto se guarda una sola vez; las tablas guardan su id (int32)
+    nombres: List[str] = field(default_factory=list)
+    # False solo para nombres ya verificados (p. ej. un catálogo compilado): el índice se arma al usarlo
+    validar: InitVar[bool] = True
+    _ids: Optional[Dict[str, int]] = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self, validar: bool):
+        if validar:
+            self._indexar()
+    
+    def obtener_id(self, nombre: str) -> int:
+        ids = self._ids if self._ids is not None else self._indexar()
+        id_nombre = ids.get(nombre)
+        if id_nombre is None:
+            id_nombre = ids[nombre] = len(self.nombres)
+            self.nombres.append(nombre)
+        return id_nombre
+    
+    def obtener_ids(self, nombres: Iterable[str], cantidad: int = -1) -> np.ndarray:
+        return np.fromiter(
+            (self.obtener_id(n) for n in nombres), dtype=np.int32, count=cantidad
+        )
+    
+    def __len__(self) -> int:
+        return len(self.nombres)
+    
+    def _indexar(self) -> Dict[str, int]:
+        self._ids = dict(zip(self.nombres, range(len(self.nombres))))
+        if len(self._ids) != len(self.nombres):
+            raise ValueError("El catálogo no puede contener nombres repetidos")
+        return self._ids
+
+
+@dataclass(eq=False)
+class TablaComponentes:
+    """
+    Componentes como columnas numpy alineadas: id de nombre, f y k.
+    
+    Indexar con un entero devuelve un ComponenteGPU; con un slice devuelve
+    otra tabla que es una vista (sin copia) de estas columnas, y con una
+    máscara o un arreglo de índices una tabla nueva (copia, como en numpy).
+    Los valores no se validan fila a fila: las filas inválidas se detectan
+    con `validos` o al convertirlas a ComponenteGPU.
+    """
+    ids_nombre: np.ndarray
+    porcentajes_mejora: np.ndarray
+    factores_mejora: np.ndarray
+    catalogo: CatalogoNombres = field(default_factory=CatalogoNombres)
+    
+    def __post_init__(self):
+        self.ids_nombre = np.asarray(self.ids_nombre, dtype=np.int32)
+        self.porcentajes_mejora = np.asarray(self.porcentajes_mejora, dtype=np.float64)
+        self.factores_mejora = np.asarray(self.factores_mejora, dtype=np.float64)
+        
+        formas = {self.ids_nombre.shape, self.porcentajes_mejora.shape, self.factores_mejora.shape}
+        if len(formas) != 1 or self.ids_nombre.ndim != 1:
+            raise ValueError("Las columnas de la tabla deben ser 1D y del mismo largo")
+    
+    @classmethod
+    def desde_componentes(
+        cls,
+        componentes: Sequence[ComponenteGPU],
+        catalogo: Optional[CatalogoNombres] = None
+    ) -> "TablaComponentes":
+        catalogo = catalogo if catalogo is not None else CatalogoNombres()
+        n = len(componentes)
+        return cls(
+            ids_nombre=catalogo.obtener_ids((c.nombre for c in componentes), n),
+            porcentajes_mejora=np.fromiter(
+                (c.porcentaje_mejora for c in componentes), dtype=np.float64, count=n
+            ),
+            factores_mejora=np.fromiter(
+                (c.factor_mejora for c in componentes), dtype=np.float64, count=n
+            ),
+            catalogo=catalogo
+        )
+    
+    @classmethod
+    def desde_arreglos(
+        cls,
+        nombres: Sequence[str],
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        catalogo: Optional[CatalogoNombres] = None
+    ) -> "TablaComponentes":
+        # Las columnas f y k se usan sin copiar si ya son float64
+        catalogo = catalogo if catalogo is not None else CatalogoNombres()
+        return cls(
+            ids_nombre=catalogo.obtener_ids(nombres, len(nombres)),
+            porcentajes_mejora=porcentajes_mejora,
+            factores_mejora=factores_mejora,
+            catalogo=catalogo
+        )
+    
+    @property
+    def nombres(self) -> List[str]:
+        catalogo = self.catalogo.nombres
+        return [catalogo[i] for i in self.ids_nombre.tolist()]
+    
+    @property
+    def validos(self) -> np.ndarray:
+        f, k = self.porcentajes_mejora, self.factores_mejora
+        return (f >= 0) & (f <= 1) & (k > 1)
+    
+    def nombre(self, indice: int) -> str:
+        return self.catalogo.nombres[self.ids_nombre[indice]]
+    
+    def a_componentes(self) -> List[ComponenteGPU]:
+        return list(self)
+    
+    def __len__(self) -> int:
+        return len(self.ids_nombre)
+    
+    def __getitem__(self, indice: Any) -> Any:
+        if isinstance(indice, (int, np.integer)):
+            return ComponenteGPU(
+                self.nombre(indice),
+                float(self.porcentajes_mejora[indice]),
+                float(self.factores_mejora[indice])
+            )
+        return TablaComponentes(
+            ids_nombre=self.ids_nombre[indice],
+            porcentajes_mejora=self.porcentajes_mejora[indice],
+            factores_mejora=self.factores_mejora[indice],
+            catalogo=self.catalogo
+        )
+    
+    def __iter__(self) -> Iterator[ComponenteGPU]:
+        catalogo = self.catalogo.nombres
+        for id_nombre, f, k in zip(
+            self.ids_nombre.tolist(),
+            self.porcentajes_mejora.tolist(),
+            self.factores_mejora.tolist()
+        ):
+            yield ComponenteGPU(catalogo[id_nombre], f, k)
+
+
+@dataclass(eq=False)
+class TablaResultados:
+    """
+    Resultados alineados fila a fila con una TablaComponentes.
+    
+    Se comporta como una secuencia de ResultadoAmdahl (que se crean solo al
+    acceder a cada fila), con el mismo indexado por vistas que la tabla.
+    """
+    componentes: TablaComponentes
+    aceleracion: np.ndarray
+    limite_teorico: np.ndarray
+    validos: np.ndarray
+    tiempo_optimizado: Optional[np.ndarray] = None
+    
+    def __post_init__(self):
+        if not (len(self.componentes) == len(self.aceleracion)
+                == len(self.limite_teorico) == len(self.validos)):
+            raise ValueError("Las columnas de resultados deben alinearse con la tabla")
+    
+    @classmethod
+    def desde_lote(
+        cls,
+        componentes: TablaComponentes,
+        lote: ResultadoLoteAmdahl
+    ) -> "TablaResultados":
+        tiempo = lote.tiempo_optimizado
+        if tiempo is not None:
+            tiempo = np.broadcast_to(tiempo, lote.aceleracion.shape)
+        return cls(
+            componentes=componentes,
+            aceleracion=lote.aceleracion,
+            limite_teorico=lote.limite_teorico,
+            validos=lote.validos,
+            tiempo_optimizado=tiempo
+        )
+    
+    def a_resultados(self) -> List[ResultadoAmdahl]:
+        return list(self)
+    
+    def top_k(self, n: int) -> "TablaResultados":
+        return self[indices_ranking(self.aceleracion, self.validos, n=n)]
+    
+    def filtrar_y_rankear(
+        self,
+        aceleracion_minima: float,
+        n: Optional[int] = None
+    ) -> "TablaResultados":
+        return self[indices_ranking(
+            self.aceleracion, self.validos, n=n, minimo=aceleracion_minima
+        )]
+    
+    def __len__(self) -> int:
+        return len(self.aceleracion)
+    
+    def __getitem__(self, indice: Any) -> Any:
+        if isinstance(indice, (int, np.integer)):
+            return ResultadoAmdahl(
+                componente=self.componentes[indice],
+                aceleracion=float(self.aceleracion[indice]),
+                limite_teorico=float(self.limite_teorico[indice])
+            )
+        return TablaResultados(
+            componentes=self.componentes[indice],
+            aceleracion=self.aceleracion[indice],
+            limite_teorico=self.limite_teorico[indice],
+            validos=self.validos[indice],
+            tiempo_optimizado=(
+                None if self.tiempo_optimizado is None else self.tiempo_optimizado[indice]
+            )
+        )
+    
+    def __iter__(self) -> Iterator[ResultadoAmdahl]:
+        for componente, aceleracion, limite in zip(
+            self.componentes, self.aceleracion.tolist(), self.limite_teorico.tolist()
+        ):
+            yield ResultadoAmdahl(
+                componente=componente,
+                aceleracion=aceleracion,
+                limite_teorico=limite
+            )
+
+
+def indices_ranking(
+    aceleraciones: np.ndarray,
+    validos: Optional[np.ndarray] = None,
+    n: Optional[int] = None,
+    minimo: Optional[float] = None
+) -> np.ndarray:
+    """
+    Índices de las `n` mayores aceleraciones (las que superan `minimo`), de
+    mayor a menor y con empates en el orden original, como un sort estable.
+    
+    Con `n` se usa una selección parcial (np.partition): O(N) para elegir y
+    solo los `n` elegidos se ordenan, en lugar de ordenar los N candidatos.
+    """
+    aceleraciones = np.asarray(aceleraciones)
+    candidatos = ~np.isnan(aceleraciones)
+    if validos is not None:
+        candidatos &= validos
+    if minimo is not None:
+        candidatos &= aceleraciones >= minimo
+    
+    indices = np.flatnonzero(candidatos)
+    valores = aceleraciones[indices]
+    
+    if n is not None and n < indices.size:
+        if n <= 0:
+            return indices[:0]
+        # n-ésimo mayor valor; los empates en el corte favorecen al índice menor
+        corte = np.partition(valores, valores.size - n)[valores.size - n]
+        elegidos = np.concatenate((
+            np.flatnonzero(valores > corte), np.flatnonzero(valores == corte)
+        ))[:n]
+        indices, valores = indices[elegidos], valores[elegidos]
+    
+    return indices[np.lexsort((indices, -valores))]
+
+
+def indices_pareto(
+    aceleraciones: np.ndarray,
+    costos: np.ndarray,
+    riesgos: Optional[np.ndarray] = None,
+    validos: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Índices de los candidatos no dominados (frontera de Pareto), de menor a
+    mayor costo: ningún otro tiene mayor o igual aceleración con menor o
+    igual costo (y riesgo), siendo estrictamente mejor en algo. Los
+    candidatos repetidos (mismos valores) se conservan todos. NaN no compite.
+    
+    Tras ordenar (O(n log n)), en 2D basta un máximo acumulado vectorizado;
+    en 3D se recorre manteniendo la escalera (riesgo → mejor aceleración) de
+    los ya vistos, con búsqueda binaria en cada paso.
+    """
+    aceleraciones = np.asarray(aceleraciones, dtype=np.float64)
+    costos = np.asarray(costos, dtype=np.float64)
+    candidatos = ~(np.isnan(aceleraciones) | np.isnan(costos))
+    if riesgos is not None:
+        riesgos = np.asarray(riesgos, dtype=np.float64)
+        candidatos &= ~np.isnan(riesgos)
+    if validos is not None:
+        candidatos &= validos
+    
+    indices = np.flatnonzero(candidatos)
+    if indices.size == 0:
+        return indices
+    a, c = aceleraciones[indices], costos[indices]
+    
+    if riesgos is None:
+        # Por costo ascendente y, a igual costo, mayor aceleración primero
+        orden = np.lexsort((-a, c))
+        a, c = a[orden], c[orden]
+        inicio_grupo = np.concatenate(([True], c[1:] != c[:-1]))
+        posicion = np.arange(a.size)
+        inicio = np.maximum.accumulate(np.where(inicio_grupo, posicion, 0))
+        # Máximo de los grupos más baratos (el primero de cada grupo es su máximo)
+        previos = np.concatenate(([-np.inf], np.maximum.accumulate(a)[:-1]))
+        no_dominados = (a == a[inicio]) & (a > previos[inicio])
+        return indices[orden[no_dominados]]
+    
+    r = riesgos[indices]
+    orden = np.lexsort((-a, r, c))
+    escalera_r: List[float] = []   # Riesgos ascendentes
+    escalera_a: List[float] = []   # Aceleraciones estrictamente ascendentes
+    escalera_c: List[float] = []
+    elegidos = []
+    for i, ai, ci, ri in zip(
+        orden.tolist(), a[orden].tolist(), c[orden].tolist(), r[orden].tolist()
+    ):
+        j = bisect_right(escalera_r, ri) - 1
+        if j >= 0 and (
+            escalera_a[j] > ai
+            or (escalera_a[j] == ai and (escalera_r[j] < ri or escalera_c[j] < ci))
+        ):
+            continue  # Dominado por uno más barato (o igual de caro) y no más riesgoso
+        elegidos.append(i)
+        # Sale de la escalera todo lo que tiene igual o más riesgo sin mejor aceleración
+        inicio = bisect_left(escalera_r, ri)
+        fin = inicio
+        while fin < len(escalera_r) and escalera_a[fin] <= ai:
+            fin += 1
+        escalera_r[inicio:fin] = [ri]
+        escalera_a[inicio:fin] = [ai]
+        escalera_c[inicio:fin] = [ci]
+    return indices[np.asarray(elegidos, dtype=np.int64)]
@@ -45,3 +45,56 @@ class ConstantesMatematicas:
     LIMITE_INFINITO = 1000  # Aproximación para k → ∞
     PRECISION_DECIMAL = 4   # Decimales para redondeo
     PORCENTAJE_ACELERACION_OBJETIVO = 30  # 30% objetivo de aceleración
+    TOLERANCIA_FRACCION = 1e-9  # Margen numérico al sumar fracciones (Σf ≤ 1)
+
+
+@dataclass(frozen=True)
+class ModelosEscalamiento:
+    
+    # Exponente α con el que crece el trabajo paralelo al mejorar k (G = k^α)
+    AMDAHL = 0.0     # Escalamiento fuerte: el trabajo es fijo
+    GUSTAFSON = 1.0  # Escalamiento débil: el trabajo paralelo crece con k
+    
+    @classmethod
+    def desde_nombre(cls, nombre: str) -> float:
+        """'amdahl', 'gustafson' o un α explícito entre 0 y 1 (p. ej. '0.5')"""
+        nombres = {"amdahl": cls.AMDAHL, "gustafson": cls.GUSTAFSON}
+        try:
+            escalamiento = nombres.get(nombre.strip().lower())
+            if escalamiento is None:
+                escalamiento = float(nombre)
+        except ValueError:
+            escalamiento = None
+        if escalamiento is None or not 0 <= escalamiento <= 1:
+            raise ValueError(
+                f"Modelo de escalamiento inválido: '{nombre}'. "
+                f"Use 'amdahl', 'gustafson' o un número entre 0 y 1"
+            )
+        return escalamiento
+
+
+@dataclass(frozen=True)
+class TiposDistribucion:
+    
+    FIJA = "fija"          # Un solo valor (sin incertidumbre)
+    NORMAL = "normal"      # (media, desviación), truncada al dominio de f o k
+    UNIFORME = "uniforme"  # (mínimo, máximo)
+    EMPIRICA = "empirica"  # Mediciones observadas, remuestreadas con reemplazo
+    
+    @classmethod
+    def obtener_todos(cls) -> List[str]:
+        return [cls.FIJA, cls.NORMAL, cls.UNIFORME, cls.EMPIRICA]
+
+
+@dataclass(frozen=True)
+class ConfiguracionInterconexion:
+    
+    # Órdenes de magnitud de referencia por GPU y por sentido (no son mediciones)
+    NVLINK_ANCHO_BANDA_GBS = 300   # Tipo NVLink: enlace directo GPU-GPU
+    NVLINK_LATENCIA_US = 2.0
+    
+    PCIE_ANCHO_BANDA_GBS = 25      # Tipo PCIe 4.0 x16 (efectivo)
+    PCIE_LATENCIA_US = 10.0
+    
+    MAX_DISPOSITIVOS = 64          # Tope por defecto al buscar el número óptimo de GPUs
+    GANANCIA_MINIMA = 0.05         # Otra GPU deja de convenir si mejora A menos de 5%
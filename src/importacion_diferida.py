@@ -0,0 +1,54 @@
+"""
+Importación diferida de dependencias pesadas (numpy, matplotlib, customtkinter)
+"""
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any
+
+
+class ModuloDiferido(ModuleType):
+    """
+    Representante local de un módulo que todavía no se importó: el primer
+    acceso a un atributo hace el import real y lo copia aquí, de modo que
+    los accesos siguientes no pasan por __getattr__.
+    
+    No se registra en sys.modules, así que el resto del proceso (incluido el
+    código de terceros) sigue viendo el módulo real. El import real usa el
+    mecanismo normal de Python, que serializa la primera carga entre hilos.
+    """
+    
+    def __getattr__(self, atributo: str) -> Any:
+        if atributo.startswith("__"):
+            raise AttributeError(atributo)  # copy, pickle, inspect: no disparan el import
+        valor = getattr(importlib.import_module(self.__name__), atributo)
+        setattr(self, atributo, valor)
+        return valor
+    
+    def __repr__(self) -> str:
+        return f"<módulo diferido '{self.__name__}'>"
+
+
+def importar_diferido(nombre: str) -> ModuleType:
+    """
+    Devuelve `nombre` sin ejecutarlo: el módulo se carga recién al acceder
+    a su primer atributo (ver ModuloDiferido).
+    
+    Si el módulo ya estaba importado se devuelve tal cual. sys.modules no se
+    modifica: un `import nombre` en cualquier otro archivo importa el módulo
+    real. Un módulo que no existe se informa aquí con ModuleNotFoundError,
+    igual que con un import normal.
+    """
+    modulo = sys.modules.get(nombre)
+    if modulo is not None:
+        return modulo
+    
+    if importlib.util.find_spec(nombre) is None:
+        raise ModuleNotFoundError(f"No module named '{nombre}'", name=nombre)
+    return ModuloDiferido(nombre)
+
+
+def esta_cargado(nombre: str) -> bool:
+    """True si `nombre` ya se importó en este proceso"""
+    return nombre in sys.modules
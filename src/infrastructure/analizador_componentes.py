@@ -1,90 +1,204 @@
-from typing import List
+from __future__ import annotations
+from functools import partial
+from itertools import combinations, product
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 from ..domain.entities import (
     ComponenteGPU, 
+    FronteraPareto,
     ResultadoAmdahl, 
     AnalisisComparativo,
+    OpcionMejora,
+    PaqueteMejoras,
+    PlanMejoras,
+    ResultadoPaquete,
     IAnalizador,
-    ICalculadorAmdahl
+    ICalculadorAmdahl,
+    IOptimizadorMejoras,
+    ResultadoLoteAmdahl,
+    ResultadoSensibilidades,
+    como_calculador_gustafson
 )
+from ..domain.tablas import (
+    TablaComponentes,
+    TablaResultados,
+    indices_pareto,
+    indices_ranking
+)
+from ..domain.value_objects import ConstantesMatematicas, ModelosEscalamiento
+from ..importacion_diferida import importar_diferido
+
+if TYPE_CHECKING:
+    from ..domain.entidades_barrido import GrillaBarrido
+    from ..domain.entidades_incertidumbre import (
+        AnalisisProbabilistico,
+        ComponenteIncierto,
+        ISimuladorIncertidumbre
+    )
+
+
+np = importar_diferido("numpy")
 
 
-class AnalizadorComponentes(IAnalizador):
+CRITERIOS_PROBABILISTICOS = ("probabilidad_mejor", "media", "probabilidad_objetivo")
+MEDIDAS_SENSIBILIDAD = ("elasticidad", "derivada")
+# Celdas (componentes + 1) × (presupuesto / unidad_costo + 1) de la programación
+# dinámica de optimizar_presupuesto: ~50M son unos 400 MB entre tablas y copias
+MAX_CELDAS_PRESUPUESTO = 50_000_000
+
+
+class AnalizadorComponentes(IAnalizador, IOptimizadorMejoras):
     #Implementación del analizador de componentes GPU
     
-    def __init__(self, calculador: ICalculadorAmdahl):
+    def __init__(
+        self, 
+        calculador: ICalculadorAmdahl, 
+        simulador: Optional[ISimuladorIncertidumbre] = None
+    ):
+        # Los modelos de Gustafson y mixto requieren además ICalculadorGustafson
         self.calculador = calculador
+        # Sin simulador, el modo probabilístico crea uno (de un proceso) al usarse
+        self.simulador = simulador
     
     def determinar_mejor_componente(
         self, 
-        componentes: List[ComponenteGPU]
+        componentes: Sequence[ComponenteGPU],
+        escalamiento: float = ModelosEscalamiento.AMDAHL
     ) -> AnalisisComparativo:
-        resultados = []
-        mejor_aceleracion = 0
-        mejor_componente = None
+        """
+        Con una TablaComponentes los resultados quedan en una TablaResultados
+        (columnar); con una lista, en una lista de ResultadoAmdahl.
         
-        for componente in componentes:
-            aceleracion = self.calculador.calcular_aceleracion(componente)
-            limite_teorico = self.calculador.calcular_limite_teorico(componente)
-            
-            resultado = ResultadoAmdahl(
-                componente=componente,
-                aceleracion=aceleracion,
-                limite_teorico=limite_teorico
-            )
-            resultados.append(resultado)
-            
-            if aceleracion > mejor_aceleracion:
-                mejor_aceleracion = aceleracion
-                mejor_componente = componente
+        `escalamiento` elige el modelo del ranking: 0 (Amdahl, trabajo fijo),
+        1 (Gustafson, aceleración escalada) o un α intermedio (modo mixto).
+        """
+        lote = self._calcular_lote(*_arreglos_f_k(componentes), escalamiento)
+        
+        if isinstance(componentes, TablaComponentes):
+            resultados = TablaResultados.desde_lote(componentes, lote)
+        else:
+            resultados = [
+                ResultadoAmdahl(
+                    componente=componente,
+                    aceleracion=aceleracion,
+                    limite_teorico=limite_teorico
+                )
+                for componente, aceleracion, limite_teorico
+                in zip(componentes, lote.aceleracion.tolist(), lote.limite_teorico.tolist())
+            ]
         
-        justificacion = self._generar_justificacion(mejor_componente, resultados)
+        mejor_componente = None
+        indice_mejor = None
+        if lote.validos.any():
+            # Las filas inválidas de una tabla (NaN) no compiten
+            indice_mejor = int(np.argmax(np.where(lote.validos, lote.aceleracion, -np.inf)))
+            mejor_componente = componentes[indice_mejor]
         
+        # El reporte se redacta recién cuando alguien lo lee
         return AnalisisComparativo(
             resultados=resultados,
             mejor_componente=mejor_componente,
-            justificacion=justificacion
+            redactor=partial(
+                self._redactar_justificacion, resultados, indice_mejor, lote.aceleracion,
+                escalamiento
+            )
         )
     
+    def determinar_mejor_componente_probabilistico(
+        self, 
+        componentes: Sequence[ComponenteIncierto],
+        muestras: int = 100_000,
+        semilla: Optional[int] = None,
+        criterio: str = "probabilidad_mejor",
+        aceleracion_objetivo: Optional[float] = None,
+        tiempo_original: Optional[float] = None
+    ) -> AnalisisProbabilistico:
+        """
+        Mejor componente cuando f y k son inciertos, por Monte Carlo. Criterios:
+        'probabilidad_mejor' (el que más veces tiene la mayor aceleración en la
+        misma muestra), 'media' (mayor aceleración esperada) o
+        'probabilidad_objetivo' (mayor P(A >= aceleracion_objetivo)).
+        """
+        if criterio not in CRITERIOS_PROBABILISTICOS:
+            raise ValueError(
+                f"Criterio no soportado: '{criterio}'. "
+                f"Use uno de: {', '.join(CRITERIOS_PROBABILISTICOS)}"
+            )
+        if criterio == "probabilidad_objetivo" and aceleracion_objetivo is None:
+            raise ValueError("El criterio 'probabilidad_objetivo' requiere aceleracion_objetivo")
+        
+        # Se importan aquí: el modo probabilístico no debe pesar en el arranque
+        from ..domain.entidades_incertidumbre import AnalisisProbabilistico
+        
+        if self.simulador is None:
+            # Implícito: un solo proceso; el pool se pide inyectando un simulador
+            from .simulador_monte_carlo import SimuladorMonteCarlo
+            self.simulador = SimuladorMonteCarlo(self.calculador, procesos=1)
+        resultados = self.simulador.simular(
+            componentes, muestras, semilla, tiempo_original, aceleracion_objetivo
+        )
+        
+        analisis = AnalisisProbabilistico(
+            resultados=resultados, mejor_componente=None, criterio=criterio
+        )
+        valores = np.array(
+            [analisis.valor_criterio(r) for r in resultados], dtype=np.float64
+        )
+        if resultados and not np.isnan(valores).all():
+            analisis.mejor_componente = componentes[int(np.nanargmax(valores))]
+        return analisis
+    
     def analizar_ultimos_tres(
         self, 
-        componentes: List[ComponenteGPU]
+        componentes: Sequence[ComponenteGPU]
     ) -> AnalisisComparativo:
         ultimos_tres = componentes[-3:] if len(componentes) >= 3 else componentes
         return self.determinar_mejor_componente(ultimos_tres)
     
-    def _generar_justificacion(
+    def _redactar_justificacion(
         self, 
-        mejor_componente: ComponenteGPU, 
-        resultados: List[ResultadoAmdahl]
-    ) -> str:
-        if not mejor_componente:
-            return "No se pudo determinar un mejor componente"
+        resultados: Sequence[ResultadoAmdahl],
+        indice_mejor: Optional[int],
+        aceleraciones: np.ndarray,
+        escalamiento: float,
+        max_comparaciones: Optional[int] = None
+    ) -> Iterator[str]:
+        if indice_mejor is None:
+            yield "No se pudo determinar un mejor componente"
+            return
         
-        mejor_resultado = next(r for r in resultados if r.componente == mejor_componente)
+        mejor_resultado = resultados[indice_mejor]
+        mejor_componente = mejor_resultado.componente
         
-        justificacion = (
+        yield (
             f"El componente '{mejor_componente.nombre}' es la mejor opción para optimizar "
-            f"porque ofrece la mayor aceleración global: {mejor_resultado.aceleracion:.4f}x. "
+            f"porque ofrece la mayor aceleración {_descripcion_modelo(escalamiento)}: "
+            f"{mejor_resultado.aceleracion:.4f}x. "
             f"\n\nAnálisis técnico:\n"
-            f"- Fracción mejorable (f): {mejor_componente.porcentaje_mejora:.1%}\n"
-            f"- Factor de mejora (k): {mejor_componente.factor_mejora}\n"
-            f"- Aceleración real: {mejor_resultado.aceleracion:.4f}x\n"
-            f"- Límite teórico: {mejor_resultado.limite_teorico:.4f}x\n"
-            f"- Eficiencia: {(mejor_resultado.aceleracion/mejor_resultado.limite_teorico)*100:.1f}% del límite teórico\n\n"
-        )
-        
-        # Añadir comparación con otros componentes
-        otros_resultados = [r for r in resultados if r.componente != mejor_componente]
-        if otros_resultados:
-            justificacion += "Comparación con otros componentes:\n"
-            for resultado in sorted(otros_resultados, key=lambda x: x.aceleracion, reverse=True):
+        )
+        yield f"- Fracción mejorable (f): {mejor_componente.porcentaje_mejora:.1%}\n"
+        yield f"- Factor de mejora (k): {mejor_componente.factor_mejora}\n"
+        yield f"- Aceleración real: {mejor_resultado.aceleracion:.4f}x\n"
+        if np.isfinite(mejor_resultado.limite_teorico):
+            yield f"- Límite teórico: {mejor_resultado.limite_teorico:.4f}x\n"
+            yield f"- Eficiencia: {(mejor_resultado.aceleracion/mejor_resultado.limite_teorico)*100:.1f}% del límite teórico\n\n"
+        else:
+            # Con trabajo creciente la aceleración no tiene techo
+            yield "- Límite teórico: sin límite (el trabajo paralelo crece con k)\n\n"
+        
+        # Comparación con otros componentes, ordenados con las aceleraciones ya calculadas
+        n = None if max_comparaciones is None else max_comparaciones + 1
+        otros = [i for i in indices_ranking(aceleraciones, n=n).tolist() if i != indice_mejor]
+        if max_comparaciones is not None:
+            otros = otros[:max_comparaciones]
+        if otros:
+            yield "Comparación con otros componentes:\n"
+            for i in otros:
+                resultado = resultados[i]
                 diferencia = mejor_resultado.aceleracion - resultado.aceleracion
-                justificacion += (
+                yield (
                     f"- {resultado.componente.nombre}: {resultado.aceleracion:.4f}x "
                     f"(diferencia: +{diferencia:.4f}x)\n"
                 )
-        
-        return justificacion
     
     def calcular_eficiencia_optimizacion(
         self, 
@@ -104,22 +218,553 @@ class AnalizadorComponentes(IAnalizador):
             "factor_escalabilidad": round(componente.factor_mejora / aceleracion, 2)
         }
     
+    def evaluar_tabla(
+        self, 
+        tabla: TablaComponentes, 
+        tiempo_original: Optional[float] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL,
+        escalamiento: float = ModelosEscalamiento.AMDAHL
+    ) -> TablaResultados:
+        lote = self._calcular_lote(
+            tabla.porcentajes_mejora, tabla.factores_mejora, escalamiento,
+            tiempo_original, decimales
+        )
+        return TablaResultados.desde_lote(tabla, lote)
+    
+    def evaluar_modelos(
+        self, 
+        componentes: Sequence[ComponenteGPU], 
+        escalamientos: Sequence[float] = (
+            ModelosEscalamiento.AMDAHL, ModelosEscalamiento.GUSTAFSON
+        ),
+        tiempo_original: Optional[float] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        """
+        Evalúa todos los componentes bajo varios modelos de escalamiento en una
+        sola pasada vectorizada: los arreglos del resultado tienen forma
+        (modelos, componentes), una fila por cada α de `escalamientos`.
+        """
+        f, k = _arreglos_f_k(componentes)
+        alfas = np.asarray(escalamientos, dtype=np.float64)[:, np.newaxis]
+        return como_calculador_gustafson(self.calculador).calcular_lote_mixto(
+            f, k, alfas, tiempo_original, decimales
+        )
+    
     def encontrar_componente_objetivo(
+        self, 
+        componentes: Sequence[ComponenteGPU], 
+        aceleracion_minima: float,
+        n: Optional[int] = None,
+        escalamiento: float = ModelosEscalamiento.AMDAHL
+    ) -> Sequence[ComponenteGPU]:
+        """
+        Componentes con A >= aceleracion_minima de mayor a menor aceleración
+        (los `n` mejores si se indica). Con una TablaComponentes devuelve otra
+        tabla con las filas elegidas.
+        """
+        if not isinstance(componentes, TablaComponentes) and not componentes:
+            return []
+        
+        lote = self._calcular_lote(*_arreglos_f_k(componentes), escalamiento)
+        indices = indices_ranking(lote.aceleracion, lote.validos, n=n, minimo=aceleracion_minima)
+        
+        if isinstance(componentes, TablaComponentes):
+            return componentes[indices]
+        return [componentes[i] for i in indices.tolist()]
+    
+    def calcular_factores_necesarios(
+        self, 
+        componentes: Sequence[ComponenteGPU], 
+        aceleraciones_objetivo: List[float]
+    ) -> np.ndarray:
+        """
+        Matriz (componentes, objetivos) con el k que necesita cada componente
+        para cada aceleración objetivo; inf donde el objetivo es inalcanzable.
+        """
+        f, _ = _arreglos_f_k(componentes)
+        objetivos = np.asarray(aceleraciones_objetivo, dtype=np.float64)
+        return self.calculador.calcular_factor_necesario_lote(
+            f[:, np.newaxis], objetivos[np.newaxis, :]
+        )
+    
+    def calcular_sensibilidades(
+        self, 
+        componentes: Sequence[ComponenteGPU]
+    ) -> ResultadoSensibilidades:
+        """∂A/∂f, ∂A/∂k y elasticidades de todos los componentes (forma cerrada)"""
+        return self.calculador.calcular_sensibilidades_lote(*_arreglos_f_k(componentes))
+    
+    def rankear_por_ganancia_marginal(
+        self, 
+        componentes: Sequence[ComponenteGPU], 
+        parametro: str = "k",
+        medida: str = "elasticidad",
+        n: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        (nombre, ganancia) de mayor a menor: cuánto sube A al mejorar
+        `parametro` ('f' o 'k') en cada componente. Con medida 'derivada' es
+        ∂A/∂parametro (por unidad); con 'elasticidad', el % de aumento de A
+        por cada 1% de mejora, comparable entre componentes con k distintos.
+        """
+        if parametro not in ("f", "k"):
+            raise ValueError("El parámetro debe ser 'f' o 'k'")
+        if medida not in MEDIDAS_SENSIBILIDAD:
+            raise ValueError(
+                f"Medida no soportada: '{medida}'. Use uno de: {', '.join(MEDIDAS_SENSIBILIDAD)}"
+            )
+        
+        sensibilidades = self.calcular_sensibilidades(componentes)
+        valores = getattr(sensibilidades, f"{medida}_{parametro}")
+        indices = indices_ranking(valores, sensibilidades.validos, n=n)
+        return list(zip(_nombres(componentes, indices), valores[indices].tolist()))
+    
+    def calcular_tornado(
+        self, 
+        componentes: Sequence[ComponenteGPU], 
+        variacion: float = 0.1,
+        n: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Barras del gráfico de tornado: para cada componente y parámetro, el
+        cambio exacto de A si ese parámetro baja y sube `variacion` (relativa),
+        con f limitado a [0, 1] y k a valores mayores que 1. Ordenadas de
+        mayor a menor largo (alto - bajo); con `n`, solo las `n` más largas.
+        """
+        if variacion <= 0:
+            raise ValueError("La variación debe ser mayor a 0")
+        
+        f, k = _arreglos_f_k(componentes)
+        cantidad = f.size
+        k_minimo = np.nextafter(1.0, np.inf)
+        # Primero todas las barras de f (k fijo), luego todas las de k (f fijo)
+        f_variado = np.concatenate((f, f))
+        k_variado = np.concatenate((k, k))
+        bajo = self._aceleraciones_tornado(
+            f_variado, k_variado, f * (1 - variacion), np.maximum(k * (1 - variacion), k_minimo)
+        )
+        alto = self._aceleraciones_tornado(
+            f_variado, k_variado, np.minimum(f * (1 + variacion), 1.0), k * (1 + variacion)
+        )
+        aceleraciones = self.calculador.calcular_lote(
+            f_variado, k_variado, decimales=None
+        ).aceleracion
+        bajo -= aceleraciones
+        alto -= aceleraciones
+        
+        indices = indices_ranking(alto - bajo, ~np.isnan(aceleraciones), n=n)
+        nombres = _nombres(componentes, indices % cantidad)
+        return [
+            {
+                'nombre': nombre,
+                'parametro': 'f' if i < cantidad else 'k',
+                'aceleracion': aceleracion,
+                'bajo': delta_bajo,
+                'alto': delta_alto
+            }
+            for nombre, i, aceleracion, delta_bajo, delta_alto in zip(
+                nombres, indices.tolist(), aceleraciones[indices].tolist(),
+                bajo[indices].tolist(), alto[indices].tolist()
+            )
+        ]
+    
+    def _aceleraciones_tornado(
+        self, 
+        f: np.ndarray, 
+        k: np.ndarray, 
+        f_extremo: np.ndarray, 
+        k_extremo: np.ndarray
+    ) -> np.ndarray:
+        # A con f en su extremo (primera mitad) y con k en su extremo (segunda mitad)
+        cantidad = f_extremo.size
+        f = f.copy()
+        k = k.copy()
+        f[:cantidad] = np.clip(f_extremo, 0.0, 1.0)
+        k[cantidad:] = k_extremo
+        return self.calculador.calcular_lote(f, k, decimales=None).aceleracion
+    
+    def rankear_barrido(
+        self, 
+        grilla: GrillaBarrido, 
+        n: int = 10,
+        aceleracion_minima: Optional[float] = None,
+        elementos_por_bloque: int = 1 << 22
+    ) -> List[Tuple[float, float, float]]:
+        """
+        Los `n` mejores puntos (f, k, aceleración) de una grilla ya calculada.
+        
+        La grilla se recorre por bloques de filas (vistas sin copia si es un
+        memmap), de modo que solo un bloque está en memoria a la vez.
+        """
+        aceleraciones = grilla.aceleraciones
+        ancho = aceleraciones.shape[1]
+        indices = np.empty(0, dtype=np.int64)
+        valores = np.empty(0)
+        
+        for inicio, bloque in _bloques_de_filas(aceleraciones, elementos_por_bloque):
+            plano = bloque.reshape(-1)
+            elegidos = indices_ranking(plano, n=n, minimo=aceleracion_minima)
+            # Los candidatos previos van primero: sus índices globales son menores
+            indices = np.concatenate((indices, inicio * ancho + elegidos))
+            valores = np.concatenate((valores, plano[elegidos]))
+            mejores = indices_ranking(valores, n=n)
+            indices, valores = indices[mejores], valores[mejores]
+        
+        filas, columnas = np.divmod(indices, ancho)
+        return list(zip(
+            np.asarray(grilla.porcentajes_mejora)[filas].tolist(),
+            np.asarray(grilla.factores_mejora)[columnas].tolist(),
+            valores.tolist()
+        ))
+    
+    def contar_sobre_umbrales(
+        self, 
+        grilla: GrillaBarrido, 
+        umbrales: List[float],
+        elementos_por_bloque: int = 1 << 22
+    ) -> Dict[float, int]:
+        """Puntos de la grilla con A >= umbral, recorriéndola por bloques"""
+        conteos = dict.fromkeys(umbrales, 0)
+        for _, bloque in _bloques_de_filas(grilla.aceleraciones, elementos_por_bloque):
+            for umbral in umbrales:
+                conteos[umbral] += int(np.count_nonzero(bloque >= umbral))
+        return conteos
+    
+    def rankear_paquetes(
+        self, 
+        paquetes: List[PaqueteMejoras]
+    ) -> List[ResultadoPaquete]:
+        if not paquetes:
+            return []
+        
+        lote = self.calculador.calcular_lote_combinado(*_matrices_paquetes(paquetes))
+        aceleraciones = lote.aceleracion.tolist()
+        limites = lote.limite_teorico.tolist()
+        
+        orden = np.argsort(-lote.aceleracion, kind='stable')
+        return [
+            ResultadoPaquete(
+                paquete=paquetes[i],
+                aceleracion=aceleraciones[i],
+                limite_teorico=limites[i]
+            )
+            for i in orden.tolist()
+        ]
+    
+    def generar_paquetes(
         self, 
         componentes: List[ComponenteGPU], 
-        aceleracion_minima: float
-    ) -> List[ComponenteGPU]:
-        componentes_validos = []
+        max_componentes: Optional[int] = None
+    ) -> List[PaqueteMejoras]:
+        """Todas las combinaciones de componentes cuyas fracciones suman ≤ 1"""
+        max_componentes = max_componentes or len(componentes)
+        paquetes = []
+        
+        for tamano in range(1, max_componentes + 1):
+            for combinacion in combinations(componentes, tamano):
+                try:
+                    paquetes.append(PaqueteMejoras(
+                        nombre=" + ".join(c.nombre for c in combinacion),
+                        componentes=list(combinacion)
+                    ))
+                except ValueError:
+                    continue  # Fracciones superpuestas (Σf > 1)
+        
+        return paquetes
+    
+    def generar_paquetes_opciones(
+        self, 
+        opciones: List[OpcionMejora], 
+        max_componentes: Optional[int] = None
+    ) -> List[List[OpcionMejora]]:
+        """
+        Todas las combinaciones de como máximo un nivel por componente (hasta
+        `max_componentes` componentes) cuyas fracciones suman ≤ 1
+        """
+        grupos = [[opciones[i] for i in indices] for indices in _agrupar_niveles(opciones)]
+        max_componentes = max_componentes or len(grupos)
+        paquetes = []
         
-        for componente in componentes:
-            aceleracion = self.calculador.calcular_aceleracion(componente)
-            if aceleracion >= aceleracion_minima:
-                componentes_validos.append(componente)
+        for tamano in range(1, max_componentes + 1):
+            for combinacion in combinations(grupos, tamano):
+                fraccion = sum(niveles[0].componente.porcentaje_mejora for niveles in combinacion)
+                if fraccion > 1 + ConstantesMatematicas.TOLERANCIA_FRACCION:
+                    continue  # Fracciones superpuestas (Σf > 1)
+                paquetes.extend(list(eleccion) for eleccion in product(*combinacion))
         
-        # Ordenar por aceleración descendente
-        componentes_validos.sort(
-            key=lambda c: self.calculador.calcular_aceleracion(c), 
-            reverse=True
+        return paquetes
+    
+    def frontera_pareto_opciones(
+        self, 
+        opciones: Sequence[OpcionMejora], 
+        con_riesgo: bool = False
+    ) -> FronteraPareto:
+        """Opciones de un solo componente no dominadas en (aceleración, costo[, riesgo])"""
+        lote = self.calculador.calcular_lote(
+            *_arreglos_f_k([o.componente for o in opciones]), decimales=None
         )
+        return _frontera(
+            lote.aceleracion, 
+            np.array([o.costo for o in opciones], dtype=np.float64),
+            np.array([o.riesgo for o in opciones], dtype=np.float64) if con_riesgo else None,
+            lote.validos,
+            lambda indices: [_nombre_opcion(opciones[i]) for i in indices.tolist()]
+        )
+    
+    def frontera_pareto_paquetes(
+        self, 
+        paquetes: Sequence[Sequence[OpcionMejora]], 
+        con_riesgo: bool = False
+    ) -> FronteraPareto:
+        """
+        Paquetes de opciones (p. ej. de generar_paquetes_opciones) no
+        dominados: aceleración combinada vs suma de costos (y de riesgos).
+        """
+        if not paquetes:
+            vacio = np.empty(0)
+            return FronteraPareto(
+                vacio, vacio, vacio if con_riesgo else None, np.empty(0, dtype=np.int64), []
+            )
         
-        return componentes_validos
+        lote = self.calculador.calcular_lote_combinado(*_matrices_paquetes([
+            PaqueteMejoras(nombre="", componentes=[o.componente for o in paquete])
+            for paquete in paquetes
+        ]), decimales=None)
+        costos = np.array([sum(o.costo for o in p) for p in paquetes], dtype=np.float64)
+        riesgos = None
+        if con_riesgo:
+            riesgos = np.array([sum(o.riesgo for o in p) for p in paquetes], dtype=np.float64)
+        
+        return _frontera(
+            lote.aceleracion, costos, riesgos, lote.validos,
+            lambda indices: [
+                " + ".join(_nombre_opcion(o) for o in paquetes[i]) for i in indices.tolist()
+            ]
+        )
+    
+    def frontera_pareto_tabla(
+        self, 
+        componentes: Sequence[ComponenteGPU], 
+        costos: Any,
+        riesgos: Optional[Any] = None
+    ) -> FronteraPareto:
+        """
+        Frontera sobre una tabla (o lista) grande de candidatos, con sus
+        costos (y riesgos) como arreglos alineados con las filas
+        """
+        lote = self.calculador.calcular_lote(*_arreglos_f_k(componentes), decimales=None)
+        costos = np.asarray(costos, dtype=np.float64)
+        if costos.shape != lote.aceleracion.shape:
+            raise ValueError("Debe haber un costo por componente")
+        if riesgos is not None:
+            riesgos = np.asarray(riesgos, dtype=np.float64)
+            if riesgos.shape != lote.aceleracion.shape:
+                raise ValueError("Debe haber un riesgo por componente")
+        
+        return _frontera(
+            lote.aceleracion, costos, riesgos, lote.validos,
+            partial(_nombres, componentes)
+        )
+    
+    def optimizar_presupuesto(
+        self, 
+        opciones: List[OpcionMejora], 
+        presupuesto: float,
+        unidad_costo: float = 1.0
+    ) -> PlanMejoras:
+        """
+        Elige como máximo un nivel por componente maximizando la aceleración
+        combinada sin superar el presupuesto (mochila de elección múltiple).
+        
+        Como A = 1 / (1 - Σ f_i(1 - 1/k_i)), maximizar A equivale a maximizar
+        la suma de ganancias g_i = 1 - 1/A_i de cada opción, lo que permite una
+        programación dinámica vectorizada sobre el presupuesto. Los costos se
+        expresan en múltiplos de `unidad_costo` (redondeados hacia arriba, así
+        el plan nunca excede el presupuesto real). Las tablas crecen con
+        presupuesto / unidad_costo: si superan MAX_CELDAS_PRESUPUESTO se pide
+        una unidad más gruesa en lugar de reservar gigabytes.
+        """
+        if not np.isfinite(presupuesto) or presupuesto < 0:
+            raise ValueError("El presupuesto debe ser un número finito no negativo")
+        if unidad_costo <= 0:
+            raise ValueError("La unidad de costo debe ser mayor a 0")
+        
+        grupos = _agrupar_niveles(opciones)
+        celdas = (len(grupos) + 1) * (presupuesto / unidad_costo + 1)
+        if celdas > MAX_CELDAS_PRESUPUESTO:
+            # Primera potencia de 10 con la que las tablas entran en el máximo
+            minima = presupuesto * (len(grupos) + 1) / (MAX_CELDAS_PRESUPUESTO - len(grupos) - 1)
+            unidad_sugerida = 10.0 ** np.ceil(np.log10(minima))
+            raise ValueError(
+                f"El presupuesto {presupuesto:g} en unidades de {unidad_costo:g} requiere "
+                f"tablas de {celdas:,.0f} celdas (máximo {MAX_CELDAS_PRESUPUESTO:,}): "
+                f"use una unidad_costo más gruesa (p. ej. {unidad_sugerida:g})"
+            )
+        
+        lote = self.calculador.calcular_lote(*_arreglos_f_k(
+            [o.componente for o in opciones]
+        ), decimales=None)
+        ganancias = 1.0 - 1.0 / lote.aceleracion
+        costos = np.ceil(
+            np.array([o.costo for o in opciones], dtype=np.float64) / unidad_costo
+            - ConstantesMatematicas.TOLERANCIA_FRACCION
+        ).astype(np.int64)
+        capacidad = int(presupuesto / unidad_costo + ConstantesMatematicas.TOLERANCIA_FRACCION)
+        
+        # mejor[b] = mayor ganancia alcanzable con costo ≤ b
+        mejor = np.zeros(capacidad + 1)
+        eleccion = np.full((len(grupos), capacidad + 1), -1, dtype=np.int32)
+        
+        for g, indices in enumerate(grupos):
+            nuevo = mejor.copy()
+            for i in indices:
+                c = int(costos[i])
+                if c > capacidad:
+                    continue
+                candidato = mejor[:capacidad + 1 - c] + ganancias[i]
+                supera = candidato > nuevo[c:]
+                nuevo[c:][supera] = candidato[supera]
+                eleccion[g, c:][supera] = i
+            mejor = nuevo
+        
+        # Reconstrucción del plan desde el último componente
+        seleccion = []
+        b = capacidad
+        for g in reversed(range(len(grupos))):
+            i = int(eleccion[g, b])
+            if i >= 0:
+                seleccion.append(opciones[i])
+                b -= int(costos[i])
+        seleccion.reverse()
+        
+        paquete = None
+        aceleracion = 1.0
+        if seleccion:
+            paquete = PaqueteMejoras(
+                nombre=" + ".join(o.componente.nombre for o in seleccion),
+                componentes=[o.componente for o in seleccion]
+            )
+            aceleracion = self.calculador.calcular_aceleracion_combinada(paquete)
+        
+        return PlanMejoras(
+            opciones=seleccion,
+            paquete=paquete,
+            aceleracion=aceleracion,
+            costo_total=sum(o.costo for o in seleccion),
+            presupuesto=presupuesto
+        )
+    
+    def _calcular_lote(
+        self, 
+        f: np.ndarray, 
+        k: np.ndarray, 
+        escalamiento: float,
+        tiempo_original: Optional[float] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        # Amdahl y Gustafson usan sus lotes directos (y los cachés que los envuelven)
+        if escalamiento == ModelosEscalamiento.AMDAHL:
+            return self.calculador.calcular_lote(f, k, tiempo_original, decimales)
+        if escalamiento == ModelosEscalamiento.GUSTAFSON:
+            return como_calculador_gustafson(self.calculador).calcular_lote_escalado(
+                f, k, tiempo_original, decimales
+            )
+        if not 0 <= escalamiento <= 1:
+            raise ValueError("El escalamiento debe estar entre 0 (Amdahl) y 1 (Gustafson)")
+        return como_calculador_gustafson(self.calculador).calcular_lote_mixto(
+            f, k, escalamiento, tiempo_original, decimales
+        )
+
+
+def _descripcion_modelo(escalamiento: float) -> str:
+    if escalamiento == ModelosEscalamiento.AMDAHL:
+        return "global"
+    if escalamiento == ModelosEscalamiento.GUSTAFSON:
+        return "escalada (Gustafson)"
+    return f"en el modelo mixto (α = {escalamiento:g})"
+
+
+def _bloques_de_filas(
+    grilla: np.ndarray, 
+    elementos_por_bloque: int
+) -> Iterator[Tuple[int, np.ndarray]]:
+    filas = max(1, elementos_por_bloque // max(grilla.shape[1], 1))
+    for inicio in range(0, grilla.shape[0], filas):
+        yield inicio, np.asarray(grilla[inicio:inicio + filas])
+
+
+def _agrupar_niveles(opciones: List[OpcionMejora]) -> List[List[int]]:
+    # Índices de opciones agrupados por componente (los niveles comparten f)
+    grupos: Dict[str, List[int]] = {}
+    fracciones: Dict[str, float] = {}
+    
+    for i, opcion in enumerate(opciones):
+        nombre = opcion.componente.nombre
+        f = opcion.componente.porcentaje_mejora
+        if nombre in fracciones and fracciones[nombre] != f:
+            raise ValueError(
+                f"Los niveles de '{nombre}' deben compartir la misma fracción mejorable"
+            )
+        fracciones[nombre] = f
+        grupos.setdefault(nombre, []).append(i)
+    
+    if sum(fracciones.values()) > 1 + ConstantesMatematicas.TOLERANCIA_FRACCION:
+        raise ValueError(
+            "La suma de las fracciones mejorables de los componentes no puede superar 1"
+        )
+    
+    return list(grupos.values())
+
+
+def _matrices_paquetes(paquetes: List[PaqueteMejoras]) -> Tuple[np.ndarray, np.ndarray]:
+    # Matrices (paquetes, componentes) rellenas con f=0 para paquetes más cortos
+    ancho = max(len(p.componentes) for p in paquetes)
+    f = np.zeros((len(paquetes), ancho))
+    k = np.full((len(paquetes), ancho), np.inf)
+    
+    for i, paquete in enumerate(paquetes):
+        for j, componente in enumerate(paquete.componentes):
+            f[i, j] = componente.porcentaje_mejora
+            k[i, j] = componente.factor_mejora
+    
+    return f, k
+
+
+def _frontera(
+    aceleracion: np.ndarray,
+    costo: np.ndarray,
+    riesgo: Optional[np.ndarray],
+    validos: np.ndarray,
+    nombrar: Callable[[np.ndarray], List[str]]
+) -> FronteraPareto:
+    # Solo se nombran los puntos de la frontera (en tablas grandes son pocos)
+    indices = indices_pareto(aceleracion, costo, riesgo, validos)
+    return FronteraPareto(
+        aceleracion=aceleracion,
+        costo=costo,
+        riesgo=riesgo,
+        indices=indices,
+        nombres=nombrar(indices)
+    )
+
+
+def _nombre_opcion(opcion: OpcionMejora) -> str:
+    return f"{opcion.componente.nombre} (k={opcion.componente.factor_mejora:g})"
+
+
+def _nombres(componentes: Sequence[ComponenteGPU], indices: np.ndarray) -> List[str]:
+    if isinstance(componentes, TablaComponentes):
+        nombres = componentes.catalogo.nombres
+        return [nombres[i] for i in componentes.ids_nombre[indices].tolist()]
+    return [componentes[i].nombre for i in indices.tolist()]
+
+
+def _arreglos_f_k(componentes: Sequence[ComponenteGPU]) -> Tuple[np.ndarray, np.ndarray]:
+    if isinstance(componentes, TablaComponentes):
+        return componentes.porcentajes_mejora, componentes.factores_mejora
+    
+    n = len(componentes)
+    f = np.fromiter((c.porcentaje_mejora for c in componentes), dtype=np.float64, count=n)
+    k = np.fromiter((c.factor_mejora for c in componentes), dtype=np.float64, count=n)
+    return f, k
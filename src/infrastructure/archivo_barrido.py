@@ -0,0 +1,70 @@
+"""
+Grillas de barrido en disco: un .npy mapeado en memoria más un encabezado con los ejes
+"""
+import json
+import os
+from typing import Any, List, Sequence
+from ..domain.entities import ComponenteGPU, GrillaBarrido
+from ..importacion_diferida import importar_diferido
+
+
+np = importar_diferido("numpy")
+
+
+VERSION_ENCABEZADO = 1
+
+
+def ruta_encabezado(ruta: str) -> str:
+    return os.path.splitext(ruta)[0] + ".ejes.json"
+
+
+def crear_archivo_barrido(
+    ruta: str,
+    porcentajes_mejora: Sequence[float],
+    factores_mejora: Sequence[float],
+    componentes_base: Sequence[ComponenteGPU] = ()
+) -> None:
+    """
+    Reserva la grilla (f, k) como .npy de float64 (NaN en puntos inválidos)
+    y escribe el encabezado JSON con los ejes. El archivo se crea disperso:
+    solo ocupa disco a medida que los procesos escriben sus teselas.
+    """
+    f = np.asarray(porcentajes_mejora, dtype=np.float64)
+    k = np.asarray(factores_mejora, dtype=np.float64)
+    grilla = np.lib.format.open_memmap(ruta, mode='w+', dtype=np.float64, shape=(f.size, k.size))
+    del grilla
+    
+    encabezado = {
+        "version": VERSION_ENCABEZADO,
+        "forma": [f.size, k.size],
+        "ejes": {"f": f.tolist(), "k": k.tolist()},
+        "componentes_base": [
+            {"nombre": c.nombre, "f": c.porcentaje_mejora, "k": c.factor_mejora}
+            for c in componentes_base
+        ],
+    }
+    with open(ruta_encabezado(ruta), "w", encoding="utf-8") as archivo:
+        json.dump(encabezado, archivo, ensure_ascii=False)
+
+
+def abrir_archivo_barrido(ruta: str, modo: str = 'r') -> GrillaBarrido:
+    """Abre una grilla guardada sin copiarla a memoria (np.load con mmap_mode)"""
+    with open(ruta_encabezado(ruta), encoding="utf-8") as archivo:
+        encabezado = json.load(archivo)
+    if encabezado.get("version") != VERSION_ENCABEZADO:
+        raise ValueError(f"Versión de encabezado no soportada en '{ruta}'")
+    
+    aceleraciones = np.load(ruta, mmap_mode=modo)
+    if list(aceleraciones.shape) != encabezado["forma"]:
+        raise ValueError(f"La grilla '{ruta}' no coincide con su encabezado")
+    
+    return GrillaBarrido(
+        porcentajes_mejora=np.asarray(encabezado["ejes"]["f"], dtype=np.float64),
+        factores_mejora=np.asarray(encabezado["ejes"]["k"], dtype=np.float64),
+        aceleraciones=aceleraciones,
+        componentes_base=_componentes(encabezado["componentes_base"])
+    )
+
+
+def _componentes(registros: List[Any]) -> List[ComponenteGPU]:
+    return [ComponenteGPU(r["nombre"], r["f"], r["k"]) for r in registros]
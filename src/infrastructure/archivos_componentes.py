@@ -0,0 +1,202 @@
+"""
+Lectura y escritura por bloques de inventarios de componentes (CSV / JSONL)
+"""
+from __future__ import annotations
+import csv
+import json
+import math
+import os
+from itertools import islice
+from operator import itemgetter
+from typing import IO, Any, Iterator, List, Optional, Sequence
+from ..domain.entities import BloqueComponentes, ResultadoLoteAmdahl
+from ..importacion_diferida import importar_diferido
+
+
+np = importar_diferido("numpy")
+
+
+FORMATOS_SOPORTADOS = ("csv", "jsonl")
+
+# Nombres de columna aceptados para cada campo de entrada
+COLUMNAS_NOMBRE = ("nombre", "name")
+COLUMNAS_F = ("f", "porcentaje_mejora")
+COLUMNAS_K = ("k", "factor_mejora")
+
+
+def detectar_formato(
+    ruta: str,
+    formato: Optional[str] = None,
+    predeterminado: Optional[str] = None
+) -> str:
+    # `predeterminado` se usa si la ruta no tiene extensión, p. ej. '-' (stdin/stdout)
+    if formato:
+        formato = formato.lower()
+    else:
+        formato = os.path.splitext(ruta)[1].lstrip(".").lower()
+        if formato == "ndjson":
+            formato = "jsonl"
+        if not formato and predeterminado:
+            formato = predeterminado
+    
+    if formato not in FORMATOS_SOPORTADOS:
+        raise ValueError(
+            f"Formato no soportado: '{formato}'. Use uno de: {', '.join(FORMATOS_SOPORTADOS)}"
+        )
+    return formato
+
+
+def leer_bloques(
+    archivo: IO[str],
+    formato: str,
+    tamano_bloque: int = 100_000
+) -> Iterator[BloqueComponentes]:
+    """Recorre el archivo entregando bloques de a lo más `tamano_bloque` filas"""
+    if tamano_bloque <= 0:
+        raise ValueError("El tamaño de bloque debe ser mayor a 0")
+    
+    filas = _filas_csv(archivo) if formato == "csv" else _filas_jsonl(archivo)
+    
+    while True:
+        bloque = list(islice(filas, tamano_bloque))
+        if not bloque:
+            return
+        nombres, valores_f, valores_k = zip(*bloque)
+        yield BloqueComponentes(
+            nombres=list(nombres),
+            porcentajes_mejora=a_flotantes(valores_f),
+            factores_mejora=a_flotantes(valores_k)
+        )
+
+
+class EscritorResultados:
+    """Escribe incrementalmente los resultados de cada bloque evaluado"""
+    
+    def __init__(self, archivo: IO[str], formato: str, incluir_tiempo: bool = False):
+        self.archivo = archivo
+        self.formato = formato
+        self.columnas = ["nombre", "f", "k", "aceleracion", "limite_teorico", "valido"]
+        if incluir_tiempo:
+            self.columnas.insert(5, "tiempo_optimizado")
+        
+        self._csv = None
+        if formato == "csv":
+            self._csv = csv.writer(archivo, lineterminator="\n")
+            self._csv.writerow(self.columnas)
+    
+    def escribir(self, bloque: BloqueComponentes, resultado: ResultadoLoteAmdahl) -> None:
+        columnas = [
+            bloque.nombres,
+            bloque.porcentajes_mejora,
+            bloque.factores_mejora,
+            resultado.aceleracion,
+            resultado.limite_teorico,
+        ]
+        if "tiempo_optimizado" in self.columnas:
+            columnas.append(np.broadcast_to(
+                resultado.tiempo_optimizado, resultado.aceleracion.shape
+            ))
+        columnas.append(resultado.validos.tolist())
+        
+        if self._csv is not None:
+            # NaN se escribe como celda vacía
+            columnas[1:-1] = [_textos_csv(c) for c in columnas[1:-1]]
+            self._csv.writerows(zip(*columnas))
+        else:
+            columnas[1:-1] = [c.tolist() for c in columnas[1:-1]]
+            self.archivo.writelines(
+                json.dumps(
+                    dict(zip(self.columnas, (_valor_json(v) for v in fila))),
+                    ensure_ascii=False
+                ) + "\n"
+                for fila in zip(*columnas)
+            )
+
+
+def _filas_csv(archivo: IO[str]) -> Iterator[tuple]:
+    lector = csv.reader(archivo)
+    encabezado = next(lector, None)
+    if encabezado is None:
+        return
+    
+    encabezado = [c.strip().lower() for c in encabezado]
+    i_nombre = _indice_columna(encabezado, COLUMNAS_NOMBRE)
+    i_f = _indice_columna(encabezado, COLUMNAS_F)
+    i_k = _indice_columna(encabezado, COLUMNAS_K)
+    
+    campos = itemgetter(i_nombre, i_f, i_k)
+    for fila in lector:
+        if not fila:
+            continue
+        try:
+            yield campos(fila)
+        except IndexError:
+            yield _celda(fila, i_nombre), _celda(fila, i_f), _celda(fila, i_k)
+
+
+def _filas_jsonl(archivo: IO[str]) -> Iterator[tuple]:
+    for numero, linea in enumerate(archivo, start=1):
+        linea = linea.strip()
+        if not linea:
+            continue
+        try:
+            registro = json.loads(linea)
+        except json.JSONDecodeError:
+            yield "", None, None
+            continue
+        if not isinstance(registro, dict):
+            raise ValueError(
+                f"Línea {numero}: se esperaba un objeto JSON con nombre, f y k, "
+                f"no {type(registro).__name__}"
+            )
+        yield (
+            str(campo(registro, COLUMNAS_NOMBRE) or ""),
+            campo(registro, COLUMNAS_F),
+            campo(registro, COLUMNAS_K),
+        )
+
+
+def _indice_columna(encabezado: List[str], alias: Sequence[str]) -> int:
+    for nombre in alias:
+        if nombre in encabezado:
+            return encabezado.index(nombre)
+    raise ValueError(f"Falta la columna '{alias[0]}' en el encabezado")
+
+
+def _celda(fila: List[str], indice: int) -> str:
+    return fila[indice] if indice < len(fila) else ""
+
+
+def campo(registro: dict, alias: Sequence[str]) -> Any:
+    for nombre in alias:
+        if nombre in registro:
+            return registro[nombre]
+    return None
+
+
+def a_flotantes(valores: Sequence) -> np.ndarray:
+    # Camino rápido para columnas limpias; si falla, valores inválidos → NaN
+    try:
+        return np.asarray(valores, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.fromiter((_a_flotante(v) for v in valores), dtype=np.float64, count=len(valores))
+
+
+def _a_flotante(valor: Any) -> float:
+    try:
+        return float(valor)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _textos_csv(valores: np.ndarray) -> list:
+    lista = valores.tolist()
+    if not np.isnan(valores).any():
+        return lista
+    return ["" if v != v else v for v in lista]  # v != v solo para NaN
+
+
+def _valor_json(valor: Any) -> Any:
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None if math.isnan(valor) else str(valor)
+    return valor
@@ -0,0 +1,223 @@
+"""
+Evaluación de grillas f × k por teselas en un pool de procesos
+"""
+from __future__ import annotations
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Sequence, Tuple
+from ..domain.entities import (
+    DefinicionBarrido,
+    ICalculadorAmdahl,
+    IEjecutorBarrido,
+    ResultadoBarrido
+)
+from ..importacion_diferida import importar_diferido
+from .archivo_barrido import crear_archivo_barrido
+
+
+np = importar_diferido("numpy")
+
+
+Tesela = Tuple[int, int, int, int]  # (f desde, f hasta, k desde, k hasta)
+
+
+class EjecutorBarridoParalelo(IEjecutorBarrido):
+    """
+    Divide la grilla en teselas y las evalúa en un ProcessPoolExecutor.
+    
+    Cada proceso reduce su tesela (máximo, argmax, conteos por umbral) y solo
+    devuelve esos escalares, de modo que la grilla completa no se materializa
+    salvo que se pida; en ese caso los procesos escriben directamente en un
+    bloque de memoria compartida o, con `archivo_salida`, en un .npy mapeado
+    en memoria (para grillas que no caben en RAM). El calculador debe poder
+    serializarse (pickle) para enviarse a los procesos.
+    """
+    
+    def __init__(
+        self,
+        calculador: ICalculadorAmdahl,
+        procesos: Optional[int] = None,
+        tesela: Tuple[int, int] = (256, 4096)
+    ):
+        self.calculador = calculador
+        self.procesos = procesos or os.cpu_count() or 1
+        self.tesela = tesela
+    
+    def ejecutar(self, definicion: DefinicionBarrido) -> ResultadoBarrido:
+        f = np.ascontiguousarray(definicion.porcentajes_mejora, dtype=np.float64)
+        k = np.ascontiguousarray(definicion.factores_mejora, dtype=np.float64)
+        umbrales = [float(u) for u in definicion.umbrales]
+        teselas = _dividir_en_teselas(len(f), len(k), *self.tesela)
+        argumentos = (
+            self.calculador, f, k,
+            [c.porcentaje_mejora for c in definicion.componentes_base],
+            [c.factor_mejora for c in definicion.componentes_base],
+            umbrales
+        )
+        
+        inicio = time.perf_counter()
+        memoria = None
+        aceleraciones = None
+        ruta = definicion.archivo_salida
+        try:
+            if ruta is not None:
+                crear_archivo_barrido(ruta, f, k, definicion.componentes_base)
+            elif definicion.materializar:
+                memoria = SharedMemory(create=True, size=max(f.size * k.size * 8, 1))
+            argumentos += (memoria.name if memoria else None, ruta)
+            
+            if self.procesos == 1 or len(teselas) <= 1:
+                contexto = _ContextoBarrido(*argumentos)
+                try:
+                    parciales = [contexto.evaluar(t) for t in teselas]
+                finally:
+                    contexto.cerrar()
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=self.procesos,
+                    initializer=_inicializar_trabajador,
+                    initargs=argumentos
+                ) as pool:
+                    parciales = list(pool.map(
+                        _evaluar_en_trabajador, teselas,
+                        chunksize=max(1, len(teselas) // (self.procesos * 4))
+                    ))
+            
+            if memoria is not None:
+                aceleraciones = np.ndarray(
+                    (f.size, k.size), dtype=np.float64, buffer=memoria.buf
+                ).copy()
+            elif ruta is not None:
+                aceleraciones = np.load(ruta, mmap_mode='r')
+        finally:
+            if memoria is not None:
+                memoria.close()
+                memoria.unlink()
+        
+        return _combinar_parciales(
+            parciales, f.size * k.size, umbrales,
+            time.perf_counter() - inicio, aceleraciones
+        )
+
+
+class _ContextoBarrido:
+    # Estado de evaluación compartido por todas las teselas de un proceso
+    
+    def __init__(
+        self,
+        calculador: ICalculadorAmdahl,
+        f: np.ndarray,
+        k: np.ndarray,
+        f_base: List[float],
+        k_base: List[float],
+        umbrales: List[float],
+        nombre_memoria: Optional[str],
+        ruta_salida: Optional[str] = None
+    ):
+        self.calculador = calculador
+        self.f = f
+        self.k = k
+        self.f_base = np.asarray(f_base, dtype=np.float64)
+        self.k_base = np.asarray(k_base, dtype=np.float64)
+        self.umbrales = umbrales
+        self.memoria = None
+        self.salida = None
+        if nombre_memoria is not None:
+            self.memoria = SharedMemory(name=nombre_memoria)
+            self.salida = np.ndarray((f.size, k.size), dtype=np.float64, buffer=self.memoria.buf)
+        elif ruta_salida is not None:
+            self.salida = np.load(ruta_salida, mmap_mode='r+')
+    
+    def evaluar(self, tesela: Tesela) -> tuple:
+        i0, i1, j0, j1 = tesela
+        f = self.f[i0:i1, np.newaxis]
+        k = self.k[np.newaxis, j0:j1]
+        
+        if self.f_base.size == 0:
+            lote = self.calculador.calcular_lote(f, k, decimales=None)
+        else:
+            # El punto (f, k) se agrega como un componente más del paquete base
+            forma = (i1 - i0, j1 - j0)
+            lote = self.calculador.calcular_lote_combinado(
+                _apilar(f, self.f_base, forma), _apilar(k, self.k_base, forma),
+                decimales=None
+            )
+        
+        aceleracion = lote.aceleracion
+        if self.salida is not None:
+            self.salida[i0:i1, j0:j1] = aceleracion
+        
+        validos = int(np.count_nonzero(lote.validos))
+        if validos == 0:
+            return validos, -np.inf, None, [0] * len(self.umbrales)
+        
+        comparables = np.where(lote.validos, aceleracion, -np.inf)
+        posicion = int(np.argmax(comparables))
+        fila, columna = divmod(posicion, j1 - j0)
+        conteos = [int(np.count_nonzero(comparables >= u)) for u in self.umbrales]
+        return validos, float(comparables.flat[posicion]), (i0 + fila, j0 + columna), conteos
+    
+    def cerrar(self) -> None:
+        if isinstance(self.salida, np.memmap):
+            self.salida.flush()
+        self.salida = None
+        if self.memoria is not None:
+            self.memoria.close()
+
+
+_contexto_trabajador: Optional[_ContextoBarrido] = None
+
+
+def _inicializar_trabajador(*argumentos) -> None:
+    global _contexto_trabajador
+    _contexto_trabajador = _ContextoBarrido(*argumentos)
+
+
+def _evaluar_en_trabajador(tesela: Tesela) -> tuple:
+    return _contexto_trabajador.evaluar(tesela)
+
+
+def _dividir_en_teselas(n_f: int, n_k: int, alto: int, ancho: int) -> List[Tesela]:
+    return [
+        (i, min(i + alto, n_f), j, min(j + ancho, n_k))
+        for i in range(0, n_f, alto)
+        for j in range(0, n_k, ancho)
+    ]
+
+
+def _apilar(valores: np.ndarray, base: np.ndarray, forma: Tuple[int, int]) -> np.ndarray:
+    columnas = np.empty(forma + (1 + base.size,), dtype=np.float64)
+    columnas[..., 0] = valores
+    columnas[..., 1:] = base
+    return columnas
+
+
+def _combinar_parciales(
+    parciales: Sequence[tuple],
+    puntos: int,
+    umbrales: List[float],
+    segundos: float,
+    aceleraciones: Optional[np.ndarray]
+) -> ResultadoBarrido:
+    puntos_validos = 0
+    maximo = -np.inf
+    indice_maximo = None
+    conteos = [0] * len(umbrales)
+    
+    for validos, maximo_tesela, indice, conteos_tesela in parciales:
+        puntos_validos += validos
+        if indice is not None and maximo_tesela > maximo:
+            maximo, indice_maximo = maximo_tesela, indice
+        conteos = [a + b for a, b in zip(conteos, conteos_tesela)]
+    
+    return ResultadoBarrido(
+        puntos=puntos,
+        puntos_validos=puntos_validos,
+        aceleracion_maxima=float(maximo) if indice_maximo is not None else float('nan'),
+        indice_maximo=indice_maximo,
+        conteos_umbral=dict(zip(umbrales, conteos)),
+        segundos=segundos,
+        aceleraciones=aceleraciones
+    )
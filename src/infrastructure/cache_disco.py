@@ -0,0 +1,351 @@
+"""
+Caché persistente en disco (archivos .npy direccionados por contenido)
+"""
+from __future__ import annotations
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Iterable, Optional
+from ..domain.entities import (
+    ComponenteGPU,
+    ICalculadorAmdahl,
+    ICalculadorGustafson,
+    PaqueteMejoras,
+    ResultadoLoteAmdahl,
+    como_calculador_gustafson
+)
+from ..domain.value_objects import ConstantesMatematicas
+from ..importacion_diferida import importar_diferido
+from .calculador_cache import EstadisticasCache
+
+
+np = importar_diferido("numpy")
+
+
+# Cambiar si se modifica la forma en que se guardan las entradas
+VERSION_FORMATO = 1
+
+VARIABLE_ENTORNO_DIRECTORIO = "AMDAHL_CACHE_DIR"
+
+
+class AlmacenArreglosDisco:
+    """
+    Guarda arreglos numpy como archivos .npy cuyo nombre es el hash de la
+    definición que los produjo (entradas, operación y precisión).
+    
+    Las lecturas usan np.load con mmap_mode='r', así que abrir una entrada
+    grande no la copia a memoria. Cuando el total supera `capacidad_bytes`
+    se eliminan primero las entradas usadas hace más tiempo (cada acierto
+    actualiza la fecha de modificación del archivo). Las escrituras son
+    atómicas (archivo temporal + os.replace), por lo que varios procesos
+    pueden compartir el mismo directorio.
+    """
+    
+    def __init__(self, directorio: str, capacidad_bytes: int = 512 * 1024**2):
+        if capacidad_bytes <= 0:
+            raise ValueError("La capacidad del caché debe ser mayor a 0")
+        self.directorio = directorio
+        self.capacidad_bytes = capacidad_bytes
+        self._lock = threading.Lock()
+        self._aciertos = 0
+        self._fallos = 0
+        self._desalojos = 0
+        os.makedirs(directorio, exist_ok=True)
+    
+    @staticmethod
+    def clave(operacion: str, *partes: Any) -> str:
+        # Cada parte se resume con su tipo, forma y bytes: mismo contenido → misma clave
+        resumen = hashlib.sha256(f"v{VERSION_FORMATO}:{operacion}".encode())
+        for parte in partes:
+            if parte is None:
+                resumen.update(b"|none")
+                continue
+            arreglo = np.ascontiguousarray(parte, dtype=np.float64)
+            resumen.update(f"|{arreglo.dtype.str}{arreglo.shape}".encode())
+            resumen.update(arreglo.data)
+        return resumen.hexdigest()
+    
+    def obtener(self, clave: str) -> Optional[np.ndarray]:
+        ruta = self._ruta(clave)
+        try:
+            arreglo = np.load(ruta, mmap_mode='r')
+            os.utime(ruta)
+        except (FileNotFoundError, ValueError, OSError):
+            with self._lock:
+                self._fallos += 1
+            return None
+        with self._lock:
+            self._aciertos += 1
+        return arreglo
+    
+    def guardar(self, clave: str, arreglo: np.ndarray) -> None:
+        if arreglo.nbytes > self.capacidad_bytes:
+            return  # Se desalojaría de inmediato
+        descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as archivo:
+                np.save(archivo, np.ascontiguousarray(arreglo))
+            os.replace(temporal, self._ruta(clave))
+        except BaseException:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            raise
+        self._desalojar()
+    
+    def obtener_o_calcular(
+        self,
+        clave: str,
+        calcular: Callable[[], np.ndarray]
+    ) -> np.ndarray:
+        arreglo = self.obtener(clave)
+        if arreglo is None:
+            arreglo = calcular()
+            self.guardar(clave, arreglo)
+        return arreglo
+    
+    def estadisticas(self) -> EstadisticasCache:
+        with self._lock:
+            return EstadisticasCache(
+                aciertos=self._aciertos,
+                fallos=self._fallos,
+                desalojos=self._desalojos,
+                tamano=sum(tamano for _, _, tamano in self._entradas()),
+                capacidad=self.capacidad_bytes
+            )
+    
+    def limpiar(self) -> None:
+        with self._lock:
+            for ruta, _, _ in self._entradas():
+                _eliminar(ruta)
+            self._aciertos = self._fallos = self._desalojos = 0
+    
+    def __getstate__(self) -> dict:
+        # Para enviarlo a otros procesos: comparten el directorio, no los contadores
+        return {"directorio": self.directorio, "capacidad_bytes": self.capacidad_bytes}
+    
+    def __setstate__(self, estado: dict) -> None:
+        self.__init__(estado["directorio"], estado["capacidad_bytes"])
+    
+    def _ruta(self, clave: str) -> str:
+        return os.path.join(self.directorio, f"{clave}.npy")
+    
+    def _entradas(self) -> Iterable[tuple]:
+        # (ruta, última modificación, bytes) de cada entrada
+        with os.scandir(self.directorio) as archivos:
+            for archivo in archivos:
+                if archivo.name.endswith(".npy"):
+                    try:
+                        estado = archivo.stat()
+                    except FileNotFoundError:
+                        continue
+                    yield archivo.path, estado.st_mtime, estado.st_size
+    
+    def _desalojar(self) -> None:
+        with self._lock:
+            entradas = sorted(self._entradas(), key=lambda entrada: entrada[1])
+            total = sum(tamano for _, _, tamano in entradas)
+            for ruta, _, tamano in entradas:
+                if total <= self.capacidad_bytes:
+                    break
+                _eliminar(ruta)
+                total -= tamano
+                self._desalojos += 1
+
+
+class CalculadorAmdahlCacheDisco(ICalculadorAmdahl, ICalculadorGustafson):
+    """
+    Decorador que guarda en disco los resultados de calcular_lote y
+    calcular_lote_combinado; el resto se delega.
+    
+    Cada lote se guarda, así que conviene envolver solo el calculador de
+    quienes repiten grillas (curvas de los gráficos, barridos) y no el de
+    los lotes de un solo uso, que desalojarían esas grillas.
+    
+    Los arreglos devueltos desde el caché son vistas de solo lectura sobre
+    un archivo mapeado en memoria. Las entradas con menos de
+    `elementos_minimos` puntos se calculan directamente, ya que para grillas
+    muy pequeñas recalcular es más barato que leer el archivo.
+    """
+    
+    def __init__(
+        self,
+        calculador: ICalculadorAmdahl,
+        almacen: AlmacenArreglosDisco,
+        elementos_minimos: int = 0
+    ):
+        self.calculador = calculador
+        self.almacen = almacen
+        self.elementos_minimos = elementos_minimos
+    
+    def calcular_aceleracion(self, componente: ComponenteGPU) -> float:
+        return self.calculador.calcular_aceleracion(componente)
+    
+    def calcular_limite_teorico(self, componente: ComponenteGPU) -> float:
+        return self.calculador.calcular_limite_teorico(componente)
+    
+    def calcular_tiempo_optimizado(
+        self,
+        tiempo_original: float,
+        aceleracion: float
+    ) -> float:
+        return self.calculador.calcular_tiempo_optimizado(tiempo_original, aceleracion)
+    
+    def calcular_lote(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        return self._memorizar(
+            "lote", self.calculador.calcular_lote,
+            porcentajes_mejora, factores_mejora, tiempo_original, decimales
+        )
+    
+    def calcular_factor_necesario_lote(
+        self,
+        porcentajes_mejora: Any,
+        aceleraciones_objetivo: Any,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> Any:
+        return self.calculador.calcular_factor_necesario_lote(
+            porcentajes_mejora, aceleraciones_objetivo, decimales
+        )
+    
+    def calcular_porcentaje_necesario_lote(
+        self,
+        factores_mejora: Any,
+        aceleraciones_objetivo: Any,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> Any:
+        return self.calculador.calcular_porcentaje_necesario_lote(
+            factores_mejora, aceleraciones_objetivo, decimales
+        )
+    
+    def calcular_aceleracion_combinada(self, paquete: PaqueteMejoras) -> float:
+        return self.calculador.calcular_aceleracion_combinada(paquete)
+    
+    def calcular_lote_combinado(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        return self._memorizar(
+            "lote_combinado", self.calculador.calcular_lote_combinado,
+            porcentajes_mejora, factores_mejora, tiempo_original, decimales
+        )
+    
+    def calcular_aceleracion_escalada(self, componente: ComponenteGPU) -> float:
+        return como_calculador_gustafson(self.calculador).calcular_aceleracion_escalada(
+            componente
+        )
+    
+    def calcular_lote_escalado(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        return como_calculador_gustafson(self.calculador).calcular_lote_escalado(
+            porcentajes_mejora, factores_mejora, tiempo_original, decimales
+        )
+    
+    def calcular_lote_mixto(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        escalamiento: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        return como_calculador_gustafson(self.calculador).calcular_lote_mixto(
+            porcentajes_mejora, factores_mejora, escalamiento, tiempo_original, decimales
+        )
+    
+    def calcular_factor_necesario_escalado_lote(
+        self,
+        porcentajes_mejora: Any,
+        aceleraciones_objetivo: Any,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> Any:
+        return como_calculador_gustafson(self.calculador).calcular_factor_necesario_escalado_lote(
+            porcentajes_mejora, aceleraciones_objetivo, decimales
+        )
+    
+    def calcular_lote_combinado_escalado(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        return como_calculador_gustafson(self.calculador).calcular_lote_combinado_escalado(
+            porcentajes_mejora, factores_mejora, tiempo_original, decimales
+        )
+    
+    def estadisticas(self) -> EstadisticasCache:
+        return self.almacen.estadisticas()
+    
+    def __getattr__(self, nombre: str):
+        # Resto de métodos propios del calculador envuelto
+        if nombre == "calculador":
+            raise AttributeError(nombre)
+        return getattr(self.calculador, nombre)
+    
+    def _memorizar(
+        self,
+        operacion: str,
+        calcular: Callable[..., ResultadoLoteAmdahl],
+        f: Any,
+        k: Any,
+        tiempo_original: Optional[Any],
+        decimales: Optional[int]
+    ) -> ResultadoLoteAmdahl:
+        if np.broadcast(np.asarray(f), np.asarray(k)).size < self.elementos_minimos:
+            return calcular(f, k, tiempo_original, decimales)
+        
+        clave = self.almacen.clave(operacion, f, k, tiempo_original, decimales)
+        guardado = self.almacen.obtener(clave)
+        if guardado is not None:
+            return _desapilar(guardado, tiempo_original is not None)
+        
+        lote = calcular(f, k, tiempo_original, decimales)
+        apilado = _apilar(lote)
+        if apilado is not None:
+            self.almacen.guardar(clave, apilado)
+        return lote
+
+
+def _apilar(lote: ResultadoLoteAmdahl) -> Optional[np.ndarray]:
+    # Una entrada = filas [aceleración, límite, válidos (0/1), tiempo optimizado]
+    columnas = [lote.aceleracion, lote.limite_teorico, lote.validos]
+    if lote.tiempo_optimizado is not None:
+        if np.shape(lote.tiempo_optimizado) != np.shape(lote.aceleracion):
+            return None  # tiempo_original con más dimensiones que la grilla: no se guarda
+        columnas.append(lote.tiempo_optimizado)
+    return np.stack([np.asarray(c, dtype=np.float64) for c in columnas])
+
+
+def _desapilar(apilado: np.ndarray, con_tiempo: bool) -> ResultadoLoteAmdahl:
+    return ResultadoLoteAmdahl(
+        aceleracion=apilado[0],
+        limite_teorico=apilado[1],
+        validos=apilado[2] != 0,
+        tiempo_optimizado=apilado[3] if con_tiempo else None
+    )
+
+
+def _eliminar(ruta: str) -> None:
+    try:
+        os.remove(ruta)
+    except FileNotFoundError:
+        pass
+
+
+def directorio_por_defecto() -> Optional[str]:
+    # Directorio configurado por variable de entorno (None: caché desactivado)
+    return os.environ.get(VARIABLE_ENTORNO_DIRECTORIO) or None
@@ -1,10 +1,23 @@
+from __future__ import annotations
 import math
-from ..domain.entities import ComponenteGPU, ICalculadorAmdahl
+from typing import Any, Optional
+from ..domain.entities import (
+    ComponenteGPU, 
+    ICalculadorAmdahl, 
+    ICalculadorGustafson, 
+    PaqueteMejoras, 
+    ResultadoLoteAmdahl,
+    ResultadoSensibilidades
+)
 from ..domain.value_objects import ConstantesMatematicas
+from ..importacion_diferida import importar_diferido
 
 
-class CalculadorAmdahl(ICalculadorAmdahl):
-    #Implementación concreta del calculador de Ley de Amdahl
+np = importar_diferido("numpy")
+
+
+class CalculadorAmdahl(ICalculadorAmdahl, ICalculadorGustafson):
+    #Implementación concreta del calculador de Ley de Amdahl (y de Gustafson, escalada)
     
     def calcular_aceleracion(self, componente: ComponenteGPU) -> float:
         f = componente.porcentaje_mejora
@@ -27,6 +40,46 @@ class CalculadorAmdahl(ICalculadorAmdahl):
         tiempo_optimizado = tiempo_original / aceleracion
         return round(tiempo_optimizado, ConstantesMatematicas.PRECISION_DECIMAL)
     
+    def calcular_sensibilidades_lote(
+        self, 
+        porcentajes_mejora: Any, 
+        factores_mejora: Any,
+        decimales: Optional[int] = None
+    ) -> ResultadoSensibilidades:
+        """
+        Derivadas de A = 1 / ((1 - f) + f/k) en forma cerrada, en una pasada:
+            
+            ∂A/∂f = A²·(1 - 1/k)     ∂A/∂k = A²·f/k²
+            ε_f = A·f·(1 - 1/k)      ε_k = A·f/k
+        
+        Mismo broadcasting y máscara `validos` que calcular_lote (NaN en los
+        pares inválidos). Por defecto no se redondea: las derivadas suelen
+        usarse para ordenar y se pierden empates con pocos decimales.
+        """
+        f, k = np.broadcast_arrays(
+            np.asarray(porcentajes_mejora, dtype=np.float64),
+            np.asarray(factores_mejora, dtype=np.float64)
+        )
+        validos = self.validar_lote(f, k)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ganancia = 1.0 - 1.0 / k
+            aceleracion = np.where(validos, 1.0 / (1.0 - f * ganancia), np.nan)
+            cuadrado = aceleracion * aceleracion
+            derivada_f = cuadrado * ganancia
+            derivada_k = cuadrado * f / (k * k)
+            elasticidad_f = aceleracion * f * ganancia
+            elasticidad_k = aceleracion * f / k
+        
+        return ResultadoSensibilidades(
+            aceleracion=_redondear(aceleracion, decimales),
+            derivada_f=_redondear(derivada_f, decimales),
+            derivada_k=_redondear(derivada_k, decimales),
+            elasticidad_f=_redondear(elasticidad_f, decimales),
+            elasticidad_k=_redondear(elasticidad_k, decimales),
+            validos=validos
+        )
+    
     def calcular_aceleracion_con_parametros(self, f: float, k: float) -> float:
         if not 0 <= f <= 1:
             raise ValueError("f debe estar entre 0 y 1")
@@ -50,3 +103,261 @@ class CalculadorAmdahl(ICalculadorAmdahl):
         
         k_necesario = f / (1/aceleracion_objetivo - (1 - f))
         return round(k_necesario, ConstantesMatematicas.PRECISION_DECIMAL)
+    
+    def validar_lote(self, f: Any, k: Any) -> np.ndarray:
+        """Máscara de pares válidos (0 <= f <= 1 y k > 1) sin lanzar excepciones"""
+        f = np.asarray(f, dtype=np.float64)
+        k = np.asarray(k, dtype=np.float64)
+        return (f >= 0) & (f <= 1) & (k > 1)
+    
+    def calcular_lote(
+        self, 
+        porcentajes_mejora: Any, 
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        """
+        Evalúa la Ley de Amdahl sobre arreglos de f y k en una sola pasada.
+        
+        Acepta cualquier secuencia o buffer convertible a arreglo numpy (con
+        broadcasting entre f, k y tiempo_original). Los pares inválidos no
+        lanzan ValueError: quedan en False en `validos` y su resultado es NaN.
+        Con decimales=None no se redondea.
+        """
+        f, k = np.broadcast_arrays(
+            np.asarray(porcentajes_mejora, dtype=np.float64),
+            np.asarray(factores_mejora, dtype=np.float64)
+        )
+        validos = self.validar_lote(f, k)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            no_mejorable = 1.0 - f
+            aceleracion = np.where(validos, 1.0 / (no_mejorable + f / k), np.nan)
+            limite_teorico = np.where(validos, 1.0 / no_mejorable, np.nan)
+        
+        return _armar_resultado_lote(
+            aceleracion, limite_teorico, validos, tiempo_original, decimales
+        )
+    
+    def calcular_factor_necesario_para_tiempo_lote(
+        self, 
+        porcentajes_mejora: Any, 
+        tiempo_original: Any,
+        tiempo_objetivo: Any,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> np.ndarray:
+        """k necesario para bajar de tiempo_original a tiempo_objetivo (A = T0 / T)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            aceleracion_necesaria = (
+                np.asarray(tiempo_original, dtype=np.float64)
+                / np.asarray(tiempo_objetivo, dtype=np.float64)
+            )
+        return self.calcular_factor_necesario_lote(
+            porcentajes_mejora, aceleracion_necesaria, decimales
+        )
+    
+    def calcular_aceleracion_combinada(self, paquete: PaqueteMejoras) -> float:
+        """A = 1 / ((1 - Σf_i) + Σ f_i/k_i) para mejoras simultáneas"""
+        fraccion_total = paquete.fraccion_total
+        fraccion_mejorada = sum(
+            c.porcentaje_mejora / c.factor_mejora for c in paquete.componentes
+        )
+        
+        aceleracion = 1 / (max(1 - fraccion_total, 0) + fraccion_mejorada)
+        return round(aceleracion, ConstantesMatematicas.PRECISION_DECIMAL)
+    
+    def calcular_lote_combinado(
+        self, 
+        porcentajes_mejora: Any, 
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        """
+        Aceleración combinada de muchos paquetes en una sola pasada.
+        
+        Los arreglos tienen forma (..., componentes): el último eje son los
+        componentes de cada paquete y se reduce. Paquetes con distinto número
+        de componentes se rellenan con f=0 (que no aporta nada, sea cual sea
+        k). Un paquete es inválido si algún componente lo es o si Σf > 1.
+        """
+        f, k = np.broadcast_arrays(
+            np.asarray(porcentajes_mejora, dtype=np.float64),
+            np.asarray(factores_mejora, dtype=np.float64)
+        )
+        relleno = f == 0
+        validos = np.all(self.validar_lote(f, k) | relleno, axis=-1)
+        
+        fraccion_total = f.sum(axis=-1)
+        validos &= fraccion_total <= 1 + ConstantesMatematicas.TOLERANCIA_FRACCION
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraccion_mejorada = np.where(relleno, 0.0, f / k).sum(axis=-1)
+            no_mejorable = np.maximum(1.0 - fraccion_total, 0.0)
+            aceleracion = np.where(validos, 1.0 / (no_mejorable + fraccion_mejorada), np.nan)
+            limite_teorico = np.where(validos, 1.0 / no_mejorable, np.nan)
+        
+        return _armar_resultado_lote(
+            aceleracion, limite_teorico, validos, tiempo_original, decimales
+        )
+    
+    def calcular_aceleracion_escalada(self, componente: ComponenteGPU) -> float:
+        """S = (1 - f) + f·k: el trabajo paralelo crece con la mejora (Gustafson)"""
+        f = componente.porcentaje_mejora
+        k = componente.factor_mejora
+        
+        aceleracion = (1 - f) + f * k
+        return round(aceleracion, ConstantesMatematicas.PRECISION_DECIMAL)
+    
+    def calcular_lote_escalado(
+        self, 
+        porcentajes_mejora: Any, 
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        """
+        Ley de Gustafson sobre arreglos de f y k, con la misma semántica que
+        calcular_lote. La aceleración escalada no tiene techo (límite inf) y
+        tiempo_optimizado es el tiempo por unidad del trabajo original.
+        """
+        f, k = np.broadcast_arrays(
+            np.asarray(porcentajes_mejora, dtype=np.float64),
+            np.asarray(factores_mejora, dtype=np.float64)
+        )
+        validos = self.validar_lote(f, k)
+        
+        aceleracion = np.where(validos, (1.0 - f) + f * k, np.nan)
+        limite_teorico = np.where(validos, np.inf, np.nan)
+        
+        return _armar_resultado_lote(
+            aceleracion, limite_teorico, validos, tiempo_original, decimales
+        )
+    
+    def calcular_lote_mixto(
+        self, 
+        porcentajes_mejora: Any, 
+        factores_mejora: Any,
+        escalamiento: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        """
+        Modelo mixto de escalamiento fuerte/débil (Sun-Ni): al mejorar k, el
+        trabajo paralelo crece G = k^α veces y
+            
+            S = ((1 - f) + f·G) / ((1 - f) + f·G/k)
+        
+        α = 0 es Amdahl (trabajo fijo) y α = 1 es Gustafson. `escalamiento`
+        (α) hace broadcasting con f y k: con α de forma (modelos, 1) y f, k de
+        forma (n,) se evalúan varios modelos sobre n candidatos en una pasada.
+        Los α fuera de [0, 1] se marcan como inválidos.
+        """
+        f, k, alfa = np.broadcast_arrays(
+            np.asarray(porcentajes_mejora, dtype=np.float64),
+            np.asarray(factores_mejora, dtype=np.float64),
+            np.asarray(escalamiento, dtype=np.float64)
+        )
+        validos = self.validar_lote(f, k) & (alfa >= 0) & (alfa <= 1)
+        
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            no_mejorable = 1.0 - f
+            crecimiento = f * np.power(k, alfa)
+            aceleracion = np.where(
+                validos, (no_mejorable + crecimiento) / (no_mejorable + crecimiento / k), np.nan
+            )
+            # Solo con trabajo fijo (α = 0) la aceleración tiene techo
+            limite_teorico = np.where(
+                validos, np.where(alfa == 0, 1.0 / no_mejorable, np.inf), np.nan
+            )
+        
+        return _armar_resultado_lote(
+            aceleracion, limite_teorico, validos, tiempo_original, decimales
+        )
+    
+    def calcular_factor_necesario_escalado_lote(
+        self, 
+        porcentajes_mejora: Any, 
+        aceleraciones_objetivo: Any,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> np.ndarray:
+        """
+        k necesario para una aceleración escalada objetivo (con broadcasting).
+        
+        k = 1 + (S - 1) / f. Devuelve inf si f = 0 y NaN si la entrada es
+        inválida (f fuera de [0, 1] o S <= 1).
+        """
+        f, objetivo = np.broadcast_arrays(
+            np.asarray(porcentajes_mejora, dtype=np.float64),
+            np.asarray(aceleraciones_objetivo, dtype=np.float64)
+        )
+        validos = (f >= 0) & (f <= 1) & (objetivo > 1)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k_necesario = np.where(f > 0, 1.0 + (objetivo - 1.0) / f, np.inf)
+        k_necesario = np.where(validos, k_necesario, np.nan)
+        
+        return _redondear(k_necesario, decimales)
+    
+    def calcular_lote_combinado_escalado(
+        self, 
+        porcentajes_mejora: Any, 
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        """
+        S = (1 - Σf_i) + Σ f_i·k_i para muchos paquetes en una sola pasada,
+        con el mismo formato (..., componentes) y relleno f=0 que
+        calcular_lote_combinado.
+        """
+        f, k = np.broadcast_arrays(
+            np.asarray(porcentajes_mejora, dtype=np.float64),
+            np.asarray(factores_mejora, dtype=np.float64)
+        )
+        relleno = f == 0
+        validos = np.all(self.validar_lote(f, k) | relleno, axis=-1)
+        
+        fraccion_total = f.sum(axis=-1)
+        validos &= fraccion_total <= 1 + ConstantesMatematicas.TOLERANCIA_FRACCION
+        
+        with np.errstate(invalid='ignore'):
+            fraccion_escalada = np.where(relleno, 0.0, f * k).sum(axis=-1)
+        no_mejorable = np.maximum(1.0 - fraccion_total, 0.0)
+        aceleracion = np.where(validos, no_mejorable + fraccion_escalada, np.nan)
+        limite_teorico = np.where(validos, np.inf, np.nan)
+        
+        return _armar_resultado_lote(
+            aceleracion, limite_teorico, validos, tiempo_original, decimales
+        )
+
+
+def _redondear(valores: np.ndarray, decimales: Optional[int]) -> np.ndarray:
+    if decimales is not None:
+        np.round(valores, decimales, out=valores)
+    return valores
+
+
+def _armar_resultado_lote(
+    aceleracion: np.ndarray,
+    limite_teorico: np.ndarray,
+    validos: np.ndarray,
+    tiempo_original: Optional[Any],
+    decimales: Optional[int]
+) -> ResultadoLoteAmdahl:
+    tiempo_optimizado = None
+    if tiempo_original is not None:
+        tiempo_optimizado = np.asarray(tiempo_original, dtype=np.float64) / aceleracion
+    
+    _redondear(aceleracion, decimales)
+    _redondear(limite_teorico, decimales)
+    if tiempo_optimizado is not None:
+        tiempo_optimizado = _redondear(np.asarray(tiempo_optimizado), decimales)
+    
+    return ResultadoLoteAmdahl(
+        aceleracion=aceleracion,
+        limite_teorico=limite_teorico,
+        validos=validos,
+        tiempo_optimizado=tiempo_optimizado
+    )
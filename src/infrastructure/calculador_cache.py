@@ -0,0 +1,225 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+from ..domain.entities import (
+    ComponenteGPU,
+    ICalculadorAmdahl,
+    ICalculadorGustafson,
+    PaqueteMejoras,
+    ResultadoLoteAmdahl,
+    como_calculador_gustafson
+)
+from ..domain.value_objects import ConstantesMatematicas
+
+
+@dataclass
+class EstadisticasCache:
+    aciertos: int
+    fallos: int
+    desalojos: int
+    tamano: int
+    capacidad: int
+    
+    @property
+    def tasa_aciertos(self) -> float:
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+
+class CalculadorAmdahlCache(ICalculadorAmdahl, ICalculadorGustafson):
+    """
+    Decorador LRU para cualquier ICalculadorAmdahl.
+    
+    Memoriza los cálculos escalares con clave (operación, f, k, precisión) y
+    delega el resto (lotes y métodos propios del calculador envuelto), por lo
+    que puede reemplazar al calculador en cualquier caso de uso sin cambios.
+    Los métodos de ICalculadorGustafson requieren que el envuelto la implemente.
+    """
+    
+    def __init__(self, calculador: ICalculadorAmdahl, capacidad: int = 1024):
+        if capacidad <= 0:
+            raise ValueError("La capacidad del caché debe ser mayor a 0")
+        self.calculador = calculador
+        self.capacidad = capacidad
+        self._entradas: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._aciertos = 0
+        self._fallos = 0
+        self._desalojos = 0
+    
+    def calcular_aceleracion(self, componente: ComponenteGPU) -> float:
+        f, k = componente.porcentaje_mejora, componente.factor_mejora
+        return self._memorizar(
+            ("aceleracion", f, k, ConstantesMatematicas.PRECISION_DECIMAL),
+            lambda: self.calculador.calcular_aceleracion(componente)
+        )
+    
+    def calcular_limite_teorico(self, componente: ComponenteGPU) -> float:
+        f = componente.porcentaje_mejora
+        return self._memorizar(
+            ("limite_teorico", f, None, ConstantesMatematicas.PRECISION_DECIMAL),
+            lambda: self.calculador.calcular_limite_teorico(componente)
+        )
+    
+    def calcular_tiempo_optimizado(
+        self,
+        tiempo_original: float,
+        aceleracion: float
+    ) -> float:
+        return self._memorizar(
+            ("tiempo_optimizado", tiempo_original, aceleracion,
+             ConstantesMatematicas.PRECISION_DECIMAL),
+            lambda: self.calculador.calcular_tiempo_optimizado(tiempo_original, aceleracion)
+        )
+    
+    def calcular_aceleracion_con_parametros(self, f: float, k: float) -> float:
+        # Las excepciones de validación no se memorizan
+        return self._memorizar(
+            ("aceleracion", f, k, ConstantesMatematicas.PRECISION_DECIMAL),
+            lambda: self.calculador.calcular_aceleracion_con_parametros(f, k)
+        )
+    
+    def calcular_lote(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        return self.calculador.calcular_lote(
+            porcentajes_mejora, factores_mejora, tiempo_original, decimales
+        )
+    
+    def calcular_factor_necesario_lote(
+        self,
+        porcentajes_mejora: Any,
+        aceleraciones_objetivo: Any,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> Any:
+        return self.calculador.calcular_factor_necesario_lote(
+            porcentajes_mejora, aceleraciones_objetivo, decimales
+        )
+    
+    def calcular_porcentaje_necesario_lote(
+        self,
+        factores_mejora: Any,
+        aceleraciones_objetivo: Any,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> Any:
+        return self.calculador.calcular_porcentaje_necesario_lote(
+            factores_mejora, aceleraciones_objetivo, decimales
+        )
+    
+    def calcular_aceleracion_combinada(self, paquete: PaqueteMejoras) -> float:
+        return self.calculador.calcular_aceleracion_combinada(paquete)
+    
+    def calcular_lote_combinado(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        return self.calculador.calcular_lote_combinado(
+            porcentajes_mejora, factores_mejora, tiempo_original, decimales
+        )
+    
+    def calcular_aceleracion_escalada(self, componente: ComponenteGPU) -> float:
+        f, k = componente.porcentaje_mejora, componente.factor_mejora
+        return self._memorizar(
+            ("aceleracion_escalada", f, k, ConstantesMatematicas.PRECISION_DECIMAL),
+            lambda: como_calculador_gustafson(self.calculador).calcular_aceleracion_escalada(
+                componente
+            )
+        )
+    
+    def calcular_lote_escalado(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        return como_calculador_gustafson(self.calculador).calcular_lote_escalado(
+            porcentajes_mejora, factores_mejora, tiempo_original, decimales
+        )
+    
+    def calcular_lote_mixto(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        escalamiento: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        return como_calculador_gustafson(self.calculador).calcular_lote_mixto(
+            porcentajes_mejora, factores_mejora, escalamiento, tiempo_original, decimales
+        )
+    
+    def calcular_factor_necesario_escalado_lote(
+        self,
+        porcentajes_mejora: Any,
+        aceleraciones_objetivo: Any,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> Any:
+        return como_calculador_gustafson(self.calculador).calcular_factor_necesario_escalado_lote(
+            porcentajes_mejora, aceleraciones_objetivo, decimales
+        )
+    
+    def calcular_lote_combinado_escalado(
+        self,
+        porcentajes_mejora: Any,
+        factores_mejora: Any,
+        tiempo_original: Optional[Any] = None,
+        decimales: Optional[int] = ConstantesMatematicas.PRECISION_DECIMAL
+    ) -> ResultadoLoteAmdahl:
+        return como_calculador_gustafson(self.calculador).calcular_lote_combinado_escalado(
+            porcentajes_mejora, factores_mejora, tiempo_original, decimales
+        )
+    
+    def estadisticas(self) -> EstadisticasCache:
+        with self._lock:
+            return EstadisticasCache(
+                aciertos=self._aciertos,
+                fallos=self._fallos,
+                desalojos=self._desalojos,
+                tamano=len(self._entradas),
+                capacidad=self.capacidad
+            )
+    
+    def limpiar(self) -> None:
+        with self._lock:
+            self._entradas.clear()
+            self._aciertos = self._fallos = self._desalojos = 0
+    
+    def __getstate__(self) -> dict:
+        # Para enviarlo a otros procesos: se copia el calculador, no el caché
+        return {"calculador": self.calculador, "capacidad": self.capacidad}
+    
+    def __setstate__(self, estado: dict) -> None:
+        self.__init__(estado["calculador"], estado["capacidad"])
+    
+    def __getattr__(self, nombre: str):
+        # Resto de métodos propios del calculador envuelto
+        if nombre == "calculador":
+            raise AttributeError(nombre)
+        return getattr(self.calculador, nombre)
+    
+    def _memorizar(self, clave: Hashable, calcular: Callable[[], float]) -> float:
+        with self._lock:
+            if clave in self._entradas:
+                self._entradas.move_to_end(clave)
+                self._aciertos += 1
+                return self._entradas[clave]
+            self._fallos += 1
+        
+        valor = calcular()
+        
+        with self._lock:
+            self._entradas[clave] = valor
+            self._entradas.move_to_end(clave)
+            if len(self._entradas) > self.capacidad:
+                self._entradas.popitem(last=False)
+                self._desalojos += 1
+        return valor
@@ -0,0 +1,229 @@
+"""
+Catálogos de componentes (config.json o inventarios grandes) con una forma compilada en caché
+"""
+from __future__ import annotations
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+from typing import Any, List, Optional, Tuple
+from ..domain.entities import IRepositorioComponentes
+from ..domain.tablas import CatalogoNombres, TablaComponentes
+from ..domain.value_objects import ComponentesGPUPredefinidos
+from ..importacion_diferida import importar_diferido
+from .archivos_componentes import (
+    COLUMNAS_F,
+    COLUMNAS_K,
+    COLUMNAS_NOMBRE,
+    a_flotantes,
+    campo,
+    leer_bloques
+)
+
+
+np = importar_diferido("numpy")
+
+
+# Cambiar si se modifica el contenido del archivo compilado
+VERSION_COMPILADO = 1
+EXTENSION_COMPILADO = ".catalogo.npz"
+FORMATOS_CATALOGO = ("json", "csv", "jsonl")
+
+
+class RepositorioComponentesArchivo(IRepositorioComponentes):
+    """
+    Lee un catálogo de componentes (config.json, JSON, CSV o JSONL), lo valida
+    en bloque y lo entrega como TablaComponentes.
+    
+    La primera lectura guarda una forma compilada (.npz con las columnas f, k,
+    ids de nombre y los nombres distintos) en `directorio_cache`, o junto al
+    archivo en __pycache__ como los .pyc. Las lecturas siguientes la usan si
+    el archivo no cambió: mismo tamaño y fecha de modificación, o mismo
+    contenido (sha256) cuando solo cambió la fecha. Dentro del proceso el
+    archivo se lee una sola vez mientras no cambie.
+    """
+    
+    def __init__(self, ruta: str, directorio_cache: Optional[str] = None):
+        self.ruta = os.path.abspath(ruta)
+        self.formato = _formato_catalogo(self.ruta)
+        self.directorio_cache = directorio_cache
+        self._tabla: Optional[TablaComponentes] = None
+        self._firma: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+    
+    def cargar(self) -> TablaComponentes:
+        estado = os.stat(self.ruta)
+        firma = (estado.st_size, estado.st_mtime_ns)
+        with self._lock:
+            if self._tabla is None or self._firma != firma:
+                self._tabla = self._leer_compilado(firma) or self._compilar(firma)
+                self._firma = firma
+            return self._tabla
+    
+    def ruta_compilado(self) -> str:
+        if self.directorio_cache:
+            clave = hashlib.sha256(self.ruta.encode()).hexdigest()[:32]
+            return os.path.join(self.directorio_cache, clave + EXTENSION_COMPILADO)
+        directorio, nombre = os.path.split(self.ruta)
+        return os.path.join(directorio, "__pycache__", nombre + EXTENSION_COMPILADO)
+    
+    def _leer_compilado(self, firma: Tuple[int, int]) -> Optional[TablaComponentes]:
+        try:
+            with np.load(self.ruta_compilado(), allow_pickle=False) as datos:
+                encabezado = json.loads(datos["encabezado"].tobytes())
+                if (encabezado.get("version") != VERSION_COMPILADO
+                        or encabezado.get("ruta") != self.ruta):
+                    return None
+                vigente = tuple(encabezado["firma"]) == tuple(firma)
+                if not vigente and encabezado["sha256"] != _sha256(self._leer_bytes()):
+                    return None
+                tabla = TablaComponentes(
+                    ids_nombre=datos["ids_nombre"],
+                    porcentajes_mejora=datos["porcentajes_mejora"],
+                    factores_mejora=datos["factores_mejora"],
+                    # Los nombres se verificaron al compilar: el índice se arma si se usa
+                    catalogo=CatalogoNombres(datos["nombres"].tolist(), validar=False)
+                )
+        except (OSError, ValueError, KeyError):
+            return None  # Sin compilado, o ilegible: se vuelve a leer el original
+        
+        if not vigente:
+            # Solo cambió la fecha (checkout, touch): se actualiza la firma guardada
+            self._guardar_compilado(tabla, firma, encabezado["sha256"])
+        return tabla
+    
+    def _compilar(self, firma: Tuple[int, int]) -> TablaComponentes:
+        contenido = self._leer_bytes()
+        if self.formato == "json":
+            nombres, f, k = _columnas_json(json.loads(contenido))
+        else:
+            nombres, f, k = _columnas_bloques(contenido.decode("utf-8"), self.formato)
+        
+        validar_catalogo(nombres, f, k, self.ruta)
+        tabla = TablaComponentes.desde_arreglos(nombres, f, k)
+        self._guardar_compilado(tabla, firma, _sha256(contenido))
+        return tabla
+    
+    def _guardar_compilado(
+        self,
+        tabla: TablaComponentes,
+        firma: Tuple[int, int],
+        sha256: str
+    ) -> None:
+        encabezado = json.dumps({
+            "version": VERSION_COMPILADO,
+            "ruta": self.ruta,
+            "firma": list(firma),
+            "sha256": sha256,
+            "componentes": len(tabla),
+        }).encode()
+        destino = self.ruta_compilado()
+        try:
+            os.makedirs(os.path.dirname(destino), exist_ok=True)
+            descriptor, temporal = tempfile.mkstemp(
+                dir=os.path.dirname(destino), suffix=".tmp"
+            )
+            try:
+                with os.fdopen(descriptor, "wb") as archivo:
+                    np.savez(
+                        archivo,
+                        encabezado=np.frombuffer(encabezado, dtype=np.uint8),
+                        ids_nombre=tabla.ids_nombre,
+                        porcentajes_mejora=tabla.porcentajes_mejora,
+                        factores_mejora=tabla.factores_mejora,
+                        nombres=np.array(tabla.catalogo.nombres, dtype=str)
+                    )
+                os.replace(temporal, destino)
+            except BaseException:
+                if os.path.exists(temporal):
+                    os.remove(temporal)
+                raise
+        except OSError:
+            pass  # Directorio de solo lectura: como con los .pyc, se sigue sin caché
+    
+    def _leer_bytes(self) -> bytes:
+        with open(self.ruta, "rb") as archivo:
+            return archivo.read()
+
+
+def validar_catalogo(nombres: List[str], f: Any, k: Any, origen: str = "catálogo") -> None:
+    """
+    Valida todas las filas de una vez (mismas reglas que ComponenteGPU) y
+    reporta en un solo ValueError cuántas fallan y cuáles son las primeras.
+    """
+    invalidos = ~((f >= 0) & (f <= 1) & (k > 1))  # NaN (valor faltante) también es inválido
+    invalidos |= np.fromiter((not n for n in nombres), dtype=bool, count=len(nombres))
+    filas = np.flatnonzero(invalidos)
+    if filas.size:
+        muestra = ", ".join(str(i + 1) for i in filas[:5].tolist())
+        raise ValueError(
+            f"{filas.size} componente(s) inválido(s) en '{origen}' "
+            f"(filas {muestra}{', ...' if filas.size > 5 else ''}): se requiere "
+            f"nombre, 0 <= porcentaje_mejora <= 1 y factor_mejora > 1"
+        )
+
+
+def ruta_config_por_defecto() -> Optional[str]:
+    # config.json en la raíz del proyecto (None si no existe)
+    raiz = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    ruta = os.path.join(raiz, "config.json")
+    return ruta if os.path.isfile(ruta) else None
+
+
+def _formato_catalogo(ruta: str) -> str:
+    formato = os.path.splitext(ruta)[1].lstrip(".").lower()
+    if formato == "ndjson":
+        formato = "jsonl"
+    if formato not in FORMATOS_CATALOGO:
+        raise ValueError(
+            f"Formato de catálogo no soportado: '{formato}'. "
+            f"Use uno de: {', '.join(FORMATOS_CATALOGO)}"
+        )
+    return formato
+
+
+def _columnas_json(datos: Any) -> tuple:
+    # config.json: {"componentes_gpu": {clave: {...}}}; catálogos: {"componentes": [...]} o [...]
+    if isinstance(datos, dict) and "componentes_gpu" in datos:
+        registros = [
+            {"nombre": _nombre_predefinido(clave), **valores}
+            for clave, valores in datos["componentes_gpu"].items()
+        ]
+    elif isinstance(datos, dict) and "componentes" in datos:
+        registros = datos["componentes"]
+    elif isinstance(datos, list):
+        registros = datos
+    else:
+        raise ValueError("El JSON no contiene 'componentes_gpu' ni una lista de 'componentes'")
+    
+    if not all(isinstance(registro, dict) for registro in registros):
+        raise ValueError("Cada componente del catálogo debe ser un objeto JSON")
+    return (
+        [str(campo(r, COLUMNAS_NOMBRE) or "") for r in registros],
+        a_flotantes([campo(r, COLUMNAS_F) for r in registros]),
+        a_flotantes([campo(r, COLUMNAS_K) for r in registros]),
+    )
+
+
+def _columnas_bloques(texto: str, formato: str) -> tuple:
+    nombres: List[str] = []
+    columnas_f, columnas_k = [], []
+    for bloque in leer_bloques(io.StringIO(texto), formato):
+        nombres.extend(bloque.nombres)
+        columnas_f.append(bloque.porcentajes_mejora)
+        columnas_k.append(bloque.factores_mejora)
+    if not nombres:
+        return nombres, np.empty(0), np.empty(0)
+    return nombres, np.concatenate(columnas_f), np.concatenate(columnas_k)
+
+
+def _nombre_predefinido(clave: str) -> str:
+    # "nucleos_cuda" → "Núcleos CUDA" (las claves desconocidas se usan tal cual)
+    nombre = getattr(ComponentesGPUPredefinidos, clave.upper(), clave)
+    return nombre if isinstance(nombre, str) else clave
+
+
+def _sha256(contenido: bytes) -> str:
+    return hashlib.sha256(contenido).hexdigest()
@@ -0,0 +1,52 @@
+"""
+Datos de curvas de la Ley de Amdahl listos para graficar (sin dependencias de matplotlib)
+"""
+from __future__ import annotations
+from typing import List
+from ..domain.entities import ICalculadorAmdahl
+from ..importacion_diferida import importar_diferido
+
+
+np = importar_diferido("numpy")
+
+
+class GeneradorCurvasAmdahl:
+    
+    def __init__(self, calculador: ICalculadorAmdahl):
+        self.calculador = calculador
+    
+    def generar_curvas_aceleracion(
+        self, 
+        valores_curva: List[float], 
+        valores_eje: List[float],
+        eje: str = 'k'
+    ) -> np.ma.MaskedArray:
+        """
+        Calcula todas las curvas de aceleración en una sola pasada vectorizada.
+        
+        Devuelve un arreglo enmascarado de forma (curvas, puntos): con eje='k'
+        cada fila es un f fijo evaluado sobre los k de `valores_eje`; con
+        eje='f' cada fila es un k fijo evaluado sobre los f. Los puntos
+        inválidos (p. ej. k <= 1) quedan enmascarados en lugar de lanzar error.
+        """
+        curvas = np.asarray(valores_curva, dtype=np.float64)[:, np.newaxis]
+        puntos = np.asarray(valores_eje, dtype=np.float64)[np.newaxis, :]
+        
+        if eje == 'k':
+            lote = self.calculador.calcular_lote(curvas, puntos, decimales=None)
+        elif eje == 'f':
+            lote = self.calculador.calcular_lote(puntos, curvas, decimales=None)
+        else:
+            raise ValueError("El eje debe ser 'k' o 'f'")
+        
+        return np.ma.masked_array(lote.aceleracion, mask=~lote.validos)
+    
+    def generar_curva_limite_teorico(
+        self, 
+        porcentajes_mejora: List[float], 
+        limite_visible: float = 100
+    ) -> np.ma.MaskedArray:
+        """Límite A_max = 1/(1-f), enmascarando puntos inválidos o >= limite_visible"""
+        lote = self.calculador.calcular_lote(porcentajes_mejora, np.inf, decimales=None)
+        limites = lote.limite_teorico
+        return np.ma.masked_array(limites, mask=~(lote.validos & (limites < limite_visible)))
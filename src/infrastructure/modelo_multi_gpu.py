@@ -0,0 +1,155 @@
+"""
+Escalamiento a N GPUs: Ley de Amdahl más el costo de comunicar entre dispositivos
+"""
+from __future__ import annotations
+from typing import Any
+from ..domain.entities import (
+    DispositivosOptimos,
+    IModeloMultiGPU,
+    Interconexion,
+    ResultadoEscalamientoMultiGPU
+)
+from ..domain.value_objects import ConfiguracionInterconexion
+from ..importacion_diferida import importar_diferido
+
+
+np = importar_diferido("numpy")
+
+
+class ModeloMultiGPU(IModeloMultiGPU):
+    """
+    Tiempo por paso con N dispositivos para un perfil (f, mensaje, T1):
+        
+        T(N) = T1·((1 - f) + f/N) + 2(N - 1)·α + 2·(N - 1)/N · m/β
+    
+    El primer término es Amdahl sobre la parte paralelizable f del tiempo
+    T1 con una GPU; los otros dos, un all-reduce en anillo de m bytes por
+    paso sobre la interconexión (latencia α, ancho de banda β). La aceleración es
+    T1 / T(N). Todo se evalúa con broadcasting entre N, f, m y T1.
+    """
+    
+    def __init__(self, interconexion: Interconexion):
+        self.interconexion = interconexion
+    
+    def calcular_lote(
+        self,
+        dispositivos: Any,
+        porcentajes_paralelos: Any,
+        tamanos_mensaje: Any,
+        tiempo_base: Any
+    ) -> ResultadoEscalamientoMultiGPU:
+        """
+        `tamanos_mensaje` en bytes y `tiempo_base` (T1) en ms. Los perfiles
+        inválidos (N < 1, f fuera de [0, 1], m < 0 o T1 <= 0) quedan en NaN.
+        """
+        n, f, m, t1 = np.broadcast_arrays(
+            np.asarray(dispositivos, dtype=np.float64),
+            np.asarray(porcentajes_paralelos, dtype=np.float64),
+            np.asarray(tamanos_mensaje, dtype=np.float64),
+            np.asarray(tiempo_base, dtype=np.float64)
+        )
+        validos = (n >= 1) & (f >= 0) & (f <= 1) & (m >= 0) & (t1 > 0)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            computo = t1 * ((1.0 - f) + f / n)
+            comunicacion = 2.0 * (n - 1.0) * (self._latencia_ms() + self._envio_ms(m) / n)
+            tiempo = np.where(validos, computo + comunicacion, np.nan)
+            aceleracion = t1 / tiempo
+        
+        return ResultadoEscalamientoMultiGPU(
+            aceleracion=aceleracion,
+            eficiencia=aceleracion / n,
+            tiempo=tiempo,
+            tiempo_comunicacion=np.where(validos, comunicacion, np.nan),
+            validos=validos
+        )
+    
+    def calcular_dispositivos_optimos(
+        self,
+        porcentajes_paralelos: Any,
+        tamanos_mensaje: Any,
+        tiempo_base: Any,
+        max_dispositivos: int = ConfiguracionInterconexion.MAX_DISPOSITIVOS,
+        ganancia_minima: float = ConfiguracionInterconexion.GANANCIA_MINIMA
+    ) -> DispositivosOptimos:
+        """
+        Para cada perfil, el N (entre 1 y max_dispositivos) a partir del cual
+        agregar una GPU más mejora la aceleración menos que `ganancia_minima`
+        (relativa: 0.05 = 5%, el valor por defecto). Los perfiles inválidos
+        quedan con N = 0.
+        
+        Con ganancia_minima = 0 es el N de máxima aceleración y se obtiene
+        en forma cerrada: T(N) = c + a/N + b·N con a = T1·f - 2·m/β y
+        b = 2·α es convexa, con mínimo continuo en √(a/b); basta comparar
+        los dos enteros vecinos, sin importar cuántos N se admitan. Con
+        ganancia_minima > 0 se recorre la grilla 1..max_dispositivos.
+        """
+        if max_dispositivos < 1:
+            raise ValueError("El máximo de dispositivos debe ser al menos 1")
+        if ganancia_minima < 0:
+            raise ValueError("La ganancia mínima no puede ser negativa")
+        
+        f, m, t1 = np.broadcast_arrays(
+            np.asarray(porcentajes_paralelos, dtype=np.float64),
+            np.asarray(tamanos_mensaje, dtype=np.float64),
+            np.asarray(tiempo_base, dtype=np.float64)
+        )
+        if ganancia_minima == 0:
+            dispositivos = self._optimo_cerrado(f, m, t1, max_dispositivos)
+        else:
+            dispositivos = self._optimo_en_grilla(f, m, t1, max_dispositivos, ganancia_minima)
+        
+        lote = self.calcular_lote(dispositivos, f, m, t1)
+        return DispositivosOptimos(
+            dispositivos=np.where(lote.validos, dispositivos, 0).astype(np.int64),
+            aceleracion=lote.aceleracion,
+            eficiencia=lote.eficiencia,
+            tiempo=lote.tiempo,
+            validos=lote.validos
+        )
+    
+    def _optimo_cerrado(
+        self,
+        f: np.ndarray,
+        m: np.ndarray,
+        t1: np.ndarray,
+        max_dispositivos: int
+    ) -> np.ndarray:
+        a = t1 * f - 2.0 * self._envio_ms(m)
+        b = 2.0 * self._latencia_ms()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            continuo = np.sqrt(a / b) if b > 0 else np.where(a > 0, np.inf, 1.0)
+        # a <= 0: la comunicación cuesta más de lo que reparte el cómputo, conviene 1 GPU
+        continuo = np.where(a > 0, continuo, 1.0)
+        continuo = np.clip(np.nan_to_num(continuo, nan=1.0), 1, max_dispositivos)
+        
+        abajo = np.floor(continuo)
+        arriba = np.minimum(abajo + 1, max_dispositivos)
+        tiempo_abajo = self.calcular_lote(abajo, f, m, t1).tiempo
+        tiempo_arriba = self.calcular_lote(arriba, f, m, t1).tiempo
+        # A igual tiempo se prefiere la menor cantidad de GPUs
+        return np.where(tiempo_arriba < tiempo_abajo, arriba, abajo)
+    
+    def _optimo_en_grilla(
+        self,
+        f: np.ndarray,
+        m: np.ndarray,
+        t1: np.ndarray,
+        max_dispositivos: int,
+        ganancia_minima: float
+    ) -> np.ndarray:
+        n = np.arange(1, max_dispositivos + 1, dtype=np.float64)
+        aceleracion = self.calcular_lote(
+            n, f[..., np.newaxis], m[..., np.newaxis], t1[..., np.newaxis]
+        ).aceleracion
+        mejora = aceleracion[..., 1:] / aceleracion[..., :-1] - 1.0
+        deja_de_convenir = mejora < ganancia_minima
+        primero = np.argmax(deja_de_convenir, axis=-1) + 1.0
+        return np.where(deja_de_convenir.any(axis=-1), primero, float(max_dispositivos))
+    
+    def _latencia_ms(self) -> float:
+        return self.interconexion.latencia_us / 1000.0
+    
+    def _envio_ms(self, tamanos_mensaje: np.ndarray) -> np.ndarray:
+        # bytes / (GB/s) = ns; /1e6 → ms
+        return tamanos_mensaje / (self.interconexion.ancho_banda_gbs * 1e6)
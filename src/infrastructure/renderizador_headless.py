@@ -0,0 +1,263 @@
+"""
+Renderizado sin ventana (backend Agg) reutilizando figuras entre gráficos
+"""
+from __future__ import annotations
+import os
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, List, Optional, Union
+from ..domain.entities import ICalculadorAmdahl, IVisualizador
+from ..importacion_diferida import importar_diferido
+from ..infrastructure.calculador_amdahl import CalculadorAmdahl
+from ..infrastructure.curvas_amdahl import GeneradorCurvasAmdahl
+
+
+# matplotlib se importa al crear la primera figura (ver _obtener_grafico)
+np = importar_diferido("numpy")
+
+
+Destino = Union[str, os.PathLike, IO[bytes]]
+
+
+@dataclass
+class _GraficoReutilizable:
+    figura: Any               # matplotlib.figure.Figure con su FigureCanvasAgg
+    ejes: Any
+    lineas: List[Any] = field(default_factory=list)
+    relleno: Any = None
+
+
+class RenderizadorHeadless(IVisualizador):
+    """
+    Visualizador para trabajos por lotes: no usa pyplot ni abre ventanas.
+    
+    Cada tipo de gráfico tiene una única Figure/Axes (con su FigureCanvasAgg)
+    que se crea en el primer render; los siguientes solo actualizan los datos
+    de las líneas. Cada método escribe en `destino` (ruta o buffer como
+    io.BytesIO) en formato PNG o SVG y devuelve ese destino.
+    """
+    
+    def __init__(
+        self,
+        calculador: Optional[ICalculadorAmdahl] = None,
+        dpi: int = 100,
+        formato: str = "png",
+        directorio_salida: str = "."
+    ):
+        self.curvas = GeneradorCurvasAmdahl(calculador or CalculadorAmdahl())
+        self.dpi = dpi
+        self.formato = formato
+        self.directorio_salida = directorio_salida
+        self._graficos: Dict[str, _GraficoReutilizable] = {}
+    
+    def graficar_aceleracion_vs_factor(
+        self,
+        porcentajes_mejora: List[float],
+        factores_mejora: List[float],
+        destino: Optional[Destino] = None,
+        formato: Optional[str] = None
+    ) -> Destino:
+        k = np.asarray(factores_mejora, dtype=np.float64)
+        curvas = self.curvas.generar_curvas_aceleracion(porcentajes_mejora, k, eje='k')
+        
+        grafico = self._obtener_grafico(
+            "aceleracion_vs_factor",
+            figsize=(12, 8),
+            xlabel='Factor de Mejora (k)',
+            ylabel='Aceleración (A)',
+            titulo='Ley de Amdahl: Aceleración vs Factor de Mejora'
+        )
+        actualizar_lineas(
+            grafico.ejes, grafico.lineas, k, curvas,
+            [f'f = {f:.2f}' for f in porcentajes_mejora], marker='o'
+        )
+        grafico.ejes.set_xlim(k.min(), k.max())
+        
+        return self._guardar("aceleracion_vs_factor", destino, formato)
+    
+    def graficar_aceleracion_vs_porcentaje(
+        self,
+        factores_mejora: List[float],
+        porcentajes_mejora: List[float],
+        destino: Optional[Destino] = None,
+        formato: Optional[str] = None
+    ) -> Destino:
+        f = np.asarray(porcentajes_mejora, dtype=np.float64)
+        curvas = self.curvas.generar_curvas_aceleracion(factores_mejora, f, eje='f')
+        
+        grafico = self._obtener_grafico(
+            "aceleracion_vs_porcentaje",
+            figsize=(12, 8),
+            xlabel='Fracción Mejorable (f)',
+            ylabel='Aceleración (A)',
+            titulo='Ley de Amdahl: Aceleración vs Fracción Mejorable'
+        )
+        actualizar_lineas(
+            grafico.ejes, grafico.lineas, f, curvas,
+            [f'k = {k}' for k in factores_mejora], marker='s'
+        )
+        grafico.ejes.set_xlim(0, 1)
+        
+        return self._guardar("aceleracion_vs_porcentaje", destino, formato)
+    
+    def graficar_comparacion_componentes(
+        self,
+        componentes_data: List[dict],
+        destino: Optional[Destino] = None,
+        formato: Optional[str] = None
+    ) -> Destino:
+        grafico = self._obtener_grafico(
+            "comparacion_componentes", figsize=(12, 6), linea_referencia=False
+        )
+        ejes = grafico.ejes
+        
+        nombres = [comp['nombre'] for comp in componentes_data]
+        aceleraciones = [comp['aceleracion'] for comp in componentes_data]
+        
+        from matplotlib import colormaps
+        
+        # Las barras cambian de cantidad entre renders: se rehacen los ejes, no la figura
+        ejes.clear()
+        colores = colormaps['viridis'](np.linspace(0, 1, len(nombres)))
+        barras = ejes.bar(nombres, aceleraciones, color=colores, alpha=0.8)
+        for barra, aceleracion in zip(barras, aceleraciones):
+            ejes.text(barra.get_x() + barra.get_width()/2., barra.get_height() + 0.01,
+                      f'{aceleracion:.4f}', ha='center', va='bottom', fontweight='bold')
+        
+        ejes.set_xlabel('Componentes GPU', fontsize=12)
+        ejes.set_ylabel('Aceleración', fontsize=12)
+        ejes.set_title('Comparación de Aceleraciones por Componente GPU',
+                       fontsize=14, fontweight='bold')
+        ejes.tick_params(axis='x', labelrotation=45)
+        for etiqueta in ejes.get_xticklabels():
+            etiqueta.set_horizontalalignment('right')
+        ejes.grid(True, alpha=0.3, axis='y')
+        
+        return self._guardar("comparacion_componentes", destino, formato)
+    
+    def graficar_limite_teorico(
+        self,
+        porcentajes_mejora: List[float],
+        destino: Optional[Destino] = None,
+        formato: Optional[str] = None
+    ) -> Destino:
+        f = np.asarray(porcentajes_mejora, dtype=np.float64)
+        limites = self.curvas.generar_curva_limite_teorico(f)
+        f_filtrados = f[~np.ma.getmaskarray(limites)]
+        limites_filtrados = limites.compressed()
+        
+        grafico = self._obtener_grafico(
+            "limite_teorico",
+            figsize=(10, 6),
+            xlabel='Fracción Mejorable (f)',
+            ylabel='Aceleración Máxima Teórica',
+            titulo='Límite Teórico de la Ley de Amdahl',
+            linea_referencia=False
+        )
+        ejes = grafico.ejes
+        
+        if not grafico.lineas:
+            grafico.lineas.append(ejes.plot(
+                [], [], 'r-', linewidth=3, label='Límite Teórico A_max = 1/(1-f)'
+            )[0])
+            ejes.legend(fontsize=12)
+            ejes.set_xlim(0, 0.95)
+            ejes.set_ylim(1, 20)
+        grafico.lineas[0].set_data(f_filtrados, limites_filtrados)
+        
+        if grafico.relleno is not None:
+            grafico.relleno.remove()
+        grafico.relleno = ejes.fill_between(
+            f_filtrados, 1, limites_filtrados, alpha=0.2, color='red'
+        )
+        
+        return self._guardar("limite_teorico", destino, formato)
+    
+    def _obtener_grafico(
+        self,
+        clave: str,
+        figsize: tuple,
+        xlabel: str = "",
+        ylabel: str = "",
+        titulo: str = "",
+        linea_referencia: bool = True
+    ) -> _GraficoReutilizable:
+        grafico = self._graficos.get(clave)
+        if grafico is not None:
+            return grafico
+        
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        
+        figura = Figure(figsize=figsize, layout='tight')
+        FigureCanvasAgg(figura)
+        ejes = figura.add_subplot()
+        if xlabel:
+            ejes.set_xlabel(xlabel, fontsize=12)
+            ejes.set_ylabel(ylabel, fontsize=12)
+            ejes.set_title(titulo, fontsize=14, fontweight='bold')
+            ejes.grid(True, alpha=0.3)
+        if linea_referencia:
+            ejes.axhline(y=1, color='red', linestyle='--', alpha=0.5)
+        
+        grafico = _GraficoReutilizable(figura=figura, ejes=ejes)
+        self._graficos[clave] = grafico
+        return grafico
+    
+    def _guardar(
+        self,
+        clave: str,
+        destino: Optional[Destino],
+        formato: Optional[str]
+    ) -> Destino:
+        formato = formato or self._formato_de(destino)
+        if destino is None:
+            destino = os.path.join(self.directorio_salida, f"{clave}.{formato}")
+        self._graficos[clave].figura.savefig(destino, format=formato, dpi=self.dpi)
+        return destino
+    
+    def _formato_de(self, destino: Optional[Destino]) -> str:
+        if isinstance(destino, (str, os.PathLike)):
+            extension = os.path.splitext(os.fspath(destino))[1].lstrip('.').lower()
+            if extension in ("png", "svg"):
+                return extension
+        return self.formato
+
+
+def actualizar_lineas(
+    ejes: Any,
+    lineas: List[Any],
+    x: np.ndarray,
+    curvas: np.ma.MaskedArray,
+    etiquetas: List[str],
+    marker: str
+) -> None:
+    """
+    Ajusta `lineas` (Line2D existentes en `ejes`) a las nuevas curvas: reutiliza
+    las que ya existen cambiando solo sus datos, crea las que faltan y elimina
+    las sobrantes. La leyenda se rehace solo si cambian las etiquetas.
+    """
+    cambio_etiquetas = len(lineas) != len(etiquetas)
+    
+    for i, (curva, etiqueta) in enumerate(zip(curvas, etiquetas)):
+        validos = ~np.ma.getmaskarray(curva)
+        if i < len(lineas):
+            linea = lineas[i]
+            linea.set_data(x[validos], curva.compressed())
+            if linea.get_label() != etiqueta:
+                linea.set_label(etiqueta)
+                cambio_etiquetas = True
+        else:
+            lineas.append(ejes.plot(
+                x[validos], curva.compressed(), marker=marker, linewidth=2,
+                label=etiqueta, markersize=4
+            )[0])
+    
+    # Curvas sobrantes del render anterior
+    for linea in lineas[len(etiquetas):]:
+        linea.remove()
+    del lineas[len(etiquetas):]
+    
+    ejes.relim()
+    ejes.autoscale_view()
+    if cambio_etiquetas:
+        ejes.legend(fontsize=10)
@@ -0,0 +1,224 @@
+"""
+Propagación Monte Carlo de la incertidumbre de f y k, repartida en un pool de procesos
+"""
+from __future__ import annotations
+import os
+from typing import Callable, List, Optional, Sequence, Tuple
+from ..domain.entities import (
+    ComponenteIncierto,
+    DistribucionParametro,
+    ICalculadorAmdahl,
+    ISimuladorIncertidumbre,
+    ResultadoMonteCarlo,
+    ResumenDistribucion
+)
+from ..domain.value_objects import TiposDistribucion
+from ..importacion_diferida import importar_diferido
+
+
+np = importar_diferido("numpy")
+
+
+Tarea = Tuple[int, "np.random.SeedSequence"]  # (muestras, semilla de la tarea)
+
+# Rondas de re-sorteo para las normales truncadas antes de descartar muestras
+MAX_RONDAS_TRUNCADO = 64
+
+
+class SimuladorMonteCarlo(ISimuladorIncertidumbre):
+    """
+    Sortea f y k de cada componente según su distribución y evalúa la Ley de
+    Amdahl (con `calcular_lote` del calculador) sobre todas las muestras.
+    
+    Las muestras se dividen en tareas de `muestras_por_tarea`. Cada tarea
+    tiene su propio generador, derivado con SeedSequence.spawn de la semilla
+    global, y se evalúa en un ProcessPoolExecutor. Como la división depende
+    solo de la cantidad de muestras, una misma semilla da los mismos
+    resultados con cualquier número de procesos. Las muestras de todos los
+    componentes de una tarea comparten índice, lo que permite estimar la
+    probabilidad de que cada uno sea el mejor; los empates exactos (p. ej.
+    componentes fijos iguales) se reparten en partes iguales. El calculador
+    debe poder serializarse (pickle) para enviarse a los procesos.
+    """
+    
+    def __init__(
+        self,
+        calculador: ICalculadorAmdahl,
+        procesos: Optional[int] = None,
+        muestras_por_tarea: int = 1 << 16
+    ):
+        if muestras_por_tarea <= 0:
+            raise ValueError("Las muestras por tarea deben ser mayores a 0")
+        self.calculador = calculador
+        self.procesos = procesos or os.cpu_count() or 1
+        self.muestras_por_tarea = muestras_por_tarea
+    
+    def simular(
+        self,
+        componentes: Sequence[ComponenteIncierto],
+        muestras: int = 100_000,
+        semilla: Optional[int] = None,
+        tiempo_original: Optional[float] = None,
+        aceleracion_objetivo: Optional[float] = None,
+        percentiles: Sequence[float] = (5, 50, 95)
+    ) -> List[ResultadoMonteCarlo]:
+        if muestras <= 0:
+            raise ValueError("La cantidad de muestras debe ser mayor a 0")
+        if not componentes:
+            return []
+        
+        aceleraciones = self.muestrear_aceleraciones(componentes, muestras, semilla)
+        validas = ~np.isnan(aceleraciones)
+        cantidad_validas = np.count_nonzero(validas, axis=1)
+        
+        # P(mejor): en qué fracción de las muestras cada componente tiene la mayor A;
+        # un empate exacto se reparte en partes iguales entre los empatados
+        con_ganador = validas.any(axis=0)
+        comparables = np.where(validas, aceleraciones, -np.inf)[:, con_ganador]
+        maximos = comparables.max(axis=0, initial=-np.inf)
+        empatados = (comparables == maximos) & validas[:, con_ganador]
+        victorias = (empatados / empatados.sum(axis=0)).sum(axis=1)
+        muestras_con_ganador = max(int(np.count_nonzero(con_ganador)), 1)
+        
+        tiempos = None
+        if tiempo_original is not None:
+            tiempos = tiempo_original / aceleraciones
+        
+        resultados = []
+        for i, componente in enumerate(componentes):
+            n_validas = int(cantidad_validas[i])
+            probabilidad_objetivo = None
+            if aceleracion_objetivo is not None:
+                probabilidad_objetivo = (
+                    float(np.count_nonzero(aceleraciones[i] >= aceleracion_objetivo)) / n_validas
+                    if n_validas else float('nan')
+                )
+            resultados.append(ResultadoMonteCarlo(
+                nombre=componente.nombre,
+                muestras=muestras,
+                muestras_validas=n_validas,
+                aceleracion=_resumir(aceleraciones[i], percentiles),
+                tiempo_optimizado=None if tiempos is None else _resumir(tiempos[i], percentiles),
+                probabilidad_objetivo=probabilidad_objetivo,
+                probabilidad_mejor=float(victorias[i]) / muestras_con_ganador
+            ))
+        return resultados
+    
+    def muestrear_aceleraciones(
+        self,
+        componentes: Sequence[ComponenteIncierto],
+        muestras: int,
+        semilla: Optional[int] = None
+    ) -> np.ndarray:
+        """Matriz (componentes, muestras) de aceleraciones; NaN en muestras descartadas"""
+        tareas = self._dividir_en_tareas(muestras, semilla)
+        
+        if self.procesos == 1 or len(tareas) <= 1:
+            parciales = [_evaluar_tarea(self.calculador, componentes, t) for t in tareas]
+        else:
+            # multiprocessing se importa solo si hace falta (arranque de la CLI)
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with ProcessPoolExecutor(
+                max_workers=min(self.procesos, len(tareas)),
+                initializer=_inicializar_trabajador,
+                initargs=(self.calculador, list(componentes))
+            ) as pool:
+                parciales = list(pool.map(_evaluar_en_trabajador, tareas))
+        
+        return np.concatenate(parciales, axis=1)
+    
+    def _dividir_en_tareas(self, muestras: int, semilla: Optional[int]) -> List[Tarea]:
+        tamanos = [
+            min(self.muestras_por_tarea, muestras - inicio)
+            for inicio in range(0, muestras, self.muestras_por_tarea)
+        ]
+        semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+        return list(zip(tamanos, semillas))
+
+
+def _evaluar_tarea(
+    calculador: ICalculadorAmdahl,
+    componentes: Sequence[ComponenteIncierto],
+    tarea: Tarea
+) -> np.ndarray:
+    muestras, semilla = tarea
+    generador = np.random.default_rng(semilla)
+    f = np.empty((len(componentes), muestras))
+    k = np.empty((len(componentes), muestras))
+    for i, componente in enumerate(componentes):
+        f[i] = muestrear(componente.porcentaje_mejora, generador, muestras, _f_valido)
+        k[i] = muestrear(componente.factor_mejora, generador, muestras, _k_valido)
+    return calculador.calcular_lote(f, k, decimales=None).aceleracion
+
+
+def muestrear(
+    distribucion: DistribucionParametro,
+    generador: np.random.Generator,
+    muestras: int,
+    es_valido: Optional[Callable[[np.ndarray], np.ndarray]] = None
+) -> np.ndarray:
+    """
+    `muestras` valores de la distribución. En la normal, los valores fuera
+    del dominio (según `es_valido`) se vuelven a sortear (normal truncada);
+    los que sigan fuera tras MAX_RONDAS_TRUNCADO quedan en NaN.
+    """
+    tipo, parametros = distribucion.tipo, distribucion.parametros
+    if tipo == TiposDistribucion.FIJA:
+        return np.full(muestras, parametros[0])
+    if tipo == TiposDistribucion.UNIFORME:
+        return generador.uniform(parametros[0], parametros[1], muestras)
+    if tipo == TiposDistribucion.EMPIRICA:
+        return generador.choice(np.asarray(parametros), muestras)
+    
+    media, desviacion = parametros
+    valores = generador.normal(media, desviacion, muestras)
+    if es_valido is None:
+        return valores
+    fuera = np.flatnonzero(~es_valido(valores))
+    for _ in range(MAX_RONDAS_TRUNCADO):
+        if fuera.size == 0:
+            break
+        valores[fuera] = generador.normal(media, desviacion, fuera.size)
+        fuera = fuera[~es_valido(valores[fuera])]
+    valores[fuera] = np.nan
+    return valores
+
+
+def _f_valido(f: np.ndarray) -> np.ndarray:
+    return (f >= 0) & (f <= 1)
+
+
+def _k_valido(k: np.ndarray) -> np.ndarray:
+    return k > 1
+
+
+def _resumir(valores: np.ndarray, percentiles: Sequence[float]) -> ResumenDistribucion:
+    validos = valores[~np.isnan(valores)]
+    if validos.size == 0:
+        return ResumenDistribucion(
+            media=float('nan'),
+            desviacion=float('nan'),
+            percentiles={float(p): float('nan') for p in percentiles}
+        )
+    calculados = np.percentile(validos, percentiles).tolist() if len(percentiles) else []
+    return ResumenDistribucion(
+        media=float(validos.mean()),
+        desviacion=float(validos.std()),
+        percentiles=dict(zip((float(p) for p in percentiles), calculados))
+    )
+
+
+_trabajador: Optional[tuple] = None
+
+
+def _inicializar_trabajador(
+    calculador: ICalculadorAmdahl,
+    componentes: List[ComponenteIncierto]
+) -> None:
+    global _trabajador
+    _trabajador = (calculador, componentes)
+
+
+def _evaluar_en_trabajador(tarea: Tarea) -> np.ndarray:
+    return _evaluar_tarea(*_trabajador, tarea)
@@ -0,0 +1,146 @@
+"""
+Sumideros para los tramos de la instrumentación: logging, JSON lines e histograma en memoria
+"""
+import json
+import logging
+import math
+import threading
+from typing import Any, Dict, List, Optional, TextIO, Union
+from ..domain.entities import ISumideroTramos, RegistroTramo
+
+
+class SumideroLogging(ISumideroTramos):
+    """Escribe cada tramo como una línea de log, sangrada según su profundidad"""
+    
+    def __init__(self, logger: Optional[logging.Logger] = None, nivel: int = logging.INFO):
+        self.logger = logger or logging.getLogger("amdahl.tramos")
+        self.nivel = nivel
+    
+    def registrar(self, tramo: RegistroTramo) -> None:
+        if not self.logger.isEnabledFor(self.nivel):
+            return
+        self.logger.log(
+            self.nivel, "%s%s %.3f ms%s",
+            "  " * tramo.profundidad, tramo.nombre, tramo.duracion * 1000,
+            f" [error: {tramo.error}]" if tramo.error else ""
+        )
+
+
+class SumideroJSONL(ISumideroTramos):
+    """
+    Agrega un objeto JSON por tramo al archivo (o stream) de destino.
+    Las líneas se escriben con buffer: llamar a `cerrar` al terminar.
+    """
+    
+    def __init__(self, destino: Union[str, TextIO]):
+        if isinstance(destino, str):
+            self._archivo = open(destino, "a", encoding="utf-8")
+            self._propio = True
+        else:
+            self._archivo = destino
+            self._propio = False
+        self._lock = threading.Lock()
+    
+    def registrar(self, tramo: RegistroTramo) -> None:
+        linea = json.dumps({
+            "nombre": tramo.nombre,
+            "inicio": tramo.inicio,
+            "duracion": tramo.duracion,
+            "profundidad": tramo.profundidad,
+            "padre": tramo.padre,
+            "atributos": tramo.atributos,
+            "error": tramo.error,
+        }, ensure_ascii=False, default=str)
+        with self._lock:
+            self._archivo.write(linea + "\n")
+    
+    def cerrar(self) -> None:
+        with self._lock:
+            if self._propio:
+                self._archivo.close()
+            else:
+                self._archivo.flush()
+
+
+class HistogramaTramos(ISumideroTramos):
+    """
+    Acumula la distribución de duraciones por nombre de tramo con memoria
+    constante: cubetas logarítmicas (cuatro por cada potencia de 2 en
+    nanosegundos), de modo que los percentiles tienen un error menor al 19%.
+    """
+    
+    CUBETAS_POR_OCTAVA = 4
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: Dict[str, "_Serie"] = {}
+    
+    def registrar(self, tramo: RegistroTramo) -> None:
+        nanosegundos = max(tramo.duracion * 1e9, 1.0)
+        cubeta = int(math.log2(nanosegundos) * self.CUBETAS_POR_OCTAVA)
+        with self._lock:
+            serie = self._series.get(tramo.nombre)
+            if serie is None:
+                serie = self._series[tramo.nombre] = _Serie()
+            serie.agregar(tramo.duracion, cubeta, tramo.error is not None)
+    
+    def resumen(self) -> Dict[str, Dict[str, Any]]:
+        # Tramos ordenados por tiempo total, de mayor a menor
+        with self._lock:
+            series = sorted(self._series.items(), key=lambda par: par[1].total, reverse=True)
+            return {nombre: serie.resumen() for nombre, serie in series}
+    
+    def limpiar(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class _Serie:
+    __slots__ = ("llamadas", "errores", "total", "maximo", "cubetas")
+    
+    def __init__(self):
+        self.llamadas = 0
+        self.errores = 0
+        self.total = 0.0
+        self.maximo = 0.0
+        self.cubetas: Dict[int, int] = {}
+    
+    def agregar(self, duracion: float, cubeta: int, error: bool) -> None:
+        self.llamadas += 1
+        self.errores += error
+        self.total += duracion
+        self.maximo = max(self.maximo, duracion)
+        self.cubetas[cubeta] = self.cubetas.get(cubeta, 0) + 1
+    
+    def percentil(self, q: float) -> float:
+        # Límite superior de la cubeta que contiene el percentil (acotado al máximo)
+        objetivo = q / 100 * self.llamadas
+        acumulado = 0
+        for cubeta in sorted(self.cubetas):
+            acumulado += self.cubetas[cubeta]
+            if acumulado >= objetivo:
+                limite = 2 ** ((cubeta + 1) / HistogramaTramos.CUBETAS_POR_OCTAVA) / 1e9
+                return min(limite, self.maximo)
+        return self.maximo
+    
+    def resumen(self) -> Dict[str, Any]:
+        return {
+            "llamadas": self.llamadas,
+            "errores": self.errores,
+            "total_ms": round(self.total * 1000, 3),
+            "media_ms": round(self.total / self.llamadas * 1000, 4),
+            "p50_ms": round(self.percentil(50) * 1000, 4),
+            "p99_ms": round(self.percentil(99) * 1000, 4),
+            "max_ms": round(self.maximo * 1000, 4),
+        }
+
+
+def formatear_resumen(resumen: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Líneas de texto con el resumen de un HistogramaTramos"""
+    lineas = [f"{'tramo':<58}{'llamadas':>10}{'total ms':>12}{'p50 ms':>10}{'p99 ms':>10}"]
+    for nombre, datos in resumen.items():
+        lineas.append(
+            f"{nombre:<58}{datos['llamadas']:>10}{datos['total_ms']:>12.3f}"
+            f"{datos['p50_ms']:>10.4f}{datos['p99_ms']:>10.4f}"
+        )
+    return lineas
@@ -1,40 +1,61 @@
-import matplotlib.pyplot as plt
-import numpy as np
-from typing import List
-from ..domain.entities import IVisualizador
+from __future__ import annotations
+from typing import List, Optional
+from ..domain.entities import FronteraPareto, ICalculadorAmdahl, IVisualizador
+from ..importacion_diferida import importar_diferido
 from ..infrastructure.calculador_amdahl import CalculadorAmdahl
+from ..infrastructure.curvas_amdahl import GeneradorCurvasAmdahl
+
+
+np = importar_diferido("numpy")
 
 
 class VisualizadorMatplotlib(IVisualizador):
     
-    def __init__(self):
-        self.calculadora = CalculadorAmdahl()
-        # Configurar matplotlib para mejor visualización
-        plt.style.use('default')
-        plt.rcParams['figure.figsize'] = (10, 6)
-        plt.rcParams['font.size'] = 10
+    def __init__(self, calculador: Optional[ICalculadorAmdahl] = None):
+        self.calculadora = calculador or CalculadorAmdahl()
+        self.curvas = GeneradorCurvasAmdahl(self.calculadora)
+        self._estilo_configurado = False
+    
+    def _pyplot(self):
+        # pyplot se importa en el primer gráfico: crear el visualizador no carga matplotlib
+        import matplotlib.pyplot as plt
+        if not self._estilo_configurado:
+            # Configurar matplotlib para mejor visualización
+            plt.style.use('default')
+            plt.rcParams['figure.figsize'] = (10, 6)
+            plt.rcParams['font.size'] = 10
+            self._estilo_configurado = True
+        return plt
+    
+    def generar_curvas_aceleracion(
+        self, 
+        valores_curva: List[float], 
+        valores_eje: List[float],
+        eje: str = 'k'
+    ) -> np.ma.MaskedArray:
+        return self.curvas.generar_curvas_aceleracion(valores_curva, valores_eje, eje)
+    
+    def generar_curva_limite_teorico(
+        self, 
+        porcentajes_mejora: List[float], 
+        limite_visible: float = 100
+    ) -> np.ma.MaskedArray:
+        return self.curvas.generar_curva_limite_teorico(porcentajes_mejora, limite_visible)
     
     def graficar_aceleracion_vs_factor(
         self, 
         porcentajes_mejora: List[float], 
         factores_mejora: List[float]
     ) -> None:
+        plt = self._pyplot()
         plt.figure(figsize=(12, 8))
         
-        for f in porcentajes_mejora:
-            aceleraciones = []
-            for k in factores_mejora:
-                try:
-                    a = self.calculadora.calcular_aceleracion_con_parametros(f, k)
-                    aceleraciones.append(a)
-                except ValueError:
-                    aceleraciones.append(None)
-            
-            # Filtrar valores None
-            k_validos = [k for k, a in zip(factores_mejora, aceleraciones) if a is not None]
-            a_validos = [a for a in aceleraciones if a is not None]
-            
-            plt.plot(k_validos, a_validos, marker='o', linewidth=2, 
+        k = np.asarray(factores_mejora, dtype=np.float64)
+        curvas = self.generar_curvas_aceleracion(porcentajes_mejora, k, eje='k')
+        
+        for f, curva in zip(porcentajes_mejora, curvas):
+            validos = ~np.ma.getmaskarray(curva)
+            plt.plot(k[validos], curva.compressed(), marker='o', linewidth=2, 
                     label=f'f = {f:.2f}', markersize=4)
         
         plt.xlabel('Factor de Mejora (k)', fontsize=12)
@@ -59,22 +80,15 @@ class VisualizadorMatplotlib(IVisualizador):
         factores_mejora: List[float], 
         porcentajes_mejora: List[float]
     ) -> None:
+        plt = self._pyplot()
         plt.figure(figsize=(12, 8))
         
-        for k in factores_mejora:
-            aceleraciones = []
-            for f in porcentajes_mejora:
-                try:
-                    a = self.calculadora.calcular_aceleracion_con_parametros(f, k)
-                    aceleraciones.append(a)
-                except ValueError:
-                    aceleraciones.append(None)
-            
-            # Filtrar valores None
-            f_validos = [f for f, a in zip(porcentajes_mejora, aceleraciones) if a is not None]
-            a_validos = [a for a in aceleraciones if a is not None]
-            
-            plt.plot(f_validos, a_validos, marker='s', linewidth=2, 
+        f = np.asarray(porcentajes_mejora, dtype=np.float64)
+        curvas = self.generar_curvas_aceleracion(factores_mejora, f, eje='f')
+        
+        for k, curva in zip(factores_mejora, curvas):
+            validos = ~np.ma.getmaskarray(curva)
+            plt.plot(f[validos], curva.compressed(), marker='s', linewidth=2, 
                     label=f'k = {k}', markersize=4)
         
         plt.xlabel('Fracción Mejorable (f)', fontsize=12)
@@ -95,6 +109,7 @@ class VisualizadorMatplotlib(IVisualizador):
         print("Gráfico guardado como 'aceleracion_vs_porcentaje.png'")
     
     def graficar_comparacion_componentes(self, componentes_data: List[dict]) -> None:
+        plt = self._pyplot()
         plt.figure(figsize=(12, 6))
         
         nombres = [comp['nombre'] for comp in componentes_data]
@@ -123,14 +138,101 @@ class VisualizadorMatplotlib(IVisualizador):
         plt.savefig('comparacion_componentes.png', dpi=300, bbox_inches='tight')
         print("Gráfico guardado como 'comparacion_componentes.png'")
     
+    def graficar_tornado(self, barras: List[dict], variacion: float = 0.1) -> None:
+        """
+        Gráfico de tornado: una barra horizontal por (componente, parámetro)
+        con el cambio de A entre 'bajo' y 'alto', la de mayor impacto arriba
+        (p. ej. las barras de AnalizadorComponentes.calcular_tornado).
+        """
+        plt = self._pyplot()
+        plt.figure(figsize=(12, max(4, 0.45 * len(barras) + 1.5)))
+        
+        orden = sorted(barras, key=lambda b: b['alto'] - b['bajo'])
+        etiquetas = [f"{b['nombre']} · {b['parametro']}" for b in orden]
+        posiciones = np.arange(len(orden))
+        bajos = np.array([b['bajo'] for b in orden])
+        altos = np.array([b['alto'] for b in orden])
+        colores = ['tab:blue' if b['parametro'] == 'k' else 'tab:orange' for b in orden]
+        
+        plt.barh(posiciones, altos, color=colores, alpha=0.85)
+        plt.barh(posiciones, bajos, color=colores, alpha=0.45)
+        for posicion, bajo, alto in zip(posiciones, bajos, altos):
+            plt.text(alto, posicion, f' {alto:+.4f}', va='center', fontsize=9)
+            plt.text(bajo, posicion, f'{bajo:+.4f} ', va='center', ha='right', fontsize=9)
+        
+        plt.yticks(posiciones, etiquetas)
+        plt.axvline(x=0, color='black', linewidth=1)
+        plt.xlabel(f'Cambio en la aceleración (ΔA) ante ±{variacion:.0%} en el parámetro', fontsize=12)
+        plt.title('Sensibilidad de la Aceleración (Tornado)', fontsize=14, fontweight='bold')
+        plt.grid(True, alpha=0.3, axis='x')
+        
+        plt.tight_layout()
+        plt.show()
+        
+        # Guardar grafico
+        plt.savefig('tornado_sensibilidad.png', dpi=300, bbox_inches='tight')
+        print("Gráfico guardado como 'tornado_sensibilidad.png'")
+    
+    def graficar_frontera_pareto(
+        self, 
+        frontera: FronteraPareto, 
+        max_etiquetas: int = 15
+    ) -> None:
+        """
+        Aceleración vs costo de todos los candidatos, con la frontera de
+        Pareto resaltada (coloreada por riesgo si la frontera lo incluye)
+        """
+        plt = self._pyplot()
+        plt.figure(figsize=(12, 7))
+        
+        # Solo los válidos que no están en la frontera
+        dominados = ~np.isnan(frontera.aceleracion)
+        dominados[frontera.indices] = False
+        # Con muchos candidatos, la nube se rasteriza para que el archivo no crezca
+        plt.scatter(frontera.costo[dominados], frontera.aceleracion[dominados], s=12,
+                   color='lightgray', alpha=0.6, rasterized=dominados.sum() > 5000,
+                   label='Candidatos dominados')
+        
+        costos = frontera.costo[frontera.indices]
+        aceleraciones = frontera.aceleracion[frontera.indices]
+        if frontera.riesgo is None:
+            plt.step(costos, aceleraciones, where='post', color='tab:red', linewidth=2, alpha=0.7)
+            plt.scatter(costos, aceleraciones, s=60, color='tab:red', zorder=3,
+                       label='Frontera de Pareto')
+        else:
+            puntos = plt.scatter(costos, aceleraciones, s=60, zorder=3, 
+                                c=frontera.riesgo[frontera.indices], cmap='viridis',
+                                edgecolors='black', label='Frontera de Pareto')
+            plt.colorbar(puntos, label='Riesgo')
+        
+        if len(frontera) <= max_etiquetas:
+            for nombre, costo, aceleracion in zip(frontera.nombres, costos, aceleraciones):
+                plt.annotate(nombre, (costo, aceleracion), textcoords='offset points',
+                            xytext=(6, 4), fontsize=8)
+        
+        plt.xlabel('Costo', fontsize=12)
+        plt.ylabel('Aceleración (A)', fontsize=12)
+        plt.title('Frontera de Pareto: Aceleración vs Costo', fontsize=14, fontweight='bold')
+        plt.grid(True, alpha=0.3)
+        plt.legend(fontsize=10, loc='lower right')
+        
+        plt.tight_layout()
+        plt.show()
+        
+        # Guardar grafico
+        plt.savefig('frontera_pareto.png', dpi=300, bbox_inches='tight')
+        print("Gráfico guardado como 'frontera_pareto.png'")
+    
     def graficar_limite_teorico(self, porcentajes_mejora: List[float]) -> None:
+        plt = self._pyplot()
         plt.figure(figsize=(10, 6))
         
-        limites = [1/(1-f) if f < 1 else float('inf') for f in porcentajes_mejora]
+        f = np.asarray(porcentajes_mejora, dtype=np.float64)
+        limites = self.generar_curva_limite_teorico(f)
         
         # Filtrar valores infinitos para visualización
-        f_filtrados = [f for f, limite in zip(porcentajes_mejora, limites) if limite < 100]
-        limites_filtrados = [limite for limite in limites if limite < 100]
+        f_filtrados = f[~np.ma.getmaskarray(limites)]
+        limites_filtrados = limites.compressed()
         
         plt.plot(f_filtrados, limites_filtrados, 'r-', linewidth=3, 
                 label='Límite Teórico A_max = 1/(1-f)')
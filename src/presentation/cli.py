@@ -1,35 +1,100 @@
+import argparse
+import logging
+import os
 import sys
+import time
 from typing import List, Optional
 from ..domain.entities import ComponenteGPU
-from ..domain.value_objects import ComponentesGPUPredefinidos, ConfiguracionGPUPar
+from ..domain.value_objects import (
+    ComponentesGPUPredefinidos, 
+    ConfiguracionGPUPar, 
+    ConfiguracionInterconexion,
+    ConstantesMatematicas,
+    ModelosEscalamiento
+)
 from ..application.use_cases import (
     ResolverProblemaGPUUseCase,
     CalcularAceleracionUseCase,
     CalcularTiempoOptimizadoUseCase,
     GenerarGraficosUseCase,
     AnalizarComponentesUseCase,
-    CargarComponentesPredefinidosUseCase
+    CargarComponentesPredefinidosUseCase,
+    CargarCatalogoComponentesUseCase,
+    DimensionarMultiGPUUseCase,
+    EvaluarLoteComponentesUseCase
 )
+from ..application.instrumentacion import Instrumentador, instrumentar
 from ..infrastructure.calculador_amdahl import CalculadorAmdahl
+from ..infrastructure.calculador_cache import CalculadorAmdahlCache
+from ..infrastructure.cache_disco import (
+    AlmacenArreglosDisco,
+    CalculadorAmdahlCacheDisco,
+    directorio_por_defecto
+)
 from ..infrastructure.analizador_componentes import AnalizadorComponentes
+from ..infrastructure.catalogo_componentes import (
+    RepositorioComponentesArchivo,
+    ruta_config_por_defecto
+)
+from ..infrastructure.archivos_componentes import (
+    FORMATOS_SOPORTADOS,
+    EscritorResultados,
+    detectar_formato,
+    leer_bloques
+)
+from ..infrastructure.sumideros_tramos import (
+    HistogramaTramos,
+    SumideroJSONL,
+    SumideroLogging,
+    formatear_resumen
+)
 
 
 class CLIAmdahl:
     
-    def __init__(self):
+    def __init__(
+        self, 
+        directorio_cache: Optional[str] = None, 
+        capacidad_cache_mb: int = 512,
+        instrumentador: Optional[Instrumentador] = None,
+        ruta_config: Optional[str] = None
+    ):
+        # Sin sumideros, instrumentar() devuelve los objetos sin envolver
+        self.instrumentador = instrumentador or Instrumentador()
+        
         # Dependencias
-        self.calculador = CalculadorAmdahl()
-        self.analizador = AnalizadorComponentes(self.calculador)
+        self.calculador = self._instrumentar(CalculadorAmdahlCache(CalculadorAmdahl()))
+        # Las curvas de los gráficos se leen de disco entre ejecuciones; solo ellas:
+        # los bloques de `lote` son de un solo uso y desalojarían las grillas
+        self.calculador_curvas = self.calculador
+        if directorio_cache:
+            self.calculador_curvas = self._instrumentar(CalculadorAmdahlCacheDisco(
+                self.calculador,
+                AlmacenArreglosDisco(directorio_cache, capacidad_cache_mb * 1024**2)
+            ))
+        self.analizador = self._instrumentar(AnalizadorComponentes(self.calculador))
+        
+        # Componentes predefinidos desde config.json (compilado en caché tras la primera lectura)
+        self.directorio_cache = directorio_cache
+        self.repositorio = (
+            RepositorioComponentesArchivo(ruta_config, directorio_cache) if ruta_config else None
+        )
         
         # Casos de uso
-        self.cargar_componentes = CargarComponentesPredefinidosUseCase()
-        self.calcular_aceleracion = CalcularAceleracionUseCase(self.calculador)
-        self.calcular_tiempo = CalcularTiempoOptimizadoUseCase(self.calculador)
-        self.analizar_componentes = AnalizarComponentesUseCase(self.analizador)
+        self.cargar_componentes = self._instrumentar(
+            CargarComponentesPredefinidosUseCase(self.repositorio)
+        )
+        self.calcular_aceleracion = self._instrumentar(CalcularAceleracionUseCase(self.calculador))
+        self.calcular_tiempo = self._instrumentar(CalcularTiempoOptimizadoUseCase(self.calculador))
+        self.analizar_componentes = self._instrumentar(AnalizarComponentesUseCase(self.analizador))
+        self.evaluar_lote = self._instrumentar(EvaluarLoteComponentesUseCase(self.calculador))
         
         # Lista de componentes ingresados por el usuario
         self.componentes_usuario: List[ComponenteGPU] = []
     
+    def _instrumentar(self, objeto):
+        return instrumentar(objeto, self.instrumentador)
+    
     def mostrar_menu_principal(self):
         print("\n" + "="*70)
         print("    CALCULADORA LEY DE AMDAHL - OPTIMIZACIÓN GPU")
@@ -82,10 +147,11 @@ class CLIAmdahl:
         try:
             # Importar aquí para evitar errores si matplotlib no está instalado
             from ..infrastructure.visualizador_matplotlib import VisualizadorMatplotlib
-            visualizador = VisualizadorMatplotlib()
+            visualizador = self._instrumentar(VisualizadorMatplotlib(self.calculador_curvas))
             
             resolver_problema = ResolverProblemaGPUUseCase(
-                self.calculador, self.analizador, visualizador
+                self.calculador, self.analizador, visualizador,
+                self.instrumentador, self.repositorio
             )
             
             print("Resolviendo problema...")
@@ -257,13 +323,14 @@ class CLIAmdahl:
         
         try:
             from ..infrastructure.visualizador_matplotlib import VisualizadorMatplotlib
-            visualizador = VisualizadorMatplotlib()
-            generar_graficos = GenerarGraficosUseCase(visualizador)
+            visualizador = self._instrumentar(VisualizadorMatplotlib(self.calculador_curvas))
+            generar_graficos = self._instrumentar(GenerarGraficosUseCase(visualizador))
             
             print("1. Gráfico A vs k (para f=0.25 y f=0.35)")
             print("2. Gráfico A vs f (para diferentes k)")
             print("3. Comparación de componentes predefinidos")
             print("4. Límite teórico")
+            print("5. Tornado de sensibilidad (±10% en f y k)")
             print("0. Volver")
             
             opcion = input("\nSeleccione opción: ").strip()
@@ -278,6 +345,8 @@ class CLIAmdahl:
                 self._graficar_comparacion_componentes(visualizador)
             elif opcion == "4":
                 self._graficar_limite_teorico(visualizador)
+            elif opcion == "5":
+                self._graficar_tornado(visualizador)
             elif opcion == "0":
                 return
             else:
@@ -302,11 +371,21 @@ class CLIAmdahl:
                 'aceleracion': resultado.aceleracion
             })
         
-        visualizador.graficar_comparacion_componentes(datos)
+        return visualizador.graficar_comparacion_componentes(datos)
+    
+    def _graficar_tornado(self, visualizador, variacion: float = 0.1):
+        componentes = self.cargar_componentes.execute()
+        barras = self.analizador.calcular_tornado(componentes, variacion)
+        
+        print("\n📐 Ganancia marginal (elasticidad de A respecto de k):")
+        for nombre, elasticidad in self.analizador.rankear_por_ganancia_marginal(componentes):
+            print(f"   {nombre}: +{elasticidad:.2%} de A por cada 1% de mejora en k")
+        
+        visualizador.graficar_tornado(barras, variacion)
     
     def _graficar_limite_teorico(self, visualizador):
         porcentajes = [i/100 for i in range(5, 96, 5)]
-        visualizador.graficar_limite_teorico(porcentajes)
+        return visualizador.graficar_limite_teorico(porcentajes)
     
     def mostrar_informacion_teorica(self):
         print("\n" + "="*70)
@@ -346,6 +425,210 @@ mejorable (f) que aumentar indefinidamente el factor k.
         print(info)
         input("Presione Enter para continuar...")
     
+    def procesar_archivo(
+        self, 
+        ruta_entrada: str, 
+        ruta_salida: str,
+        formato_entrada: Optional[str] = None,
+        formato_salida: Optional[str] = None,
+        tamano_bloque: int = 100_000,
+        tiempo_original: Optional[float] = None,
+        redondear: bool = True
+    ):
+        """Modo no interactivo: evalúa un inventario completo con memoria constante"""
+        # Con '-' (stdin/stdout) no hay extensión: CSV en la entrada y el mismo formato a la salida
+        formato_entrada = detectar_formato(ruta_entrada, formato_entrada, predeterminado="csv")
+        formato_salida = detectar_formato(ruta_salida, formato_salida, predeterminado=formato_entrada)
+        
+        entrada = sys.stdin if ruta_entrada == "-" else open(
+            ruta_entrada, encoding="utf-8", newline=""
+        )
+        salida = sys.stdout if ruta_salida == "-" else open(
+            ruta_salida, "w", encoding="utf-8", newline=""
+        )
+        try:
+            escritor = EscritorResultados(
+                salida, formato_salida, incluir_tiempo=tiempo_original is not None
+            )
+            resumen = self.evaluar_lote.execute(
+                leer_bloques(entrada, formato_entrada, tamano_bloque),
+                escritor.escribir,
+                tiempo_original=tiempo_original,
+                decimales=ConstantesMatematicas.PRECISION_DECIMAL if redondear else None
+            )
+        finally:
+            if entrada is not sys.stdin:
+                entrada.close()
+            if salida is not sys.stdout:
+                salida.close()
+        
+        # Si los resultados van a stdout, el resumen va a stderr para no mezclarlos
+        destino = sys.stderr if salida is sys.stdout else sys.stdout
+        print(
+            f"✅ {resumen.filas:,} filas procesadas ({resumen.filas_validas:,} válidas) "
+            f"en {resumen.bloques} bloque(s) y {resumen.segundos:.2f}s "
+            f"→ {resumen.filas_por_segundo:,.0f} filas/s",
+            file=destino
+        )
+        return resumen
+    
+    def generar_reporte_graficos(self, directorio: str, formato: str = "png", dpi: int = 100):
+        """Modo no interactivo: escribe los gráficos en `directorio` sin abrir ventanas"""
+        from ..infrastructure.renderizador_headless import RenderizadorHeadless
+        
+        os.makedirs(directorio, exist_ok=True)
+        renderizador = self._instrumentar(
+            RenderizadorHeadless(self.calculador_curvas, dpi, formato, directorio)
+        )
+        generar_graficos = self._instrumentar(GenerarGraficosUseCase(renderizador))
+        
+        archivos = [
+            generar_graficos.graficar_a_vs_k([0.25, 0.35]),
+            generar_graficos.graficar_a_vs_f([4, 8]),
+            self._graficar_comparacion_componentes(renderizador),
+            self._graficar_limite_teorico(renderizador),
+        ]
+        for archivo in archivos:
+            print(f"🖼️  {archivo}")
+        return archivos
+    
+    def analizar_catalogo(
+        self, 
+        ruta: str, 
+        top: int = 10, 
+        escalamiento: float = ModelosEscalamiento.AMDAHL
+    ):
+        """Modo no interactivo: carga un catálogo grande y muestra los mejores componentes"""
+        cargar_catalogo = self._instrumentar(CargarCatalogoComponentesUseCase(
+            RepositorioComponentesArchivo(ruta, self.directorio_cache)
+        ))
+        inicio = time.perf_counter()
+        catalogo = cargar_catalogo.execute()
+        segundos_carga = time.perf_counter() - inicio
+        
+        analisis = self.analizar_componentes.determinar_mejor_optimizacion(
+            catalogo, escalamiento
+        )
+        print(f"📦 {len(catalogo):,} componentes cargados en {segundos_carga * 1000:.1f} ms")
+        print(f"🏆 Mejor opción: {analisis.mejor_componente.nombre}")
+        for i, (nombre, aceleracion) in enumerate(analisis.top_k(top), 1):
+            print(f"   {i:>3}. {nombre}: {aceleracion:.4f}x")
+    
+    def analizar_incertidumbre(
+        self,
+        error_porcentaje: float,
+        error_factor: float,
+        muestras: int = 100_000,
+        semilla: Optional[int] = None,
+        aceleracion_objetivo: Optional[float] = None,
+        procesos: Optional[int] = None
+    ):
+        """Modo no interactivo: Monte Carlo sobre los predefinidos con f ± error y k ± error"""
+        from ..domain.entidades_incertidumbre import ComponenteIncierto
+        from ..infrastructure.simulador_monte_carlo import SimuladorMonteCarlo
+        
+        componentes = [
+            ComponenteIncierto.desde_componente(c, error_porcentaje, error_factor)
+            for c in self.cargar_componentes.execute()
+        ]
+        # Instrumentado o no, el calculador llega a los procesos sin envolver
+        analizador = self._instrumentar(AnalizadorComponentes(
+            self.calculador, SimuladorMonteCarlo(self.calculador, procesos)
+        ))
+        inicio = time.perf_counter()
+        analisis = analizador.determinar_mejor_componente_probabilistico(
+            componentes, muestras, semilla,
+            aceleracion_objetivo=aceleracion_objetivo,
+            tiempo_original=ConfiguracionGPUPar.TIEMPO_RENDERIZADO_ORIGINAL
+        )
+        segundos = time.perf_counter() - inicio
+        
+        print(f"🎲 {muestras:,} muestras por componente en {segundos * 1000:.1f} ms")
+        for r in analisis.resultados:
+            p5, p50, p95 = (r.aceleracion.percentiles.get(p) for p in (5.0, 50.0, 95.0))
+            linea = (
+                f"   {r.nombre:<26} A media {r.aceleracion.media:.4f}x "
+                f"(p5 {p5:.4f}, p50 {p50:.4f}, p95 {p95:.4f})  "
+                f"T media {r.tiempo_optimizado.media:.2f} ms  P(mejor) {r.probabilidad_mejor:.1%}"
+            )
+            if r.probabilidad_objetivo is not None:
+                linea += f"  P(A ≥ {aceleracion_objetivo:g}) {r.probabilidad_objetivo:.1%}"
+            print(linea)
+        if analisis.mejor_componente is not None:
+            print(f"🏆 Mejor opción (probabilística): {analisis.mejor_componente.nombre}")
+    
+    def dimensionar_multi_gpu(
+        self,
+        porcentajes_paralelos: List[float],
+        mensajes_mb: List[float],
+        tiempo_base: float = ConfiguracionGPUPar.TIEMPO_RENDERIZADO_ORIGINAL,
+        max_dispositivos: int = ConfiguracionInterconexion.MAX_DISPOSITIVOS,
+        ganancia_minima: float = ConfiguracionInterconexion.GANANCIA_MINIMA
+    ):
+        """Modo no interactivo: GPUs que conviene usar por perfil (f × mensaje), NVLink vs PCIe"""
+        from ..domain.entidades_multi_gpu import Interconexion
+        from ..infrastructure.modelo_multi_gpu import ModeloMultiGPU
+        
+        dimensionar = self._instrumentar(DimensionarMultiGPUUseCase({
+            interconexion.nombre: ModeloMultiGPU(interconexion)
+            for interconexion in (Interconexion.tipo_nvlink(), Interconexion.tipo_pcie())
+        }))
+        f = [[p] for p in porcentajes_paralelos]                 # Perfiles: f × mensaje
+        mensajes = [[mb * 1024**2 for mb in mensajes_mb]]
+        optimos = dimensionar.execute(f, mensajes, tiempo_base, max_dispositivos, ganancia_minima)
+        
+        criterio = (
+            f"se agregan GPUs mientras la siguiente mejore A al menos {ganancia_minima:.1%}"
+            if ganancia_minima > 0 else "N de máxima aceleración"
+        )
+        print(
+            f"🖧 T1 = {tiempo_base:g} ms por paso, all-reduce en anillo, tope {max_dispositivos} GPUs"
+        )
+        print(f"   Criterio: {criterio}")
+        en_tope = 0
+        for nombre, optimo in optimos.items():
+            print(f"\n{nombre}:")
+            for i, p in enumerate(porcentajes_paralelos):
+                for j, mb in enumerate(mensajes_mb):
+                    tope = optimo.dispositivos[i, j] == max_dispositivos
+                    en_tope += tope
+                    print(
+                        f"   f={p:<6g} mensaje {mb:>8g} MB → {optimo.dispositivos[i, j]:>3} GPUs  "
+                        f"A {optimo.aceleracion[i, j]:.3f}x  "
+                        f"eficiencia {optimo.eficiencia[i, j]:.1%}  "
+                        f"T {optimo.tiempo[i, j]:.2f} ms"
+                        f"{'  ⚠️ tope' if tope else ''}"
+                    )
+        if en_tope:
+            print(
+                f"\n⚠️  {en_tope} perfil(es) llegaron al tope de {max_dispositivos} GPUs: "
+                f"seguir agregando aún convendría (subir --max-gpus o --ganancia-minima)"
+            )
+    
+    def servir_http(
+        self, 
+        host: str = "127.0.0.1", 
+        puerto: int = 8080,
+        max_lote: int = 256,
+        max_espera_ms: float = 2.0
+    ):
+        """Modo servicio: expone los casos de uso por HTTP/JSON hasta Ctrl+C"""
+        import asyncio
+        from .servidor_http import ServidorAmdahl
+        
+        servidor = ServidorAmdahl(
+            self.calcular_aceleracion,
+            self.calcular_tiempo,
+            self.analizar_componentes,
+            max_lote=max_lote,
+            max_espera_ms=max_espera_ms
+        )
+        print(f"🌐 Sirviendo en http://{host}:{puerto} (Ctrl+C para detener)")
+        try:
+            asyncio.run(servidor.servir(host, puerto))
+        except KeyboardInterrupt:
+            print("\n¡Servicio detenido!")
+    
     def _mostrar_resultados_completos(self, resultados: dict):
         print("\n🎯 RESULTADOS PROBLEMA COMPLETO:")
         print("="*60)
@@ -390,13 +673,215 @@ mejorable (f) que aumentar indefinidamente el factor k.
         print(f"• Mejor: {comparacion['mejor'].upper()}")
 
 
-def main():
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Calculadora Ley de Amdahl - Optimización GPU. "
+                    "Sin subcomando se abre el menú interactivo."
+    )
+    parser.add_argument(
+        "--cache-disco", metavar="DIR", default=directorio_por_defecto(),
+        help="Directorio del caché persistente de las curvas de los gráficos "
+             "(default: variable de entorno AMDAHL_CACHE_DIR; sin valor, desactivado)"
+    )
+    parser.add_argument(
+        "--cache-max-mb", type=int, default=512, 
+        help="Tamaño máximo del caché en disco en MB (default: 512)"
+    )
+    parser.add_argument(
+        "--config", metavar="ARCHIVO", default=ruta_config_por_defecto(),
+        help="Archivo con los componentes predefinidos (default: config.json del proyecto; "
+             "sin archivo se usan los valores incorporados)"
+    )
+    parser.add_argument(
+        "--trazas", action="append", choices=["log", "histograma"], default=[],
+        help="Mide cada caso de uso y cada método del calculador, analizador y "
+             "visualizador: 'log' escribe cada tramo en stderr, 'histograma' "
+             "imprime un resumen por tramo al terminar (se puede repetir)"
+    )
+    parser.add_argument(
+        "--trazas-jsonl", metavar="ARCHIVO", 
+        help="Agrega cada tramo medido como una línea JSON a este archivo"
+    )
+    subcomandos = parser.add_subparsers(dest="comando")
+    
+    lote = subcomandos.add_parser(
+        "lote", 
+        help="Evalúa en streaming un inventario CSV/JSONL con columnas nombre, f, k"
+    )
+    lote.add_argument("entrada", help="Archivo de entrada ('-' para stdin)")
+    lote.add_argument("salida", help="Archivo de resultados ('-' para stdout)")
+    lote.add_argument(
+        "--formato-entrada", choices=FORMATOS_SOPORTADOS, 
+        help="Por defecto según la extensión (csv para stdin)"
+    )
+    lote.add_argument(
+        "--formato-salida", choices=FORMATOS_SOPORTADOS, 
+        help="Por defecto según la extensión (el de la entrada para stdout)"
+    )
+    lote.add_argument(
+        "--bloque", type=int, default=100_000, 
+        help="Filas por bloque evaluado (default: 100000)"
+    )
+    lote.add_argument(
+        "--tiempo-original", type=float, 
+        help="Agrega la columna tiempo_optimizado para este tiempo original"
+    )
+    lote.add_argument(
+        "--sin-redondeo", action="store_true", 
+        help="No redondear los resultados a la precisión por defecto"
+    )
+    
+    graficos = subcomandos.add_parser(
+        "graficos", 
+        help="Escribe los gráficos en archivos sin abrir ventanas (backend Agg)"
+    )
+    graficos.add_argument("directorio", help="Directorio de salida (se crea si no existe)")
+    graficos.add_argument("--formato", choices=["png", "svg"], default="png")
+    graficos.add_argument("--dpi", type=int, default=100, help="Resolución de los PNG (default: 100)")
+    
+    catalogo = subcomandos.add_parser(
+        "catalogo", 
+        help="Carga un catálogo JSON/CSV/JSONL (compilado en caché tras la primera "
+             "lectura) y muestra los mejores componentes"
+    )
+    catalogo.add_argument("ruta", help="Archivo del catálogo")
+    catalogo.add_argument("--top", type=int, default=10, help="Componentes a mostrar (default: 10)")
+    catalogo.add_argument(
+        "--modelo", type=ModelosEscalamiento.desde_nombre, default=ModelosEscalamiento.AMDAHL,
+        help="Modelo del ranking: 'amdahl' (trabajo fijo), 'gustafson' (trabajo escalado) "
+             "o un α entre 0 y 1 para el modo mixto (default: amdahl)"
+    )
+    
+    incertidumbre = subcomandos.add_parser(
+        "incertidumbre", 
+        help="Propaga por Monte Carlo el error de medición de f y k de los "
+             "componentes predefinidos a la aceleración"
+    )
+    incertidumbre.add_argument(
+        "--error-f", type=float, default=0.02, 
+        help="Desvío estándar de f (default: 0.02)"
+    )
+    incertidumbre.add_argument(
+        "--error-k", type=float, default=0.5, 
+        help="Desvío estándar de k (default: 0.5)"
+    )
+    incertidumbre.add_argument("--muestras", type=int, default=100_000)
+    incertidumbre.add_argument(
+        "--semilla", type=int, 
+        help="Semilla para resultados reproducibles (independiente de --procesos)"
+    )
+    incertidumbre.add_argument(
+        "--objetivo", type=float, 
+        help="Aceleración objetivo para estimar P(A >= objetivo)"
+    )
+    incertidumbre.add_argument(
+        "--procesos", type=int, 
+        help="Procesos trabajadores (default: uno por CPU)"
+    )
+    
+    multigpu = subcomandos.add_parser(
+        "multigpu", 
+        help="Número de GPUs a partir del cual agregar otra deja de convenir, con "
+             "interconexión tipo NVLink y tipo PCIe"
+    )
+    multigpu.add_argument(
+        "--f", type=float, nargs="+", default=[0.9, 0.95, 0.99], 
+        help="Fracciones paralelizables a evaluar (default: 0.9 0.95 0.99)"
+    )
+    multigpu.add_argument(
+        "--mensaje-mb", type=float, nargs="+", default=[64, 256], 
+        help="MB sincronizados entre GPUs en cada paso (default: 64 256)"
+    )
+    multigpu.add_argument(
+        "--tiempo-ms", type=float, default=ConfiguracionGPUPar.TIEMPO_RENDERIZADO_ORIGINAL,
+        help="Tiempo por paso con una GPU en ms (default: 50)"
+    )
+    multigpu.add_argument(
+        "--max-gpus", type=int, default=ConfiguracionInterconexion.MAX_DISPOSITIVOS
+    )
+    multigpu.add_argument(
+        "--ganancia-minima", type=float, default=ConfiguracionInterconexion.GANANCIA_MINIMA, 
+        help="Deja de agregar GPUs cuando la siguiente mejora la aceleración menos "
+             "que esta fracción (default: 0.05; 0 = máxima aceleración)"
+    )
+    
+    servir = subcomandos.add_parser(
+        "servir", 
+        help="Servicio HTTP/JSON local que agrupa solicitudes concurrentes en micro-lotes"
+    )
+    servir.add_argument("--host", default="127.0.0.1")
+    servir.add_argument("--puerto", type=int, default=8080)
+    servir.add_argument(
+        "--max-lote", type=int, default=256, 
+        help="Máximo de solicitudes por micro-lote (default: 256)"
+    )
+    servir.add_argument(
+        "--max-espera-ms", type=float, default=2.0, 
+        help="Espera máxima para completar un micro-lote en ms (default: 2)"
+    )
+    return parser
+
+
+def crear_instrumentador(args: argparse.Namespace) -> Instrumentador:
+    instrumentador = Instrumentador()
+    if "log" in args.trazas:
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr, format="%(message)s")
+        instrumentador.agregar_sumidero(SumideroLogging())
+    if "histograma" in args.trazas:
+        instrumentador.agregar_sumidero(HistogramaTramos())
+    if args.trazas_jsonl:
+        instrumentador.agregar_sumidero(SumideroJSONL(args.trazas_jsonl))
+    return instrumentador
+
+
+def cerrar_instrumentador(instrumentador: Instrumentador) -> None:
+    for sumidero in instrumentador.sumideros:
+        if isinstance(sumidero, HistogramaTramos):
+            print("\n⏱️  TRAMOS MEDIDOS:", file=sys.stderr)
+            for linea in formatear_resumen(sumidero.resumen()):
+                print(linea, file=sys.stderr)
+        elif isinstance(sumidero, SumideroJSONL):
+            sumidero.cerrar()
+
+
+def main(argv: Optional[List[str]] = None):
+    args = crear_parser().parse_args(argv)
+    instrumentador = crear_instrumentador(args)
+    
     try:
-        cli = CLIAmdahl()
-        cli.ejecutar()
+        cli = CLIAmdahl(args.cache_disco, args.cache_max_mb, instrumentador, args.config)
+        if args.comando == "lote":
+            cli.procesar_archivo(
+                args.entrada,
+                args.salida,
+                formato_entrada=args.formato_entrada,
+                formato_salida=args.formato_salida,
+                tamano_bloque=args.bloque,
+                tiempo_original=args.tiempo_original,
+                redondear=not args.sin_redondeo
+            )
+        elif args.comando == "graficos":
+            cli.generar_reporte_graficos(args.directorio, args.formato, args.dpi)
+        elif args.comando == "catalogo":
+            cli.analizar_catalogo(args.ruta, args.top, args.modelo)
+        elif args.comando == "incertidumbre":
+            cli.analizar_incertidumbre(
+                args.error_f, args.error_k, args.muestras, args.semilla,
+                args.objetivo, args.procesos
+            )
+        elif args.comando == "multigpu":
+            cli.dimensionar_multi_gpu(
+                args.f, args.mensaje_mb, args.tiempo_ms, args.max_gpus, args.ganancia_minima
+            )
+        elif args.comando == "servir":
+            cli.servir_http(args.host, args.puerto, args.max_lote, args.max_espera_ms)
+        else:
+            cli.ejecutar()
     except Exception as e:
-        print(f"❌ Error crítico: {e}")
+        print(f"❌ Error crítico: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        cerrar_instrumentador(instrumentador)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+"""
+Lienzo matplotlib persistente para la GUI, con actualización por blitting
+"""
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from ..infrastructure.renderizador_headless import actualizar_lineas
+
+
+class GraficoInteractivo:
+    """
+    Una sola Figure y un solo FigureCanvasTkAgg durante toda la sesión.
+    
+    - Cambiar de gráfico (A vs k → A vs f) limpia los ejes pero reutiliza el lienzo.
+    - Volver a dibujar el mismo gráfico solo cambia los datos de las líneas.
+    - Las series "animadas" (p. ej. la vista previa del componente personalizado)
+      se actualizan por blitting: se restaura el fondo guardado y se redibuja
+      únicamente ese artista, sin renderizar el resto de la figura.
+    """
+    
+    def __init__(self, contenedor: Any, figsize: tuple = (10, 6)):
+        self.figura = Figure(figsize=figsize, layout='tight')
+        self.ejes = self.figura.add_subplot()
+        self.canvas = FigureCanvasTkAgg(self.figura, contenedor)
+        self.widget = self.canvas.get_tk_widget()
+        
+        self.tipo: Optional[str] = None
+        self.lineas: List[Any] = []
+        self.animadas: Dict[str, Any] = {}
+        self._fondo = None
+        
+        # Cada redibujado completo (incluido un cambio de tamaño) renueva el fondo
+        self.canvas.mpl_connect('draw_event', self._capturar_fondo)
+    
+    def preparar(self, tipo: str, configurar: Callable[[Any], None]) -> bool:
+        """Configura los ejes para `tipo` si cambió; devuelve True si se rehicieron"""
+        if tipo == self.tipo:
+            return False
+        
+        self.ejes.clear()
+        self.lineas = []
+        self.animadas = {}
+        configurar(self.ejes)
+        self.tipo = tipo
+        return True
+    
+    def actualizar_curvas(
+        self,
+        x: np.ndarray,
+        curvas: np.ma.MaskedArray,
+        etiquetas: List[str],
+        marker: str
+    ) -> None:
+        actualizar_lineas(self.ejes, self.lineas, x, curvas, etiquetas, marker)
+        self.canvas.draw_idle()
+    
+    def redibujar(self) -> None:
+        self.canvas.draw_idle()
+    
+    def actualizar_animada(self, nombre: str, x: Any, y: Any, **estilo) -> None:
+        """Crea o actualiza una serie animada y la pinta por blitting"""
+        artista = self.animadas.get(nombre)
+        if artista is None:
+            artista = self.ejes.plot(x, y, animated=True, **estilo)[0]
+            self.animadas[nombre] = artista
+        else:
+            artista.set_data(x, y)
+            artista.set_visible(True)
+        
+        if self._fuera_de_limites(y):
+            # Los límites deben crecer: un redibujado completo renueva el fondo
+            self.ejes.relim(visible_only=True)
+            self.ejes.update_datalim(np.column_stack(
+                (np.atleast_1d(x), np.atleast_1d(y))
+            ))
+            self.ejes.autoscale_view()
+            self.canvas.draw_idle()
+        else:
+            self._blit()
+    
+    def ocultar_animadas(self) -> None:
+        for artista in self.animadas.values():
+            artista.set_visible(False)
+        self._blit()
+    
+    def _fuera_de_limites(self, y: Any) -> bool:
+        y = np.asarray(y, dtype=np.float64)
+        y = y[np.isfinite(y)]
+        if y.size == 0:
+            return False
+        minimo, maximo = self.ejes.get_ylim()
+        return bool(y.min() < minimo or y.max() > maximo)
+    
+    def _capturar_fondo(self, evento: Any) -> None:
+        self._fondo = self.canvas.copy_from_bbox(self.figura.bbox)
+        self._dibujar_animadas()
+    
+    def _blit(self) -> None:
+        if self._fondo is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._fondo)
+        self._dibujar_animadas()
+        self.canvas.blit(self.figura.bbox)
+    
+    def _dibujar_animadas(self) -> None:
+        for artista in self.animadas.values():
+            if artista.get_visible():
+                self.ejes.draw_artist(artista)
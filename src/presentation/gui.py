@@ -1,11 +1,8 @@
-import customtkinter as ctk
+from __future__ import annotations
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
 import threading
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from ..domain.entities import ComponenteGPU, ResultadoAmdahl
 from ..application.use_cases import (
@@ -14,15 +11,36 @@ from ..application.use_cases import (
     CargarComponentesPredefinidosUseCase,
     AnalizarComponentesUseCase
 )
+from ..application.instrumentacion import Instrumentador, instrumentar
 from ..infrastructure.calculador_amdahl import CalculadorAmdahl
+from ..infrastructure.calculador_cache import CalculadorAmdahlCache
 from ..infrastructure.analizador_componentes import AnalizadorComponentes
+from ..infrastructure.catalogo_componentes import (
+    RepositorioComponentesArchivo,
+    ruta_config_por_defecto
+)
 from ..infrastructure.visualizador_matplotlib import VisualizadorMatplotlib
+from ..infrastructure.curvas_amdahl import GeneradorCurvasAmdahl
+from ..importacion_diferida import importar_diferido
+
+if TYPE_CHECKING:
+    from .grafico_interactivo import GraficoInteractivo
+
+
+# customtkinter se carga al crear la ventana; numpy y matplotlib, con el primer gráfico
+ctk = importar_diferido("customtkinter")
+matplotlib = importar_diferido("matplotlib")
+np = importar_diferido("numpy")
 
 
 class AmdahlGUIApp:
     """Aplicación principal con interfaz gráfica"""
     
-    def __init__(self):
+    def __init__(
+        self, 
+        instrumentador: Optional[Instrumentador] = None,
+        ruta_config: Optional[str] = None
+    ):
         # Configurar CustomTkinter
         ctk.set_appearance_mode("dark")  # "light" o "dark"
         ctk.set_default_color_theme("blue")  # "blue", "green", "dark-blue"
@@ -33,19 +51,35 @@ class AmdahlGUIApp:
         self.root.geometry("1200x800")
         self.root.minsize(1000, 700)
         
-        # Dependencias
-        self.calculador = CalculadorAmdahl()
-        self.analizador = AnalizadorComponentes(self.calculador)
-        self.visualizador = VisualizadorMatplotlib()
+        # Dependencias (instrumentadas solo si el instrumentador tiene sumideros)
+        self.instrumentador = instrumentador or Instrumentador()
+        self.calculador = instrumentar(
+            CalculadorAmdahlCache(CalculadorAmdahl()), self.instrumentador
+        )
+        self.analizador = instrumentar(AnalizadorComponentes(self.calculador), self.instrumentador)
+        self.visualizador = instrumentar(VisualizadorMatplotlib(), self.instrumentador)
+        self.curvas = GeneradorCurvasAmdahl(self.calculador)
+        
+        # Componentes predefinidos desde config.json (si existe)
+        ruta_config = ruta_config or ruta_config_por_defecto()
+        self.repositorio = RepositorioComponentesArchivo(ruta_config) if ruta_config else None
         
         # Casos de uso
-        self.cargar_componentes = CargarComponentesPredefinidosUseCase()
-        self.calcular_aceleracion = CalcularAceleracionUseCase(self.calculador)
-        self.analizar_componentes = AnalizarComponentesUseCase(self.analizador)
+        self.cargar_componentes = instrumentar(
+            CargarComponentesPredefinidosUseCase(self.repositorio), self.instrumentador
+        )
+        self.calcular_aceleracion = instrumentar(
+            CalcularAceleracionUseCase(self.calculador), self.instrumentador
+        )
+        self.analizar_componentes = instrumentar(
+            AnalizarComponentesUseCase(self.analizador), self.instrumentador
+        )
         
         # Variables
         self.componentes_usuario: List[ComponenteGPU] = []
         self.resultados_actuales: List[ResultadoAmdahl] = []
+        self.grafico: Optional[GraficoInteractivo] = None
+        self.eje_x_grafico: Optional[np.ndarray] = None
         
         # Crear interfaz
         self.crear_interfaz()
@@ -160,6 +194,10 @@ class AmdahlGUIApp:
         self.entry_factor = ctk.CTkEntry(frame_pers, placeholder_text="Ej: 5")
         self.entry_factor.pack(fill="x", padx=15, pady=(0, 10))
         
+        # Vista previa en vivo sobre el gráfico A vs k / A vs f
+        self.entry_porcentaje.bind("<KeyRelease>", self.actualizar_vista_previa)
+        self.entry_factor.bind("<KeyRelease>", self.actualizar_vista_previa)
+        
         # Botón calcular
         self.btn_calcular = ctk.CTkButton(
             frame_pers,
@@ -405,7 +443,8 @@ La Ley de Amdahl es fundamental para:
             try:
                 # Resolver problema
                 resolver_problema = ResolverProblemaGPUUseCase(
-                    self.calculador, self.analizador, self.visualizador
+                    self.calculador, self.analizador, self.visualizador,
+                    self.instrumentador, self.repositorio
                 )
                 resultados = resolver_problema.resolver_problema_completo()
                 
@@ -587,6 +626,7 @@ La Ley de Amdahl es fundamental para:
             self.entry_nombre.delete(0, "end")
             self.entry_porcentaje.delete(0, "end")
             self.entry_factor.delete(0, "end")
+            self.actualizar_vista_previa()
             
             self.actualizar_estado(f"✅ Componente '{nombre}' calculado: {resultado.aceleracion:.4f}x")
             
@@ -653,28 +693,23 @@ La Ley de Amdahl es fundamental para:
         try:
             self.actualizar_estado("📊 Generando gráfico A vs k...")
             
-            # Crear figura
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
             # Datos - k debe ser mayor a 1
             k_values = np.arange(1.1, 21, 0.5)  # Comenzar en 1.1 para evitar error con k=1
             f_values = [0.25, 0.35]
-            
-            for f in f_values:
-                a_values = [self.calculador.calcular_aceleracion_con_parametros(f, k) for k in k_values]
-                ax.plot(k_values, a_values, marker='o', linewidth=2, 
-                       label=f'f = {f:.2f}', markersize=4)
-            
-            ax.set_xlabel('Factor de Mejora (k)', fontsize=12)
-            ax.set_ylabel('Aceleración (A)', fontsize=12)
-            ax.set_title('Ley de Amdahl: Aceleración vs Factor de Mejora', 
-                        fontsize=14, fontweight='bold')
-            ax.grid(True, alpha=0.3)
-            ax.legend(fontsize=11)
-            ax.axhline(y=1, color='red', linestyle='--', alpha=0.5)
+            curvas = self.curvas.generar_curvas_aceleracion(f_values, k_values, eje='k')
+            
+            grafico = self.obtener_grafico()
+            grafico.preparar("a_vs_k", lambda ax: self.configurar_ejes(
+                ax, 'Factor de Mejora (k)', 'Ley de Amdahl: Aceleración vs Factor de Mejora'
+            ))
+            grafico.actualizar_curvas(
+                k_values, curvas, [f'f = {f:.2f}' for f in f_values], marker='o'
+            )
+            self.eje_x_grafico = k_values
+            self.actualizar_vista_previa()
             
             # Mostrar en interfaz
-            self.mostrar_grafico_en_interfaz(fig)
+            self.mostrar_pestana_graficos()
             
             self.actualizar_estado("✅ Gráfico A vs k generado")
             
@@ -685,28 +720,23 @@ La Ley de Amdahl es fundamental para:
         try:
             self.actualizar_estado("📈 Generando gráfico A vs f...")
             
-            # Crear figura
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
             # Datos
             f_values = np.arange(0.05, 0.96, 0.05)
             k_values = [4, 8]
-            
-            for k in k_values:
-                a_values = [self.calculador.calcular_aceleracion_con_parametros(f, k) for f in f_values]
-                ax.plot(f_values, a_values, marker='s', linewidth=2, 
-                       label=f'k = {k}', markersize=4)
-            
-            ax.set_xlabel('Fracción Mejorable (f)', fontsize=12)
-            ax.set_ylabel('Aceleración (A)', fontsize=12)
-            ax.set_title('Ley de Amdahl: Aceleración vs Fracción Mejorable', 
-                        fontsize=14, fontweight='bold')
-            ax.grid(True, alpha=0.3)
-            ax.legend(fontsize=11)
-            ax.axhline(y=1, color='red', linestyle='--', alpha=0.5)
+            curvas = self.curvas.generar_curvas_aceleracion(k_values, f_values, eje='f')
+            
+            grafico = self.obtener_grafico()
+            grafico.preparar("a_vs_f", lambda ax: self.configurar_ejes(
+                ax, 'Fracción Mejorable (f)', 'Ley de Amdahl: Aceleración vs Fracción Mejorable'
+            ))
+            grafico.actualizar_curvas(
+                f_values, curvas, [f'k = {k}' for k in k_values], marker='s'
+            )
+            self.eje_x_grafico = f_values
+            self.actualizar_vista_previa()
             
             # Mostrar en interfaz
-            self.mostrar_grafico_en_interfaz(fig)
+            self.mostrar_pestana_graficos()
             
             self.actualizar_estado("✅ Gráfico A vs f generado")
             
@@ -720,14 +750,17 @@ La Ley de Amdahl es fundamental para:
             # Obtener componentes
             componentes = self.cargar_componentes.execute()
             
-            # Crear figura
-            fig, ax = plt.subplots(figsize=(12, 6))
-            
             nombres = [comp.nombre for comp in componentes]
             aceleraciones = [self.calculador.calcular_aceleracion(comp) for comp in componentes]
             
+            # Las barras no se reutilizan: se rehacen los ejes, no el lienzo
+            grafico = self.obtener_grafico()
+            grafico.tipo = None
+            grafico.preparar("comparacion", lambda ax: None)
+            ax = grafico.ejes
+            
             # Crear gráfico de barras
-            colores = plt.cm.viridis(np.linspace(0, 1, len(nombres)))
+            colores = matplotlib.colormaps['viridis'](np.linspace(0, 1, len(nombres)))
             barras = ax.bar(nombres, aceleraciones, color=colores, alpha=0.8)
             
             # Añadir valores sobre las barras
@@ -740,35 +773,86 @@ La Ley de Amdahl es fundamental para:
             ax.set_ylabel('Aceleración', fontsize=12)
             ax.set_title('Comparación de Aceleraciones por Componente GPU', 
                         fontsize=14, fontweight='bold')
-            plt.xticks(rotation=45, ha='right')
+            ax.tick_params(axis='x', labelrotation=45)
+            for etiqueta in ax.get_xticklabels():
+                etiqueta.set_horizontalalignment('right')
             ax.grid(True, alpha=0.3, axis='y')
             
+            self.eje_x_grafico = None
+            grafico.redibujar()
+            
             # Mostrar en interfaz
-            self.mostrar_grafico_en_interfaz(fig)
+            self.mostrar_pestana_graficos()
             
             self.actualizar_estado("✅ Comparación de componentes generada")
             
         except Exception as e:
             self.mostrar_error(f"Error al generar comparación: {e}")
     
-    def mostrar_grafico_en_interfaz(self, fig):
+    def actualizar_vista_previa(self, evento=None):
+        """Dibuja en vivo la curva del componente personalizado mientras se escribe"""
+        if self.grafico is None or self.eje_x_grafico is None:
+            return
+        
         try:
-            # Limpiar frame de gráfico
-            for widget in self.frame_grafico.winfo_children():
-                widget.destroy()
-            
-            # Crear canvas para matplotlib
-            canvas = FigureCanvasTkAgg(fig, self.frame_grafico)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True)
-            
-            # Cambiar a pestaña de gráficos
-            self.notebook.set("📈 Gráficos")
-            
-            plt.close(fig)  # Cerrar figura para liberar memoria
-            
-        except Exception as e:
-            self.mostrar_error(f"Error al mostrar gráfico: {e}")
+            f = float(self.entry_porcentaje.get().strip()) / 100
+        except ValueError:
+            f = None
+        try:
+            k = float(self.entry_factor.get().strip())
+        except ValueError:
+            k = None
+        
+        x = self.eje_x_grafico
+        if self.grafico.tipo == "a_vs_k" and f is not None:
+            curva = self.calculador.calcular_lote(f, x, decimales=None)
+            punto = self.calculador.calcular_lote(f, k, decimales=None) if k is not None else None
+            etiqueta = f'f = {f:.2f} (personalizado)'
+        elif self.grafico.tipo == "a_vs_f" and k is not None:
+            curva = self.calculador.calcular_lote(x, k, decimales=None)
+            punto = self.calculador.calcular_lote(f, k, decimales=None) if f is not None else None
+            etiqueta = f'k = {k:g} (personalizado)'
+        else:
+            self.grafico.ocultar_animadas()
+            return
+        
+        if not curva.validos.any():
+            self.grafico.ocultar_animadas()
+            return
+        
+        self.grafico.actualizar_animada(
+            "curva", x[curva.validos], curva.aceleracion[curva.validos],
+            color='orange', linestyle='--', linewidth=2, label=etiqueta
+        )
+        if punto is not None and punto.validos.item():
+            x_punto = k if self.grafico.tipo == "a_vs_k" else f
+            self.grafico.actualizar_animada(
+                "punto", [x_punto], [punto.aceleracion.item()],
+                color='orange', marker='*', markersize=14, linestyle='none'
+            )
+        elif "punto" in self.grafico.animadas:
+            self.grafico.actualizar_animada("punto", [], [])
+    
+    def obtener_grafico(self) -> GraficoInteractivo:
+        # El lienzo se crea una sola vez y reemplaza al texto inicial
+        if self.grafico is None:
+            from .grafico_interactivo import GraficoInteractivo
+            
+            self.label_grafico.destroy()
+            self.grafico = GraficoInteractivo(self.frame_grafico)
+            self.grafico.widget.pack(fill="both", expand=True)
+        return self.grafico
+    
+    def configurar_ejes(self, ax, xlabel: str, titulo: str):
+        ax.set_xlabel(xlabel, fontsize=12)
+        ax.set_ylabel('Aceleración (A)', fontsize=12)
+        ax.set_title(titulo, fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.axhline(y=1, color='red', linestyle='--', alpha=0.5)
+    
+    def mostrar_pestana_graficos(self):
+        # Cambiar a pestaña de gráficos
+        self.notebook.set("📈 Gráficos")
     
     def mostrar_error(self, mensaje: str):
         messagebox.showerror("Error", mensaje)
@@ -0,0 +1,386 @@
+"""
+Servicio HTTP/JSON local (asyncio, solo biblioteca estándar) que agrupa
+solicitudes concurrentes en micro-lotes para el calculador vectorizado
+"""
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+from ..domain.entities import ComponenteGPU, ResultadoAmdahl
+from ..application.use_cases import (
+    AnalizarComponentesUseCase,
+    CalcularAceleracionUseCase,
+    CalcularTiempoOptimizadoUseCase
+)
+from ..importacion_diferida import importar_diferido
+
+
+np = importar_diferido("numpy")
+
+
+TAMANO_MAXIMO_CUERPO = 1024 * 1024
+
+
+class AgrupadorSolicitudes:
+    """
+    Junta elementos que llegan de corrutinas concurrentes y los procesa en
+    una sola llamada a `procesar` (lista → lista de resultados alineados).
+    
+    El primer elemento abre un lote, que se despacha al juntar `max_lote`
+    elementos o al cumplirse `max_espera` segundos, lo que ocurra primero.
+    Todo corre en el bucle de eventos, por lo que no necesita locks.
+    """
+    
+    def __init__(
+        self,
+        procesar: Callable[[List[Any]], List[Any]],
+        max_lote: int = 256,
+        max_espera: float = 0.002
+    ):
+        if max_lote <= 0:
+            raise ValueError("El tamaño máximo de lote debe ser mayor a 0")
+        if max_espera < 0:
+            raise ValueError("La espera máxima no puede ser negativa")
+        self.procesar = procesar
+        self.max_lote = max_lote
+        self.max_espera = max_espera
+        self.lotes = 0
+        self.elementos = 0
+        self._pendientes: List[Tuple[Any, asyncio.Future]] = []
+        self._hay_pendientes: Optional[asyncio.Event] = None
+        self._lote_lleno: Optional[asyncio.Event] = None
+        self._tarea: Optional[asyncio.Task] = None
+    
+    async def enviar(self, elemento: Any) -> Any:
+        if self._tarea is None:
+            self._hay_pendientes = asyncio.Event()
+            self._lote_lleno = asyncio.Event()
+            self._tarea = asyncio.create_task(self._despachar())
+        
+        futuro = asyncio.get_running_loop().create_future()
+        self._pendientes.append((elemento, futuro))
+        self._hay_pendientes.set()
+        if len(self._pendientes) >= self.max_lote:
+            self._lote_lleno.set()
+        return await futuro
+    
+    def resumen(self) -> Dict[str, Any]:
+        return {
+            "lotes": self.lotes,
+            "elementos": self.elementos,
+            "tamano_medio": self.elementos / self.lotes if self.lotes else 0.0,
+        }
+    
+    async def cerrar(self) -> None:
+        if self._tarea is not None:
+            self._tarea.cancel()
+            try:
+                await self._tarea
+            except asyncio.CancelledError:
+                pass
+            self._tarea = None
+    
+    async def _despachar(self) -> None:
+        while True:
+            await self._hay_pendientes.wait()
+            if len(self._pendientes) < self.max_lote and self.max_espera > 0:
+                try:
+                    await asyncio.wait_for(self._lote_lleno.wait(), self.max_espera)
+                except asyncio.TimeoutError:
+                    pass
+            
+            lote = self._pendientes[:self.max_lote]
+            del self._pendientes[:self.max_lote]
+            if len(self._pendientes) < self.max_lote:
+                self._lote_lleno.clear()
+            if not self._pendientes:
+                self._hay_pendientes.clear()
+            
+            self._resolver(lote)
+    
+    def _resolver(self, lote: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            resultados = self.procesar([elemento for elemento, _ in lote])
+        except Exception as error:
+            for _, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(error)
+            return
+        
+        self.lotes += 1
+        self.elementos += len(lote)
+        for (_, futuro), resultado in zip(lote, resultados):
+            if not futuro.done():  # El cliente pudo haberse desconectado
+                futuro.set_result(resultado)
+
+
+class MetricasLatencia:
+    # Ventana de las últimas `muestras` latencias (segundos) de una ruta
+    
+    def __init__(self, muestras: int = 10_000):
+        self.solicitudes = 0
+        self._latencias: Deque[float] = deque(maxlen=muestras)
+    
+    def registrar(self, segundos: float) -> None:
+        self.solicitudes += 1
+        self._latencias.append(segundos)
+    
+    def resumen(self) -> Dict[str, Any]:
+        if not self._latencias:
+            return {"solicitudes": self.solicitudes, "p50_ms": None, "p99_ms": None}
+        p50, p99 = np.percentile(np.fromiter(self._latencias, dtype=np.float64), [50, 99])
+        return {
+            "solicitudes": self.solicitudes,
+            "p50_ms": round(p50 * 1000, 3),
+            "p99_ms": round(p99 * 1000, 3),
+        }
+
+
+class ServidorAmdahl:
+    """
+    Expone los casos de uso por HTTP/JSON:
+    
+    - POST /aceleracion  {"nombre", "f", "k"}                    (micro-lotes)
+    - POST /tiempo       {"nombre", "f", "k", "tiempo_original"}  (micro-lotes)
+    - POST /analisis     {"componentes": [...], "max_comparaciones"}
+    - GET  /metricas     latencias p50/p99 por ruta y tamaño de los lotes
+    
+    Los números de entrada deben ser finitos (400 si no). En las respuestas,
+    los valores no finitos (p. ej. el límite teórico con f = 1) van como null.
+    """
+    
+    def __init__(
+        self,
+        calcular_aceleracion: CalcularAceleracionUseCase,
+        calcular_tiempo: CalcularTiempoOptimizadoUseCase,
+        analizar_componentes: AnalizarComponentesUseCase,
+        max_lote: int = 256,
+        max_espera_ms: float = 2.0
+    ):
+        self.analizar_componentes = analizar_componentes
+        self.agrupadores = {
+            "aceleracion": AgrupadorSolicitudes(
+                calcular_aceleracion.execute_lote, max_lote, max_espera_ms / 1000
+            ),
+            "tiempo": AgrupadorSolicitudes(
+                lambda pares: calcular_tiempo.execute_lote(
+                    [componente for componente, _ in pares],
+                    [tiempo for _, tiempo in pares]
+                ),
+                max_lote, max_espera_ms / 1000
+            ),
+        }
+        self.metricas: Dict[str, MetricasLatencia] = {}
+        self.rutas: Dict[Tuple[str, str], Callable[[Any], Awaitable[Any]]] = {
+            ("POST", "/aceleracion"): self._aceleracion,
+            ("POST", "/tiempo"): self._tiempo,
+            ("POST", "/analisis"): self._analisis,
+            ("GET", "/metricas"): self._metricas,
+        }
+    
+    async def iniciar(self, host: str = "127.0.0.1", puerto: int = 8080) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self._atender_conexion, host, puerto)
+    
+    async def servir(self, host: str = "127.0.0.1", puerto: int = 8080) -> None:
+        servidor = await self.iniciar(host, puerto)
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            await self.cerrar()
+    
+    async def cerrar(self) -> None:
+        for agrupador in self.agrupadores.values():
+            await agrupador.cerrar()
+    
+    async def _atender_conexion(
+        self,
+        lector: asyncio.StreamReader,
+        escritor: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    solicitud = await _leer_solicitud(lector)
+                except ValueError as error:
+                    escritor.write(_respuesta_http(400, {"error": str(error)}, False))
+                    await escritor.drain()
+                    break
+                if solicitud is None:
+                    break
+                
+                metodo, ruta, cuerpo, mantener = solicitud
+                inicio = time.perf_counter()
+                estado, contenido = await self._despachar(metodo, ruta, cuerpo)
+                escritor.write(_respuesta_http(estado, contenido, mantener))
+                await escritor.drain()
+                self.metricas.setdefault(ruta, MetricasLatencia()).registrar(
+                    time.perf_counter() - inicio
+                )
+                
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+    
+    async def _despachar(self, metodo: str, ruta: str, cuerpo: bytes) -> Tuple[int, Any]:
+        manejador = self.rutas.get((metodo, ruta))
+        if manejador is None:
+            if any(r == ruta for _, r in self.rutas):
+                return 405, {"error": f"Método {metodo} no permitido en {ruta}"}
+            return 404, {"error": f"Ruta no encontrada: {ruta}"}
+        
+        try:
+            datos = json.loads(cuerpo) if cuerpo else {}
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return 400, {"error": "El cuerpo debe ser JSON válido"}
+        
+        try:
+            return 200, await manejador(datos)
+        except KeyError as error:
+            return 400, {"error": f"Falta el campo {error}"}
+        except (ValueError, TypeError) as error:
+            return 400, {"error": str(error)}
+        except Exception as error:
+            # Cualquier otro error igual responde, sin cortar la conexión
+            return 500, {"error": f"Error interno: {type(error).__name__}"}
+    
+    async def _aceleracion(self, datos: Dict[str, Any]) -> Dict[str, Any]:
+        resultado = await self.agrupadores["aceleracion"].enviar(_componente(datos))
+        return _resultado_json(resultado)
+    
+    async def _tiempo(self, datos: Dict[str, Any]) -> Dict[str, Any]:
+        par = (_componente(datos), _numero(datos, "tiempo_original"))
+        resultado = await self.agrupadores["tiempo"].enviar(par)
+        return _resultado_json(resultado)
+    
+    async def _analisis(self, datos: Dict[str, Any]) -> Dict[str, Any]:
+        componentes = [_componente(c) for c in datos["componentes"]]
+        max_comparaciones = datos.get("max_comparaciones")
+        if max_comparaciones is not None:
+            max_comparaciones = _numero(datos, "max_comparaciones")
+            if max_comparaciones != int(max_comparaciones):
+                raise ValueError("'max_comparaciones' debe ser un entero")
+            max_comparaciones = int(max_comparaciones)
+        
+        # El análisis y la justificación completa no bloquean el bucle de eventos
+        # (ni los micro-lotes en curso): se calculan en el pool de hilos por defecto
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._analizar, componentes, max_comparaciones
+        )
+    
+    def _analizar(
+        self, 
+        componentes: List[ComponenteGPU], 
+        max_comparaciones: Optional[int]
+    ) -> Dict[str, Any]:
+        analisis = self.analizar_componentes.determinar_mejor_optimizacion(componentes)
+        mejor = analisis.mejor_componente
+        return {
+            "mejor_componente": mejor.nombre if mejor else None,
+            "ranking": [
+                {"nombre": nombre, "aceleracion": aceleracion}
+                for nombre, aceleracion in analisis.obtener_ranking()
+            ],
+            "justificacion": (
+                analisis.justificacion if max_comparaciones is None
+                else analisis.resumir_justificacion(max_comparaciones)
+            ),
+        }
+    
+    async def _metricas(self, datos: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "rutas": {ruta: m.resumen() for ruta, m in self.metricas.items()},
+            "lotes": {nombre: a.resumen() for nombre, a in self.agrupadores.items()},
+        }
+
+
+def _componente(datos: Dict[str, Any]) -> ComponenteGPU:
+    if not isinstance(datos, dict):
+        raise ValueError("Cada componente debe ser un objeto JSON")
+    return ComponenteGPU(
+        str(datos.get("nombre", "")),
+        _numero(datos, "f"),
+        _numero(datos, "k")
+    )
+
+
+def _numero(datos: Dict[str, Any], campo: str) -> float:
+    # json.loads acepta Infinity/NaN y 1e400 → inf: se rechazan como entrada
+    valor = float(datos[campo])
+    if not math.isfinite(valor):
+        raise ValueError(f"'{campo}' debe ser un número finito")
+    return valor
+
+
+def _resultado_json(resultado: ResultadoAmdahl) -> Dict[str, Any]:
+    datos = {
+        "nombre": resultado.componente.nombre,
+        "f": resultado.componente.porcentaje_mejora,
+        "k": resultado.componente.factor_mejora,
+        "aceleracion": resultado.aceleracion,
+        "limite_teorico": resultado.limite_teorico,
+    }
+    if resultado.tiempo_original is not None:
+        datos["tiempo_original"] = resultado.tiempo_original
+        datos["tiempo_optimizado"] = resultado.tiempo_optimizado
+    return datos
+
+
+async def _leer_solicitud(
+    lector: asyncio.StreamReader
+) -> Optional[Tuple[str, str, bytes, bool]]:
+    # (método, ruta, cuerpo, mantener conexión); None si el cliente cerró
+    linea = await lector.readline()
+    if not linea:
+        return None
+    
+    partes = linea.decode("latin-1").split()
+    if len(partes) != 3:
+        raise ValueError("Línea de solicitud HTTP inválida")
+    metodo, destino, version = partes
+    
+    encabezados = {}
+    while True:
+        linea = await lector.readline()
+        if linea in (b"\r\n", b"\n", b""):
+            break
+        nombre, _, valor = linea.decode("latin-1").partition(":")
+        encabezados[nombre.strip().lower()] = valor.strip()
+    
+    largo = int(encabezados.get("content-length", 0) or 0)
+    if largo > TAMANO_MAXIMO_CUERPO:
+        raise ValueError("Cuerpo de la solicitud demasiado grande")
+    cuerpo = await lector.readexactly(largo) if largo else b""
+    
+    conexion = encabezados.get("connection", "").lower()
+    mantener = conexion != "close" if version == "HTTP/1.1" else conexion == "keep-alive"
+    return metodo.upper(), urlsplit(destino).path, cuerpo, mantener
+
+
+def _respuesta_http(estado: int, contenido: Any, mantener: bool) -> bytes:
+    cuerpo = json.dumps(_json_seguro(contenido), ensure_ascii=False).encode("utf-8")
+    encabezado = (
+        f"HTTP/1.1 {estado} {HTTPStatus(estado).phrase}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(cuerpo)}\r\n"
+        f"Connection: {'keep-alive' if mantener else 'close'}\r\n\r\n"
+    )
+    return encabezado.encode("latin-1") + cuerpo
+
+
+def _json_seguro(valor: Any) -> Any:
+    # JSON estándar no admite NaN/inf: van como null
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+    if isinstance(valor, dict):
+        return {clave: _json_seguro(v) for clave, v in valor.items()}
+    if isinstance(valor, list):
+        return [_json_seguro(v) for v in valor]
+    return valor
@@ -0,0 +1,50 @@
+"""
+AnalisisComparativo: justificación redactada recién al leerla
+"""
+import dataclasses
+import pytest
+from src.domain.entities import AnalisisComparativo, ComponenteGPU
+from src.infrastructure.analizador_componentes import AnalizadorComponentes
+from src.infrastructure.calculador_amdahl import CalculadorAmdahl
+
+
+COMPONENTES = [
+    ComponenteGPU("cuda", 0.35, 5), ComponenteGPU("vram", 0.2, 3), ComponenteGPU("nvlink", 0.2, 10)
+]
+
+
+def test_la_justificacion_se_redacta_una_sola_vez_al_leerla():
+    llamadas = []
+    
+    def redactor(max_comparaciones):
+        llamadas.append(max_comparaciones)
+        yield "línea 1\n"
+        yield "línea 2\n"
+    
+    analisis = AnalisisComparativo([], None, redactor=redactor)
+    assert llamadas == []
+    assert analisis.justificacion == "línea 1\nlínea 2\n"
+    assert analisis.justificacion == "línea 1\nlínea 2\n"
+    assert llamadas == [None]
+
+
+def test_texto_explicito_como_tercer_argumento():
+    analisis = AnalisisComparativo([], None, "texto")
+    assert analisis.justificacion == "texto"
+    assert analisis.resumir_justificacion(1) == "texto"
+    assert dataclasses.replace(analisis, _justificacion="otro").justificacion == "otro"
+    with pytest.raises(ValueError, match="justificación o un redactor"):
+        AnalisisComparativo([], None)
+
+
+def test_resumen_del_analizador_coincide_con_el_comienzo_del_reporte():
+    analisis = AnalizadorComponentes(CalculadorAmdahl()).determinar_mejor_componente(COMPONENTES)
+    
+    assert analisis.mejor_componente.nombre == "cuda"
+    assert "cuda" in analisis.justificacion
+    resumen = analisis.resumir_justificacion(1)
+    assert analisis.justificacion.startswith(resumen)
+    assert resumen.count("(diferencia:") == 1 and analisis.justificacion.count("(diferencia:") == 2
+    assert [f.name for f in dataclasses.fields(analisis)] == [
+        "resultados", "mejor_componente", "_justificacion", "redactor"
+    ]
@@ -0,0 +1,63 @@
+"""
+Lectura y escritura en streaming de inventarios (comando `lote`)
+"""
+import io
+import json
+import pytest
+from src.infrastructure.archivos_componentes import (
+    EscritorResultados,
+    detectar_formato,
+    leer_bloques
+)
+from src.infrastructure.calculador_amdahl import CalculadorAmdahl
+from src.presentation.cli import main
+
+
+def test_detectar_formato_por_extension_y_para_stdio():
+    assert detectar_formato("inventario.CSV") == "csv"
+    assert detectar_formato("inventario.ndjson") == "jsonl"
+    assert detectar_formato("-", predeterminado="jsonl") == "jsonl"
+    assert detectar_formato("-", "csv", predeterminado="jsonl") == "csv"
+    with pytest.raises(ValueError, match="Formato no soportado"):
+        detectar_formato("-")
+
+
+def test_bloques_csv_con_valores_invalidos_y_filas_cortas():
+    archivo = io.StringIO("name,k,f\na,5,0.35\nb,x,0.2\nc\n\nd,2,0.5\n")
+    bloques = list(leer_bloques(archivo, "csv", tamano_bloque=2))
+    
+    assert [len(b) for b in bloques] == [2, 2]
+    assert [n for b in bloques for n in b.nombres] == ["a", "b", "c", "d"]
+    resultado = CalculadorAmdahl().calcular_lote(
+        bloques[0].porcentajes_mejora, bloques[0].factores_mejora
+    )
+    assert resultado.validos.tolist() == [True, False]  # k='x' → NaN
+
+
+def test_jsonl_con_una_linea_que_no_es_objeto_informa_el_numero_de_linea():
+    archivo = io.StringIO('{"nombre": "a", "f": 0.5, "k": 2}\n\n5\n')
+    with pytest.raises(ValueError, match="Línea 3"):
+        list(leer_bloques(archivo, "jsonl"))
+
+
+def test_escritor_jsonl_escribe_nan_como_null():
+    bloque = next(leer_bloques(io.StringIO("nombre,f,k\na,0.5,2\nb,2,3\n"), "csv"))
+    resultado = CalculadorAmdahl().calcular_lote(bloque.porcentajes_mejora, bloque.factores_mejora)
+    salida = io.StringIO()
+    EscritorResultados(salida, "jsonl").escribir(bloque, resultado)
+    
+    filas = [json.loads(l) for l in salida.getvalue().splitlines()]
+    assert filas[0] == {
+        "nombre": "a", "f": 0.5, "k": 2.0, "aceleracion": 1.3333, "limite_teorico": 2.0, "valido": True
+    }
+    assert filas[1]["aceleracion"] is None and filas[1]["valido"] is False
+
+
+def test_lote_a_stdout_usa_el_formato_de_la_entrada(tmp_path, capsys):
+    entrada = tmp_path / "inventario.jsonl"
+    entrada.write_text('{"nombre": "a", "f": 0.5, "k": 2}\n', encoding="utf-8")
+    main(["lote", str(entrada), "-"])
+    
+    captura = capsys.readouterr()
+    assert json.loads(captura.out)["aceleracion"] == 1.3333
+    assert "1 filas procesadas" in captura.err  # El resumen no se mezcla con los datos
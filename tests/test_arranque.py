@@ -0,0 +1,30 @@
+"""
+Arranque: los puntos de entrada no cargan dependencias pesadas ni módulos opcionales
+"""
+import importlib.util
+import pytest
+from benchmarks.arranque import ESCENARIOS, medir
+from src.domain import entities
+
+
+@pytest.mark.parametrize(
+    "escenario",
+    [
+        e for e in ESCENARIOS
+        if all(importlib.util.find_spec(m) is not None for m in e.requiere)
+    ],
+    ids=lambda e: e.nombre
+)
+def test_escenario_no_carga_modulos_prohibidos(escenario):
+    # El tiempo se controla con `python -m benchmarks.arranque`; aquí solo lo determinista
+    assert medir(escenario, repeticiones=1)["pesados_cargados"] == []
+
+
+def test_entidades_diferidas_se_reexportan_desde_entities():
+    from src.domain.entidades_multi_gpu import Interconexion
+    from src.domain.entities import Interconexion as Reexportada
+    
+    assert Reexportada is Interconexion
+    assert "ComponenteIncierto" in dir(entities)
+    with pytest.raises(AttributeError):
+        entities.NoExiste
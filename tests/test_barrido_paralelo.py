@@ -0,0 +1,56 @@
+"""
+Barrido f × k por teselas: equivalencia con un único lote y cierre de recursos
+"""
+import numpy as np
+import pytest
+from src.domain.entities import ComponenteGPU, DefinicionBarrido
+from src.infrastructure import barrido_paralelo
+from src.infrastructure.barrido_paralelo import EjecutorBarridoParalelo
+from src.infrastructure.calculador_amdahl import CalculadorAmdahl
+
+
+F = np.linspace(0.0, 0.6, 37)
+K = np.linspace(0.5, 40.0, 53)  # Incluye k <= 1: puntos inválidos
+
+
+@pytest.mark.parametrize("procesos", [1, 2])
+def test_teselas_coinciden_con_un_unico_lote(procesos, tmp_path):
+    base = [ComponenteGPU("vram", 0.2, 3)]
+    definicion = DefinicionBarrido(
+        F, K, componentes_base=base, umbrales=[1.5, 2.0], archivo_salida=str(tmp_path / "g.npy")
+    )
+    resultado = EjecutorBarridoParalelo(CalculadorAmdahl(), procesos, tesela=(8, 16)).ejecutar(
+        definicion
+    )
+    
+    f = np.stack(np.broadcast_arrays(F[:, None], 0.2), axis=-1)
+    k = np.stack(np.broadcast_arrays(K[None, :], 3.0), axis=-1)
+    esperado = CalculadorAmdahl().calcular_lote_combinado(f, k, decimales=None)
+    comparables = np.where(esperado.validos, esperado.aceleracion, -np.inf)
+    
+    assert resultado.puntos_validos == int(esperado.validos.sum())
+    assert resultado.aceleracion_maxima == comparables.max()
+    assert resultado.indice_maximo == np.unravel_index(comparables.argmax(), comparables.shape)
+    assert resultado.conteos_umbral == {
+        u: int((comparables >= u).sum()) for u in (1.5, 2.0)
+    }
+    np.testing.assert_array_equal(resultado.aceleraciones, esperado.aceleracion)
+
+
+def test_un_proceso_cierra_la_memoria_compartida_si_falla_una_tesela(monkeypatch):
+    cerrados = []
+    cerrar = barrido_paralelo._ContextoBarrido.cerrar
+    
+    def cerrar_registrando(contexto):
+        cerrados.append(contexto)
+        cerrar(contexto)
+    
+    class CalculadorQueFalla(CalculadorAmdahl):
+        def calcular_lote(self, *args, **kwargs):
+            raise RuntimeError("falla en la tesela")
+    
+    monkeypatch.setattr(barrido_paralelo._ContextoBarrido, "cerrar", cerrar_registrando)
+    ejecutor = EjecutorBarridoParalelo(CalculadorQueFalla(), procesos=1, tesela=(8, 8))
+    with pytest.raises(RuntimeError, match="falla en la tesela"):
+        ejecutor.ejecutar(DefinicionBarrido(F, K, materializar=True))
+    assert len(cerrados) == 1 and cerrados[0].memoria is not None
@@ -0,0 +1,73 @@
+"""
+API de lote de ICalculadorAmdahl: CalculadorAmdahl y la implementación por defecto
+"""
+import numpy as np
+import pytest
+from src.domain.entities import ComponenteGPU, ICalculadorAmdahl
+from src.infrastructure.calculador_amdahl import CalculadorAmdahl
+
+
+class CalculadorSoloEscalar(ICalculadorAmdahl):
+    # Un calculador de terceros que solo implementa la API escalar original
+    
+    def calcular_aceleracion(self, componente):
+        f, k = componente.porcentaje_mejora, componente.factor_mejora
+        return round(1 / ((1 - f) + f / k), 4)
+    
+    def calcular_limite_teorico(self, componente):
+        return round(1 / (1 - componente.porcentaje_mejora), 4)
+    
+    def calcular_tiempo_optimizado(self, tiempo_original, aceleracion):
+        return round(tiempo_original / aceleracion, 4)
+
+
+F = [0.0, 0.35, 0.2, 1.0, -0.1, 0.5]
+K = [5.0, 5.0, 3.0, 10.0, 4.0, 1.0]
+VALIDOS = [True, True, True, True, False, False]
+
+
+@pytest.mark.parametrize("calculador", [CalculadorAmdahl(), CalculadorSoloEscalar()])
+def test_lote_coincide_con_la_api_escalar(calculador):
+    resultado = calculador.calcular_lote(F, K, tiempo_original=50.0)
+    
+    assert resultado.validos.tolist() == VALIDOS
+    assert np.isnan(resultado.aceleracion[~resultado.validos]).all()
+    for i in np.flatnonzero(resultado.validos):
+        componente = ComponenteGPU("c", F[i], K[i])
+        assert resultado.aceleracion[i] == calculador.calcular_aceleracion(componente)
+        exacta = 1 / ((1 - F[i]) + F[i] / K[i])
+        assert resultado.tiempo_optimizado[i] == pytest.approx(50.0 / exacta, rel=1e-4)
+    assert resultado.limite_teorico[3] == np.inf  # f = 1: no hay parte no mejorable
+
+
+def test_lote_hace_broadcasting_entre_f_y_k():
+    f = np.array([[0.1], [0.5], [0.9]])
+    k = np.array([2.0, 4.0, 8.0, 16.0])
+    resultado = CalculadorAmdahl().calcular_lote(f, k, decimales=None)
+    
+    assert resultado.aceleracion.shape == (3, 4)
+    assert resultado.aceleracion == pytest.approx(1 / ((1 - f) + f / k))
+    # Monótona en k para cada f, y acotada por el límite teórico
+    assert (np.diff(resultado.aceleracion, axis=1) > 0).all()
+    assert (resultado.aceleracion < resultado.limite_teorico).all()
+
+
+def test_lote_redondea_solo_si_se_pide():
+    calculador = CalculadorAmdahl()
+    exacto = calculador.calcular_lote([1 / 3], [7.0], decimales=None).aceleracion[0]
+    redondeado = calculador.calcular_lote([1 / 3], [7.0], decimales=2).aceleracion[0]
+    assert exacto == pytest.approx(21 / 15)
+    assert redondeado == round(exacto, 2)
+
+
+def test_combinado_por_defecto_coincide_con_el_vectorizado():
+    f = np.array([[0.35, 0.2, 0.0], [0.5, 0.5, 0.0], [0.6, 0.6, 0.0], [0.0, 0.0, 0.0]])
+    k = np.array([[5.0, 3.0, 1.0], [2.0, 10.0, 1.0], [2.0, 2.0, 1.0], [1.0, 1.0, 1.0]])
+    esperado = CalculadorAmdahl().calcular_lote_combinado(f, k)
+    obtenido = CalculadorSoloEscalar().calcular_lote_combinado(f, k)
+    
+    assert obtenido.validos.tolist() == [True, True, False, True]  # Σf > 1 en el tercero
+    assert obtenido.aceleracion[obtenido.validos] == pytest.approx(
+        esperado.aceleracion[esperado.validos], abs=1e-3
+    )
+    assert obtenido.limite_teorico[1] == np.inf
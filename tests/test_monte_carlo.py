@@ -0,0 +1,53 @@
+"""
+Monte Carlo: reproducibilidad con cualquier número de procesos y reparto de empates
+"""
+import numpy as np
+import pytest
+from src.domain.entities import ComponenteGPU, ComponenteIncierto, DistribucionParametro
+from src.infrastructure.calculador_amdahl import CalculadorAmdahl
+from src.infrastructure.simulador_monte_carlo import SimuladorMonteCarlo
+
+
+INCIERTOS = [
+    ComponenteIncierto.desde_componente(ComponenteGPU("cuda", 0.35, 5), 0.05, 1.0),
+    ComponenteIncierto(
+        "vram", DistribucionParametro.uniforme(0.1, 0.3), DistribucionParametro.fija(3)
+    ),
+]
+
+
+@pytest.mark.parametrize("procesos", [1, 2])
+def test_misma_semilla_mismas_muestras_con_cualquier_numero_de_procesos(procesos):
+    # Varias tareas (muestras_por_tarea < muestras) para que el pool reparta trabajo
+    referencia = SimuladorMonteCarlo(CalculadorAmdahl(), procesos=1, muestras_por_tarea=1000)
+    simulador = SimuladorMonteCarlo(CalculadorAmdahl(), procesos, muestras_por_tarea=1000)
+    
+    esperado = referencia.muestrear_aceleraciones(INCIERTOS, 3500, semilla=7)
+    obtenido = simulador.muestrear_aceleraciones(INCIERTOS, 3500, semilla=7)
+    
+    np.testing.assert_array_equal(obtenido, esperado)
+    assert simulador.simular(INCIERTOS, 3500, semilla=7) == referencia.simular(
+        INCIERTOS, 3500, semilla=7
+    )
+
+
+def test_semillas_distintas_dan_muestras_distintas():
+    simulador = SimuladorMonteCarlo(CalculadorAmdahl(), procesos=1)
+    assert not np.array_equal(
+        simulador.muestrear_aceleraciones(INCIERTOS, 500, semilla=1),
+        simulador.muestrear_aceleraciones(INCIERTOS, 500, semilla=2)
+    )
+
+
+def test_empate_exacto_se_reparte_en_partes_iguales():
+    fijo = ComponenteGPU("a", 0.3, 4)
+    iguales = [
+        ComponenteIncierto.desde_componente(fijo),
+        ComponenteIncierto.desde_componente(ComponenteGPU("b", 0.3, 4)),
+        ComponenteIncierto.desde_componente(ComponenteGPU("peor", 0.1, 2)),
+    ]
+    resultados = SimuladorMonteCarlo(CalculadorAmdahl(), procesos=1).simular(
+        iguales, 1000, semilla=0
+    )
+    
+    assert [r.probabilidad_mejor for r in resultados] == [0.5, 0.5, 0.0]
@@ -0,0 +1,50 @@
+"""
+Modelo multi-GPU: óptimo en forma cerrada contra la grilla y ganancia mínima por defecto
+"""
+import numpy as np
+import pytest
+from src.domain.entities import Interconexion
+from src.domain.value_objects import ConfiguracionInterconexion
+from src.infrastructure.modelo_multi_gpu import ModeloMultiGPU
+
+
+F = np.array([0.0, 0.5, 0.9, 0.99, 0.999, 1.0])[:, None]
+MENSAJES = np.array([0.0, 1e6, 1e8, 1e9])[None, :]  # bytes
+TIEMPO_BASE = 50.0
+
+
+@pytest.mark.parametrize("interconexion", [Interconexion.tipo_nvlink(), Interconexion.tipo_pcie()])
+@pytest.mark.parametrize("max_dispositivos", [1, 8, 64])
+def test_optimo_cerrado_coincide_con_la_grilla(interconexion, max_dispositivos):
+    modelo = ModeloMultiGPU(interconexion)
+    optimos = modelo.calcular_dispositivos_optimos(
+        F, MENSAJES, TIEMPO_BASE, max_dispositivos, ganancia_minima=0.0
+    )
+    
+    # Mínimo tiempo recorriendo todos los N; argmin elige el menor N ante empates
+    n = np.arange(1, max_dispositivos + 1)
+    tiempos = modelo.calcular_lote(n, F[..., None], MENSAJES[..., None], TIEMPO_BASE).tiempo
+    esperado = n[np.argmin(tiempos, axis=-1)]
+    
+    np.testing.assert_array_equal(optimos.dispositivos, esperado)
+    np.testing.assert_allclose(optimos.tiempo, tiempos.min(axis=-1))
+
+
+def test_sin_latencia_el_optimo_cerrado_es_el_maximo_admitido():
+    modelo = ModeloMultiGPU(Interconexion("ideal", 1e6, 0.0))
+    optimos = modelo.calcular_dispositivos_optimos(0.9, 0.0, TIEMPO_BASE, 16, ganancia_minima=0.0)
+    assert int(optimos.dispositivos) == 16
+
+
+def test_ganancia_minima_por_defecto_es_la_configurada():
+    modelo = ModeloMultiGPU(Interconexion.tipo_pcie())
+    por_defecto = modelo.calcular_dispositivos_optimos(F, MENSAJES, TIEMPO_BASE)
+    explicito = modelo.calcular_dispositivos_optimos(
+        F, MENSAJES, TIEMPO_BASE, ganancia_minima=ConfiguracionInterconexion.GANANCIA_MINIMA
+    )
+    sin_umbral = modelo.calcular_dispositivos_optimos(F, MENSAJES, TIEMPO_BASE, ganancia_minima=0.0)
+    
+    np.testing.assert_array_equal(por_defecto.dispositivos, explicito.dispositivos)
+    # Exigir un 5% por GPU nunca pide más dispositivos que el óptimo sin umbral
+    assert (por_defecto.dispositivos <= sin_umbral.dispositivos).all()
+    assert (por_defecto.dispositivos < sin_umbral.dispositivos).any()
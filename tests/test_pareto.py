@@ -0,0 +1,88 @@
+"""
+indices_pareto contra una referencia O(n²) con empates, repetidos y NaN
+"""
+import numpy as np
+import pytest
+from src.domain.tablas import indices_pareto
+
+
+def _frontera_referencia(aceleraciones, costos, riesgos=None, validos=None):
+    # No dominado: nadie tiene A >= y costo (y riesgo) <=, siendo estrictamente mejor en algo
+    n = len(aceleraciones)
+    riesgos = np.zeros(n) if riesgos is None else riesgos
+    candidatos = [
+        i for i in range(n)
+        if not (np.isnan(aceleraciones[i]) or np.isnan(costos[i]) or np.isnan(riesgos[i]))
+        and (validos is None or validos[i])
+    ]
+    frontera = []
+    for i in candidatos:
+        dominado = any(
+            aceleraciones[j] >= aceleraciones[i] and costos[j] <= costos[i]
+            and riesgos[j] <= riesgos[i]
+            and (aceleraciones[j] > aceleraciones[i] or costos[j] < costos[i]
+                 or riesgos[j] < riesgos[i])
+            for j in candidatos
+        )
+        if not dominado:
+            frontera.append(i)
+    return frontera
+
+
+def _datos(generador, n, niveles, fraccion_nan=0.0):
+    # Pocos valores distintos: muchos empates y candidatos repetidos
+    datos = generador.integers(0, niveles, size=(3, n)).astype(np.float64)
+    if fraccion_nan:
+        datos[generador.random((3, n)) < fraccion_nan] = np.nan
+    return datos
+
+
+def _verificar(indices, aceleraciones, costos, riesgos=None, validos=None):
+    esperado = _frontera_referencia(aceleraciones, costos, riesgos, validos)
+    assert sorted(indices.tolist()) == esperado
+    # De menor a mayor costo
+    assert np.all(np.diff(costos[indices]) >= 0)
+
+
+@pytest.mark.parametrize("semilla", range(60))
+@pytest.mark.parametrize("con_riesgo", [False, True])
+def test_coincide_con_referencia(semilla, con_riesgo):
+    generador = np.random.default_rng(semilla)
+    n = int(generador.integers(1, 80))
+    aceleraciones, costos, riesgos = _datos(
+        generador, n, niveles=int(generador.integers(2, 8)), fraccion_nan=0.1
+    )
+    riesgos = riesgos if con_riesgo else None
+    _verificar(indices_pareto(aceleraciones, costos, riesgos), aceleraciones, costos, riesgos)
+
+
+@pytest.mark.parametrize("con_riesgo", [False, True])
+def test_mascara_de_validos(con_riesgo):
+    generador = np.random.default_rng(7)
+    aceleraciones, costos, riesgos = _datos(generador, 200, niveles=5)
+    riesgos = riesgos if con_riesgo else None
+    validos = generador.random(200) < 0.7
+    indices = indices_pareto(aceleraciones, costos, riesgos, validos)
+    _verificar(indices, aceleraciones, costos, riesgos, validos)
+
+
+@pytest.mark.parametrize("con_riesgo", [False, True])
+def test_repetidos_se_conservan_todos(con_riesgo):
+    aceleraciones = np.array([2.0, 2.0, 1.0, 3.0, 3.0])
+    costos = np.array([1.0, 1.0, 1.0, 5.0, 5.0])
+    riesgos = np.zeros(5) if con_riesgo else None
+    indices = indices_pareto(aceleraciones, costos, riesgos)
+    assert sorted(indices.tolist()) == [0, 1, 3, 4]
+
+
+def test_empate_en_riesgo_con_mas_costo_queda_dominado():
+    # Misma aceleración y riesgo, más caro: dominado
+    indices = indices_pareto([2.0, 2.0, 3.0], [1.0, 2.0, 3.0], [1.0, 1.0, 0.5])
+    assert indices.tolist() == [0, 2]
+
+
+@pytest.mark.parametrize("con_riesgo", [False, True])
+def test_sin_candidatos(con_riesgo):
+    riesgos = np.array([np.nan, 1.0]) if con_riesgo else None
+    assert indices_pareto([], [], [] if con_riesgo else None).size == 0
+    assert indices_pareto([np.nan, np.nan], [1.0, 2.0], riesgos).size == 0
@@ -0,0 +1,128 @@
+"""
+optimizar_presupuesto contra la búsqueda exhaustiva de todos los planes
+"""
+from itertools import product
+import numpy as np
+import pytest
+from src.domain.entities import (
+    ComponenteGPU,
+    IAnalizador,
+    IOptimizadorMejoras,
+    OpcionMejora,
+    PaqueteMejoras
+)
+from src.infrastructure.analizador_componentes import (
+    MAX_CELDAS_PRESUPUESTO,
+    AnalizadorComponentes
+)
+from src.infrastructure.calculador_amdahl import CalculadorAmdahl
+
+
+def _aceleracion(opciones):
+    ganancia = sum(
+        o.componente.porcentaje_mejora * (1 - 1 / o.componente.factor_mejora) for o in opciones
+    )
+    return 1 / (1 - ganancia)
+
+
+def _mejor_exhaustivo(grupos, presupuesto):
+    # Cada componente aporta ninguno o uno de sus niveles
+    mejor = 1.0
+    for eleccion in product(*[[None] + niveles for niveles in grupos]):
+        plan = [o for o in eleccion if o is not None]
+        if sum(o.costo for o in plan) <= presupuesto:
+            mejor = max(mejor, _aceleracion(plan))
+    return mejor
+
+
+def _opciones_aleatorias(generador):
+    cantidad = int(generador.integers(1, 5))
+    fracciones = generador.dirichlet(np.ones(cantidad + 1))[:cantidad]  # Suman menos de 1
+    grupos = []
+    for c, f in enumerate(fracciones.tolist()):
+        grupos.append([
+            OpcionMejora(
+                ComponenteGPU(f"c{c}", f, float(generador.uniform(1.1, 20))),
+                costo=float(generador.integers(0, 20))
+            )
+            for _ in range(int(generador.integers(1, 4)))
+        ])
+    return grupos
+
+
+@pytest.mark.parametrize("semilla", range(80))
+def test_coincide_con_busqueda_exhaustiva(semilla):
+    generador = np.random.default_rng(semilla)
+    grupos = _opciones_aleatorias(generador)
+    presupuesto = float(generador.integers(0, 40))
+    opciones = [o for niveles in grupos for o in niveles]
+    
+    plan = AnalizadorComponentes(CalculadorAmdahl()).optimizar_presupuesto(opciones, presupuesto)
+    
+    assert plan.costo_total <= presupuesto
+    assert len({o.componente.nombre for o in plan.opciones}) == len(plan.opciones)
+    assert _aceleracion(plan.opciones) == pytest.approx(_mejor_exhaustivo(grupos, presupuesto))
+
+
+def test_costos_fraccionarios_con_unidad():
+    # Con unidad 0.5 los costos se redondean hacia arriba: el plan no excede el presupuesto
+    opciones = [
+        OpcionMejora(ComponenteGPU("a", 0.4, 4), costo=1.2),
+        OpcionMejora(ComponenteGPU("b", 0.3, 3), costo=1.2),
+    ]
+    plan = AnalizadorComponentes(CalculadorAmdahl()).optimizar_presupuesto(
+        opciones, 2.4, unidad_costo=0.5
+    )
+    assert plan.costo_total <= 2.4
+    assert [o.componente.nombre for o in plan.opciones] == ["a"]
+
+
+def test_presupuesto_demasiado_fino_pide_unidad_mas_gruesa():
+    opciones = [OpcionMejora(ComponenteGPU("a", 0.4, 4), costo=1e6)]
+    analizador = AnalizadorComponentes(CalculadorAmdahl())
+    with pytest.raises(ValueError, match="unidad_costo más gruesa"):
+        analizador.optimizar_presupuesto(opciones, float(MAX_CELDAS_PRESUPUESTO))
+    plan = analizador.optimizar_presupuesto(
+        opciones, float(MAX_CELDAS_PRESUPUESTO), unidad_costo=1000.0
+    )
+    assert [o.componente.nombre for o in plan.opciones] == ["a"]
+
+
+@pytest.mark.parametrize("presupuesto", [-1.0, float("inf"), float("nan")])
+def test_presupuesto_invalido(presupuesto):
+    opciones = [OpcionMejora(ComponenteGPU("a", 0.4, 4), costo=1.0)]
+    with pytest.raises(ValueError):
+        AnalizadorComponentes(CalculadorAmdahl()).optimizar_presupuesto(opciones, presupuesto)
+
+
+def test_analizador_de_terceros_sigue_siendo_instanciable():
+    # IAnalizador conserva solo sus métodos originales como abstractos
+    class AnalizadorMinimo(IAnalizador):
+        def determinar_mejor_componente(self, componentes, escalamiento=0.0):
+            return None
+        
+        def analizar_ultimos_tres(self, componentes):
+            return None
+    
+    assert not isinstance(AnalizadorMinimo(), IOptimizadorMejoras)
+    assert isinstance(AnalizadorComponentes(CalculadorAmdahl()), IOptimizadorMejoras)
+
+
+def test_rankear_paquetes_ordena_por_aceleracion_combinada():
+    calculador = CalculadorAmdahl()
+    cuda, vram, nvlink = (
+        ComponenteGPU("cuda", 0.35, 5), ComponenteGPU("vram", 0.2, 3), ComponenteGPU("nvlink", 0.2, 10)
+    )
+    paquetes = [
+        PaqueteMejoras("vram", [vram]),
+        PaqueteMejoras("cuda + vram + nvlink", [cuda, vram, nvlink]),
+        PaqueteMejoras("cuda + nvlink", [cuda, nvlink]),
+    ]
+    ranking = AnalizadorComponentes(calculador).rankear_paquetes(paquetes)
+    
+    assert [r.paquete.nombre for r in ranking] == ["cuda + vram + nvlink", "cuda + nvlink", "vram"]
+    for resultado in ranking:
+        assert resultado.aceleracion == pytest.approx(
+            calculador.calcular_aceleracion_combinada(resultado.paquete), abs=1e-4
+        )
+    assert ranking[0].limite_teorico == pytest.approx(1 / (1 - 0.75), abs=1e-4)
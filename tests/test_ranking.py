@@ -0,0 +1,50 @@
+"""
+Ranking top-k y filtrado: selección parcial con empates estables
+"""
+import numpy as np
+import pytest
+from src.domain.tablas import TablaComponentes, indices_ranking
+from src.infrastructure.analizador_componentes import AnalizadorComponentes
+from src.infrastructure.calculador_amdahl import CalculadorAmdahl
+
+
+ACELERACIONES = np.array([2.0, np.nan, 5.0, 5.0, 1.0, 5.0, 3.0])
+
+
+@pytest.mark.parametrize("n, minimo, esperado", [
+    (None, None, [2, 3, 5, 6, 0, 4]),   # NaN fuera; empates en el orden original
+    (2, None, [2, 3]),                  # El corte cae dentro del empate: gana el índice menor
+    (4, None, [2, 3, 5, 6]),
+    (10, None, [2, 3, 5, 6, 0, 4]),
+    (0, None, []),
+    (None, 3.0, [2, 3, 5, 6]),
+    (1, 3.0, [2]),
+    (None, 6.0, []),
+])
+def test_indices_ranking(n, minimo, esperado):
+    assert indices_ranking(ACELERACIONES, n=n, minimo=minimo).tolist() == esperado
+
+
+def test_indices_ranking_respeta_la_mascara_de_validos():
+    validos = np.array([True, True, False, True, True, True, True])
+    assert indices_ranking(ACELERACIONES, validos, n=3).tolist() == [3, 5, 6]
+
+
+def test_top_k_igual_con_lista_y_con_tabla():
+    # Componentes repetidos (empates) y uno inválido (k <= 1) en la tabla
+    nombres = [f"c{i}" for i in range(12)]
+    f = np.array([0.3, 0.5, 0.3, 0.1, 0.5, 0.9, 0.2, 0.3, 0.5, 0.4, 0.6, 0.3])
+    k = np.array([4.0, 2.0, 4.0, 8.0, 2.0, 0.5, 3.0, 4.0, 2.0, 9.0, 1.5, 4.0])
+    tabla = TablaComponentes.desde_arreglos(nombres, f, k)
+    analizador = AnalizadorComponentes(CalculadorAmdahl())
+    
+    columnar = analizador.determinar_mejor_componente(tabla)
+    # La lista de objetos no admite componentes inválidos: solo las filas válidas
+    lista = analizador.determinar_mejor_componente(
+        [tabla[i] for i in np.flatnonzero(tabla.validos)]
+    )
+    
+    for n in (1, 3, 5, 11):
+        assert columnar.top_k(n) == lista.top_k(n)
+    assert columnar.filtrar_y_rankear(aceleracion_minima=1.3) == lista.filtrar_y_rankear(1.3)
+    assert [nombre for nombre, _ in columnar.top_k(4)] == ["c9", "c1", "c4", "c8"]
@@ -0,0 +1,52 @@
+"""
+Renderizador Agg: reutilización de figuras y reporte de gráficos desde la CLI
+"""
+import io
+import subprocess
+import sys
+import pytest
+from src.presentation.cli import main
+
+pytest.importorskip("matplotlib")
+from src.infrastructure.renderizador_headless import RenderizadorHeadless  # noqa: E402
+
+
+def test_importar_el_renderizador_no_carga_matplotlib_ni_numpy():
+    codigo = (
+        "import sys, src.infrastructure.renderizador_headless; "
+        "print('matplotlib' in sys.modules, 'numpy' in sys.modules)"
+    )
+    salida = subprocess.run(
+        [sys.executable, "-c", codigo], capture_output=True, text=True, check=True
+    )
+    assert salida.stdout.split() == ["False", "False"]
+
+
+def test_renders_sucesivos_reutilizan_la_figura_y_ajustan_las_lineas():
+    renderizador = RenderizadorHeadless()
+    primero = io.BytesIO()
+    renderizador.graficar_aceleracion_vs_factor([0.25, 0.35, 0.5], [2, 4, 8], primero)
+    grafico = renderizador._graficos["aceleracion_vs_factor"]
+    figura, lineas = grafico.figura, list(grafico.lineas)
+    
+    segundo = io.BytesIO()
+    renderizador.graficar_aceleracion_vs_factor([0.1], [2, 4, 8, 16], segundo, formato="svg")
+    
+    assert grafico.figura is figura
+    assert grafico.lineas == lineas[:1]  # La curva que sigue se reutiliza; las sobrantes se quitan
+    assert list(grafico.lineas[0].get_xdata()) == [2, 4, 8, 16]
+    assert primero.getvalue().startswith(b"\x89PNG")
+    assert b"<svg" in segundo.getvalue()
+
+
+def test_cli_graficos_escribe_el_reporte(tmp_path, capsys):
+    main(["graficos", str(tmp_path / "reporte"), "--formato", "svg"])
+    
+    archivos = sorted(p.name for p in (tmp_path / "reporte").iterdir())
+    assert archivos == [
+        "aceleracion_vs_factor.svg",
+        "aceleracion_vs_porcentaje.svg",
+        "comparacion_componentes.svg",
+        "limite_teorico.svg",
+    ]
+    assert capsys.readouterr().out.count("🖼️") == 4
@@ -0,0 +1,131 @@
+"""
+Servicio HTTP: micro-lotes del agrupador y respuestas de cada ruta
+"""
+import asyncio
+import json
+from src.application.use_cases import (
+    AnalizarComponentesUseCase,
+    CalcularAceleracionUseCase,
+    CalcularTiempoOptimizadoUseCase
+)
+from src.infrastructure.analizador_componentes import AnalizadorComponentes
+from src.infrastructure.calculador_amdahl import CalculadorAmdahl
+from src.presentation.servidor_http import AgrupadorSolicitudes, ServidorAmdahl
+
+
+def test_agrupador_despacha_lotes_llenos_y_el_resto_al_vencer_la_espera():
+    lotes = []
+    
+    def duplicar(elementos):
+        lotes.append(list(elementos))
+        return [2 * e for e in elementos]
+    
+    async def escenario():
+        agrupador = AgrupadorSolicitudes(duplicar, max_lote=4, max_espera=0.01)
+        try:
+            return await asyncio.gather(*(agrupador.enviar(i) for i in range(10)))
+        finally:
+            await agrupador.cerrar()
+    
+    assert asyncio.run(escenario()) == [2 * i for i in range(10)]
+    assert lotes == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+def test_agrupador_propaga_el_error_a_todo_el_lote():
+    def fallar(elementos):
+        raise RuntimeError("lote inválido")
+    
+    async def escenario():
+        agrupador = AgrupadorSolicitudes(fallar, max_lote=2, max_espera=0)
+        try:
+            return await asyncio.gather(
+                agrupador.enviar(1), agrupador.enviar(2), return_exceptions=True
+            )
+        finally:
+            await agrupador.cerrar()
+    
+    errores = asyncio.run(escenario())
+    assert [str(e) for e in errores] == ["lote inválido", "lote inválido"]
+
+
+async def _solicitar(puerto, metodo, ruta, cuerpo=b""):
+    lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+    escritor.write(
+        f"{metodo} {ruta} HTTP/1.1\r\nContent-Length: {len(cuerpo)}\r\n"
+        f"Connection: close\r\n\r\n".encode("latin-1") + cuerpo
+    )
+    respuesta = await lector.read()
+    escritor.close()
+    encabezado, _, contenido = respuesta.partition(b"\r\n\r\n")
+    return int(encabezado.split()[1]), json.loads(contenido)
+
+
+def _json(datos):
+    return json.dumps(datos).encode()
+
+
+def test_rutas_http():
+    calculador = CalculadorAmdahl()
+    servidor = ServidorAmdahl(
+        CalcularAceleracionUseCase(calculador),
+        CalcularTiempoOptimizadoUseCase(calculador),
+        AnalizarComponentesUseCase(AnalizadorComponentes(calculador)),
+        max_espera_ms=1
+    )
+    componentes = [
+        {"nombre": "cuda", "f": 0.35, "k": 5}, {"nombre": "vram", "f": 0.2, "k": 3}
+    ]
+    
+    async def escenario():
+        tcp = await servidor.iniciar(puerto=0)
+        puerto = tcp.sockets[0].getsockname()[1]
+        try:
+            concurrentes = await asyncio.gather(*(
+                _solicitar(puerto, "POST", "/aceleracion", _json(c)) for c in componentes
+            ))
+            respuestas = {
+                "tiempo": await _solicitar(
+                    puerto, "POST", "/tiempo", _json({**componentes[0], "tiempo_original": 50})
+                ),
+                "limite_infinito": await _solicitar(
+                    puerto, "POST", "/aceleracion", _json({"f": 1, "k": 4})
+                ),
+                "no_finito": await _solicitar(puerto, "POST", "/aceleracion", b'{"f": Infinity, "k": 2}'),
+                "falta_campo": await _solicitar(puerto, "POST", "/aceleracion", _json({"f": 0.5})),
+                "json_invalido": await _solicitar(puerto, "POST", "/aceleracion", b"{"),
+                "metodo": await _solicitar(puerto, "GET", "/aceleracion"),
+                "ruta": await _solicitar(puerto, "GET", "/nada"),
+                "analisis": await _solicitar(
+                    puerto, "POST", "/analisis",
+                    _json({"componentes": componentes, "max_comparaciones": 1})
+                ),
+                "metricas": await _solicitar(puerto, "GET", "/metricas"),
+            }
+        finally:
+            tcp.close()
+            await tcp.wait_closed()
+            await servidor.cerrar()
+        return concurrentes, respuestas
+    
+    concurrentes, r = asyncio.run(escenario())
+    
+    assert [(estado, c["nombre"], c["aceleracion"]) for estado, c in concurrentes] == [
+        (200, "cuda", 1.3889), (200, "vram", 1.1538)
+    ]
+    # Como en CalcularTiempoOptimizadoUseCase.execute: 50 / 1.3889 (aceleración redondeada)
+    assert r["tiempo"] == (200, {
+        "nombre": "cuda", "f": 0.35, "k": 5, "aceleracion": 1.3889,
+        "limite_teorico": 1.5385, "tiempo_original": 50, "tiempo_optimizado": 35.9997
+    })
+    assert r["limite_infinito"][1]["limite_teorico"] is None  # inf no es JSON válido
+    assert [r[c][0] for c in ("no_finito", "falta_campo", "json_invalido")] == [400, 400, 400]
+    assert "'f' debe ser un número finito" in r["no_finito"][1]["error"]
+    assert (r["metodo"][0], r["ruta"][0]) == (405, 404)
+    
+    estado, analisis = r["analisis"]
+    assert estado == 200 and analisis["mejor_componente"] == "cuda"
+    assert [fila["nombre"] for fila in analisis["ranking"]] == ["cuda", "vram"]
+    
+    metricas = r["metricas"][1]
+    assert metricas["lotes"]["aceleracion"]["elementos"] == 3
+    assert metricas["rutas"]["/aceleracion"]["solicitudes"] == 7
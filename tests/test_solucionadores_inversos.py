@@ -0,0 +1,46 @@
+"""
+Solucionadores inversos en forma cerrada: k o f necesarios para una aceleración
+"""
+import numpy as np
+import pytest
+from src.infrastructure.calculador_amdahl import CalculadorAmdahl
+
+
+calculador = CalculadorAmdahl()
+
+
+def test_factor_necesario_invierte_calcular_lote():
+    f = np.array([0.2, 0.35, 0.5, 0.9])[:, np.newaxis]
+    objetivo = np.array([1.05, 1.1, 1.2])
+    k = calculador.calcular_factor_necesario_lote(f, objetivo, decimales=None)
+    
+    assert k.shape == (4, 3)
+    assert calculador.calcular_lote(f, k, decimales=None).aceleracion == pytest.approx(
+        np.broadcast_to(objetivo, k.shape)
+    )
+
+
+def test_factor_necesario_inalcanzable_e_invalido():
+    # Con f = 0.2 el límite es 1.25: pedir 1.25 o más no tiene solución finita
+    k = calculador.calcular_factor_necesario_lote([0.2, 0.2, 1.5, 0.2], [1.25, 2.0, 1.1, 1.0])
+    assert k[:2].tolist() == [np.inf, np.inf]
+    assert np.isnan(k[2:]).all()  # f fuera de [0, 1] y objetivo <= 1
+
+
+def test_porcentaje_necesario_invierte_calcular_lote():
+    k = np.array([2.0, 5.0, 10.0])
+    f = calculador.calcular_porcentaje_necesario_lote(k, 1.5, decimales=None)
+    
+    assert f == pytest.approx([2 / 3, 5 / 12, 10 / 27])
+    assert calculador.calcular_lote(f, k, decimales=None).aceleracion == pytest.approx(1.5)
+    # Con k = 2 el máximo es A = 2 (f = 1): más allá haría falta f > 1; k <= 1 es inválido
+    extremos = calculador.calcular_porcentaje_necesario_lote([2.0, 0.5], [3.0, 1.5])
+    assert extremos[0] == np.inf and np.isnan(extremos[1])
+
+
+def test_factor_necesario_para_tiempo():
+    # Bajar de 50 ms a 40 ms es A = 1.25
+    k = calculador.calcular_factor_necesario_para_tiempo_lote(0.35, 50.0, [40.0, 30.0])
+    assert k.tolist() == [
+        calculador.calcular_factor_necesario_lote(0.35, 1.25).item(), np.inf
+    ]